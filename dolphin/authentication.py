@@ -1,6 +1,10 @@
+import hashlib
+
+import redis
+import ujson
 from cas import CASPrincipal
 from itsdangerous import JSONWebSignatureSerializer
-from nanohttp import context, HTTPStatus, HTTPUnauthorized
+from nanohttp import context, settings, HTTPStatus, HTTPUnauthorized
 from restfulpy.authentication import StatefulAuthenticator
 from restfulpy.orm import DBSession
 
@@ -9,6 +13,7 @@ from .models import Member
 
 
 class Authenticator(StatefulAuthenticator):
+    cas_member_key = 'cas:member:%s'
 
     @staticmethod
     def safe_member_lookup(condition):
@@ -45,28 +50,65 @@ class Authenticator(StatefulAuthenticator):
         if not member:
             raise HTTPUnauthorized()
 
-        cas_member = CASClient().get_member(member.access_token)
+        Member.remember_current(member)
+        cas_member = self.get_cas_member(member.access_token)
 
         self.update_member_if_needed(member, cas_member)
         return principal
 
+    @classmethod
+    def get_cas_member_key(cls, access_token):
+        # The raw access token is never written to the shared store
+        digest = hashlib.sha256(access_token.encode()).hexdigest()
+        return cls.cas_member_key % digest
+
+    def get_cas_member(self, access_token):
+        ttl = settings.oauth.member_cache.ttl
+        if not ttl:
+            return CASClient().get_member(access_token)
+
+        key = self.get_cas_member_key(access_token)
+        try:
+            cached_member = self.redis.get(key)
+            if cached_member is not None:
+                return ujson.loads(cached_member)
+
+        except redis.RedisError:
+            # The cache is only a shortcut, CAS is still the source of truth
+            return CASClient().get_member(access_token)
+
+        cas_member = CASClient().get_member(access_token)
+        try:
+            self.redis.setex(key, ttl, ujson.dumps(cas_member))
+
+        except redis.RedisError:
+            pass
+
+        return cas_member
+
     def update_member_if_needed(self, member, cas_member):
+        is_changed = False
 
         # FIXME: If any item added to scopes, the additional scopes item must
         # be considered here
         if member.title != cas_member['title']:
             member.title = cas_member['title']
+            is_changed = True
 
         if member.avatar != cas_member['avatar']:
             member.avatar = cas_member['avatar']
+            is_changed = True
 
         if member.first_name != cas_member['firstName']:
             member.first_name = cas_member['firstName']
+            is_changed = True
 
         if member.last_name != cas_member['lastName']:
             member.last_name = cas_member['lastName']
+            is_changed = True
 
-        DBSession.commit()
+        if is_changed:
+            DBSession.commit()
 
     def get_previous_payload(self):
         if hasattr(context, 'identity') and context.identity:
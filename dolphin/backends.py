@@ -1,24 +1,293 @@
 import json
+import os
+import threading
+import time
 
 import requests
 from nanohttp import settings, HTTPForbidden, HTTPUnauthorized
+from requests.adapters import HTTPAdapter
 from restfulpy import logger
+from urllib3.util.retry import Retry
 
 from .exceptions import *
 
 
-class CASClient:
+class BackendMetrics:
+    """In-flight requests and latency of the calls to the backend servers,
+    per worker process.
+
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._servers = {}
+
+    def _get_server(self, server_name):
+        return self._servers.setdefault(server_name, dict(
+            in_flight=0,
+            requests=0,
+            failures=0,
+            total_latency=0.0,
+            max_latency=0.0,
+            rejected=0,
+            circuit='closed',
+        ))
+
+    def begin(self, server_name):
+        with self._lock:
+            self._get_server(server_name)['in_flight'] += 1
+
+    def end(self, server_name, latency, failed=False):
+        with self._lock:
+            server = self._get_server(server_name)
+            server['in_flight'] -= 1
+            server['requests'] += 1
+            server['total_latency'] += latency
+            server['max_latency'] = max(server['max_latency'], latency)
+            if failed:
+                server['failures'] += 1
+
+    def reject(self, server_name):
+        with self._lock:
+            self._get_server(server_name)['rejected'] += 1
+
+    def set_circuit(self, server_name, state):
+        with self._lock:
+            self._get_server(server_name)['circuit'] = state
+
+    def to_dict(self):
+        with self._lock:
+            result = {}
+            for server_name, server in self._servers.items():
+                result[server_name] = server = dict(server)
+                server['average_latency'] = \
+                    server['total_latency'] / server['requests'] \
+                    if server['requests'] else 0.0
+
+            return result
+
+
+metrics = BackendMetrics()
+
+
+class CircuitBreaker:
+    """Stops calling a backend server which keeps failing, per worker
+    process.
+
+    The circuit opens after ``failure_threshold`` consecutive failures, and
+    the calls are rejected for ``reset_timeout`` seconds. Then it is half
+    open: one call at a time is let through as a probe, a succeeded probe
+    closes the circuit and a failed one opens it again.
+
+    """
+
+    def __init__(self, server_name, failure_threshold, reset_timeout):
+        self.server_name = server_name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    @property
+    def state(self):
+        if self._opened_at is None:
+            return 'closed'
+
+        if time.monotonic() - self._opened_at < self.reset_timeout:
+            return 'open'
+
+        return 'half-open'
+
+    def allow(self):
+        with self._lock:
+            state = self.state
+            if state == 'closed':
+                return True
+
+            if state == 'open' or self._probing:
+                return False
+
+            self._probing = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._probing = False
+            if self._opened_at is not None:
+                self._opened_at = None
+                logger.info(f'Circuit of {self.server_name} is closed')
+                metrics.set_circuit(self.server_name, 'closed')
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            probing, self._probing = self._probing, False
+            if probing or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+                logger.warning(f'Circuit of {self.server_name} is open')
+                metrics.set_circuit(self.server_name, 'open')
+
+
+class BackendClient:
+    """Base of the backend clients, sharing a keep-alive connection pool
+    per worker process and per backend.
+
+    The timeouts, the retry budget and the pool size are read from the
+    ``http`` section of the settings block named by ``__settings_key__``.
+    The read timeout of an endpoint is its latency budget when
+    ``http.latency_budgets`` has one.
+
+    The calls are guarded by a ``CircuitBreaker`` per backend when the
+    ``http.circuit_breaker`` section exists, the rejected calls raise
+    ``__unavailable_status__``.
+
+    """
+
+    __settings_key__ = None
+    __unavailable_status__ = None
+
+    _sessions = {}
+    _circuit_breakers = {}
+    _sessions_pid = None
+    _sessions_lock = threading.Lock()
 
     def __init__(self):
         self._server_name = self.__class__.__name__.replace('Client', '')
 
+    @property
+    def http_settings(self):
+        return getattr(settings, self.__settings_key__).http
+
+    @classmethod
+    def _ensure_process(cls):
+        # Connections and circuits must not be shared with the forked
+        # workers
+        if BackendClient._sessions_pid != os.getpid():
+            BackendClient._sessions = {}
+            BackendClient._circuit_breakers = {}
+            BackendClient._sessions_pid = os.getpid()
+
+    @property
+    def session(self):
+        with self._sessions_lock:
+            self._ensure_process()
+            session = self._sessions.get(self._server_name)
+            if session is None:
+                session = self._sessions[self._server_name] = \
+                    self.create_session()
+
+            return session
+
+    @property
+    def circuit_breaker(self):
+        circuit_breaker_settings = self.http_settings.get('circuit_breaker')
+        if circuit_breaker_settings is None:
+            return None
+
+        with self._sessions_lock:
+            self._ensure_process()
+            circuit_breaker = self._circuit_breakers.get(self._server_name)
+            if circuit_breaker is None:
+                circuit_breaker = \
+                    self._circuit_breakers[self._server_name] = \
+                    CircuitBreaker(
+                        self._server_name,
+                        circuit_breaker_settings.failure_threshold,
+                        circuit_breaker_settings.reset_timeout,
+                    )
+
+            return circuit_breaker
+
+    @classmethod
+    def reset_circuit_breakers(cls):
+        with cls._sessions_lock:
+            BackendClient._circuit_breakers = {}
+
+    def create_session(self):
+        http_settings = self.http_settings
+
+        # Only the failures before sending the request are retried, because
+        # the verbs of the backends are not idempotent.
+        retry = Retry(
+            total=http_settings.retries,
+            connect=http_settings.retries,
+            read=0,
+            status=0,
+            redirect=0,
+            backoff_factor=http_settings.backoff_factor,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=http_settings.pool_size,
+            max_retries=retry,
+        )
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def request(self, method, url, endpoint=None, **kwargs):
+        http_settings = self.http_settings
+        latency_budgets = http_settings.get('latency_budgets') or {}
+        kwargs.setdefault(
+            'timeout',
+            (
+                http_settings.connect_timeout,
+                latency_budgets.get(endpoint, http_settings.read_timeout)
+            )
+        )
+
+        circuit_breaker = self.circuit_breaker
+        if circuit_breaker is not None and not circuit_breaker.allow():
+            metrics.reject(self._server_name)
+            raise self.__unavailable_status__()
+
+        metrics.begin(self._server_name)
+        started_at = time.monotonic()
+        failed = True
+        try:
+            response = self.session.request(method, url, **kwargs)
+            # The 6xx answers of the chat and CAS servers are expected ones,
+            # e.g. the member is already added
+            failed = 500 <= response.status_code < 600
+            return response
+
+        finally:
+            metrics.end(
+                self._server_name,
+                time.monotonic() - started_at,
+                failed=failed
+            )
+            if circuit_breaker is not None:
+                if failed:
+                    circuit_breaker.record_failure()
+
+                else:
+                    circuit_breaker.record_success()
+
+
+class CASClient(BackendClient):
+    __settings_key__ = 'oauth'
+    __unavailable_status__ = StatusCASServerNotAvailable
+
+    def request(self, method, url, **kwargs):
+        try:
+            return super().request(method, url, **kwargs)
+
+        except requests.RequestException as e:
+            logger.error(e)
+            raise StatusCASServerNotAvailable()
+
     def get_access_token(self, authorization_code):
 
         if authorization_code is None:
             raise HTTPForbidden()
 
         url = f'{settings.oauth.url}/apiv1/accesstokens'
-        response = requests.request(
+        response = self.request(
             'CREATE',
             url,
             data=dict(
@@ -60,7 +329,8 @@ class CASClient:
     def get_member(self, access_token):
 
         url = f'{settings.oauth.url}/apiv1/members/me'
-        response = requests.get(
+        response = self.request(
+            'GET',
             url,
             headers={'authorization': f'oauth2-accesstoken {access_token}'}
         )
@@ -75,16 +345,17 @@ class CASClient:
         return json.loads(response.text)
 
 
-class ChatClient:
-    def __init__(self):
-        self._server_name = self.__class__.__name__.replace('Client', '')
+class ChatClient(BackendClient):
+    __settings_key__ = 'chat'
+    __unavailable_status__ = StatusChatServerNotAvailable
 
     def create_room(self, title, token, x_access_token, owner_id=None):
         url = f'{settings.chat.url}/apiv1/rooms'
         try:
-            response = requests.request(
+            response = self.request(
                 'CREATE',
                 url,
+                endpoint='create_room',
                 data={'title': title},
                 headers={
                     'authorization': token,
@@ -104,9 +375,10 @@ class ChatClient:
                 raise StatusChatServerNotAvailable()
 
             if response.status_code == 615:
-                response = requests.request(
+                response = self.request(
                     'LIST',
                     url,
+                    endpoint='create_room',
                     headers={
                         'authorization': token,
                         'X-Oauth2-Access-Token': x_access_token
@@ -145,7 +417,7 @@ class ChatClient:
 #
 #        url = f'{settings.chat.url}/apiv1/rooms/{id}'
 #        logger.debug(f'DELETE {url}')
-#        response = requests.request(
+#        response = self.request(
 #            'DELETE',
 #            url,
 #            headers={
@@ -159,9 +431,10 @@ class ChatClient:
 
         url = f'{settings.chat.url}/apiv1/rooms/{id}'
         try:
-            response = requests.request(
+            response = self.request(
                 'ADD',
                 url,
+                endpoint='add_member',
                 data={'userId': user_id},
                 headers={
                     'authorization': token,
@@ -187,6 +460,11 @@ class ChatClient:
             if response.status_code == 604:
                 raise StatusRoomMemberAlreadyExist()
 
+            # The rest of the 4xx answers are definitive
+            if 400 <= response.status_code < 500:
+                logger.error(response.content.decode())
+                raise StatusChatRequestRejected(response.status_code)
+
             if response.status_code != 200:
                 logger.error(response.content.decode())
                 raise StatusChatInternallError()
@@ -203,9 +481,10 @@ class ChatClient:
 
         url = f'{settings.chat.url}/apiv1/rooms/{id}'
         try:
-            response = requests.request(
+            response = self.request(
                 'KICK',
                 url,
+                endpoint='kick_member',
                 data={'memberId': member_id},
                 headers={
                     'authorization': token,
@@ -236,6 +515,11 @@ class ChatClient:
             if response.status_code == 604:
                 raise StatusRoomMemberAlreadyExist()
 
+            # The rest of the 4xx answers are definitive
+            if 400 <= response.status_code < 500:
+                logger.error(response.content.decode())
+                raise StatusChatRequestRejected(response.status_code)
+
             if response.status_code != 200:
                 logger.error(response.content.decode())
                 raise StatusChatInternallError()
@@ -251,9 +535,10 @@ class ChatClient:
     def ensure_member(self, token, x_access_token):
         url = f'{settings.chat.url}/apiv1/members'
         try:
-            response = requests.request(
+            response = self.request(
                 'ENSURE',
                 url,
+                endpoint='ensure_member',
                 headers={
                     'authorization': token,
                     'X-Oauth2-Access-Token': x_access_token
@@ -272,6 +557,11 @@ class ChatClient:
             if response.status_code in (502, 503):
                 raise StatusChatServerNotAvailable()
 
+            # The rest of the 4xx answers are definitive
+            if 400 <= response.status_code < 500:
+                logger.error(response.content.decode())
+                raise StatusChatRequestRejected(response.status_code)
+
             if response.status_code != 200:
                 logger.error(response.content.decode())
                 raise StatusChatInternallError()
@@ -289,9 +579,10 @@ class ChatClient:
         url = f'{settings.chat.url}/apiv1/targets/{room_id}/messages'
         data = dict(body=body, mimetype=mimetype)
         try:
-            response = requests.request(
+            response = self.request(
                 'SEND',
                 url,
+                endpoint='send_message',
                 json=data,
                 headers={
                     'authorization': token,
@@ -312,6 +603,11 @@ class ChatClient:
             if response.status_code in (502, 503):
                 raise StatusChatServerNotAvailable()
 
+            # The rest of the 4xx answers are definitive
+            if 400 <= response.status_code < 500:
+                logger.error(response.content.decode())
+                raise StatusChatRequestRejected(response.status_code)
+
             if response.status_code != 200:
                 logger.error(response.content.decode())
                 raise StatusChatInternallError()
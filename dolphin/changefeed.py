@@ -0,0 +1,112 @@
+import select
+import threading
+import time
+
+from nanohttp import settings
+from restfulpy import logger
+
+
+class ChangeBus:
+    """Wakes the long polling requests of this process up whenever a change
+    is committed.
+
+    The commits of this process publish directly, the commits of the other
+    processes are received through Postgres ``LISTEN/NOTIFY`` by a
+    :class:`PostgresListener` thread, which is started by the first waiter.
+    The waiters are not handed the changes themselves, they read them from
+    the ``change`` table, so a change is never lost between two polls.
+
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._generation = 0
+        self._listener = None
+        self._listener_lock = threading.Lock()
+
+    @property
+    def generation(self):
+        return self._generation
+
+    def publish(self):
+        with self._condition:
+            self._generation += 1
+            self._condition.notify_all()
+
+    def wait(self, generation, timeout):
+        """Blocks until something is published after the ``generation``,
+        or the ``timeout`` in seconds elapses.
+
+        :return: Whether something has been published.
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self._generation != generation,
+                timeout
+            )
+
+    def ensure_listening(self, engine):
+        if not settings.changefeed.listen:
+            return
+
+        with self._listener_lock:
+            if self._listener is None or not self._listener.is_alive():
+                self._listener = PostgresListener(
+                    self,
+                    engine,
+                    settings.changefeed.channel
+                )
+                self._listener.start()
+
+
+class PostgresListener(threading.Thread):
+    """Listens to the change feed channel on a connection of its own and
+    publishes every notification to the bus.
+
+    """
+
+    def __init__(self, bus, engine, channel):
+        super().__init__(name='changefeed-listener', daemon=True)
+        self.bus = bus
+        self.engine = engine
+        self.channel = channel
+
+    def run(self):
+        while True:
+            try:
+                self.listen()
+
+            except Exception as ex:
+                logger.error(f'The change feed listener has failed: {ex}')
+
+            time.sleep(settings.changefeed.reconnect_delay)
+
+    def listen(self):
+        # The connection is taken out of the pool, it is kept open as long
+        # as the thread is listening.
+        connection = self.engine.raw_connection()
+        connection.detach()
+        connection = connection.connection
+        try:
+            connection.autocommit = True
+            with connection.cursor() as cursor:
+                cursor.execute(f'LISTEN {self.channel}')
+
+            # Everything committed while the listener was down is picked up
+            # by the waiters.
+            self.bus.publish()
+            while True:
+                readable, _, _ = select.select([connection], [], [], 5)
+                if not readable:
+                    continue
+
+                connection.poll()
+                if connection.notifies:
+                    connection.notifies.clear()
+                    self.bus.publish()
+
+        finally:
+            connection.close()
+
+
+change_bus = ChangeBus()
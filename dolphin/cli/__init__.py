@@ -1,3 +1,6 @@
 from .email import EmailSubCommand
 from .dailyreport_resolver import FixWeekendSubCommand, FixEventSubCommand
-
+from .dataset import DatasetSubCommand
+from .issue import IssueSubCommand
+from .chat import ChatSubCommand
+from .changefeed import ChangefeedSubCommand
@@ -0,0 +1,39 @@
+from datetime import datetime, timedelta
+
+from easycli import SubCommand, Argument
+from nanohttp import settings
+from restfulpy.orm import DBSession
+
+from ..models import Change
+
+
+class PurgeChangefeedSubSubCommand(SubCommand):  # pragma: no cover
+    __help__ = 'Removes the old changes of the change feed.'
+    __command__ = 'purge'
+    __arguments__ = [
+        Argument(
+            '-d',
+            '--days',
+            type=int,
+            default=None,
+            help='Removes the changes older than this, default: '
+                 'changefeed.retention of the settings',
+        ),
+    ]
+
+    def __call__(self, args):
+        days = args.days
+        if days is None:
+            days = settings.changefeed.retention
+
+        count = Change.purge(datetime.now() - timedelta(days=days))
+        DBSession.commit()
+        print(f'{count} changes older than {days} days are removed')
+
+
+class ChangefeedSubCommand(SubCommand):  # pragma: no cover
+    __help__ = 'Manage the change feed.'
+    __command__ = 'changefeed'
+    __arguments__ = [
+        PurgeChangefeedSubSubCommand,
+    ]
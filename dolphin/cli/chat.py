@@ -0,0 +1,31 @@
+from easycli import SubCommand
+from nanohttp import settings
+from restfulpy.orm import DBSession
+
+from ..models import ChatReconciliationJob
+
+
+class ReconcileChatSubSubCommand(SubCommand):  # pragma: no cover
+    __help__ = 'Schedules the periodic reconciliation of the chat rooms.'
+    __command__ = 'reconcile'
+    __arguments__ = []
+
+    def __call__(self, args):
+        job = ChatReconciliationJob.schedule(DBSession)
+        DBSession.commit()
+        if job is None:
+            print('The reconciliation is already scheduled')
+            return
+
+        print(
+            f'The reconciliation is scheduled, it is done by the mule '
+            f'workers every {settings.chat_reconciliation.interval} seconds'
+        )
+
+
+class ChatSubCommand(SubCommand):  # pragma: no cover
+    __help__ = 'Manage the chat rooms.'
+    __command__ = 'chat'
+    __arguments__ = [
+        ReconcileChatSubSubCommand,
+    ]
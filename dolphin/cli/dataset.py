@@ -0,0 +1,92 @@
+from datetime import datetime
+
+from easycli import SubCommand, Argument
+
+from ..dataset import DatasetGenerator
+
+
+class GenerateDatasetSubSubCommand(SubCommand):  # pragma: no cover
+    __help__ = 'Generates a synthetic dataset.'
+    __command__ = 'generate'
+    __arguments__ = [
+        Argument(
+            '-o',
+            '--organizations',
+            type=int,
+            default=1,
+            help='Number of organizations, default: 1',
+        ),
+        Argument(
+            '-m',
+            '--members',
+            type=int,
+            default=10,
+            help='Number of resources per organization, default: 10',
+        ),
+        Argument(
+            '-p',
+            '--projects',
+            type=int,
+            default=5,
+            help='Number of projects per organization, default: 5',
+        ),
+        Argument(
+            '-i',
+            '--issues',
+            type=int,
+            default=20,
+            help='Number of issues per project, default: 20',
+        ),
+        Argument(
+            '-t',
+            '--items',
+            type=int,
+            default=2,
+            help='Maximum number of items per issue phase, default: 2',
+        ),
+        Argument(
+            '-d',
+            '--dailyreports',
+            type=int,
+            default=5,
+            help='Maximum number of dailyreports per item, default: 5',
+        ),
+        Argument(
+            '-s',
+            '--seed',
+            type=int,
+            default=0,
+            help='Random seed, each seed can be generated once, default: 0',
+        ),
+        Argument(
+            '--today',
+            type=lambda value: datetime.strptime(value, '%Y-%m-%d'),
+            default=None,
+            help='The date which the dates are relative to, YYYY-MM-DD, '
+                'default: the current date',
+        ),
+    ]
+
+    def __call__(self, args):
+        generator = DatasetGenerator(
+            organizations=args.organizations,
+            members=args.members,
+            projects=args.projects,
+            issues=args.issues,
+            items=args.items,
+            dailyreports=args.dailyreports,
+            seed=args.seed,
+            today=args.today,
+        )
+        admin = generator.generate()
+        print('Following admin has been added:')
+        print(admin)
+
+
+class DatasetSubCommand(SubCommand):  # pragma: no cover
+    __help__ = 'Manage synthetic datasets.'
+    __command__ = 'dataset'
+    __arguments__ = [
+        GenerateDatasetSubSubCommand,
+    ]
+
@@ -0,0 +1,82 @@
+import sys
+from os.path import splitext
+
+from easycli import SubCommand, Argument
+from restfulpy.orm import DBSession
+
+from ..importer import IssueImporter
+from ..models import Member
+
+
+class ImportIssueSubSubCommand(SubCommand):  # pragma: no cover
+    __help__ = 'Imports issues from a NDJSON or CSV file.'
+    __command__ = 'import'
+    __arguments__ = [
+        Argument(
+            'filename',
+            help='The file to import, "-" reads the standard input',
+        ),
+        Argument(
+            '-f',
+            '--format',
+            choices=['ndjson', 'csv'],
+            default=None,
+            help='Default: csv if the file name ends with .csv, otherwise '
+                 'ndjson',
+        ),
+        Argument(
+            '-m',
+            '--member',
+            type=int,
+            required=True,
+            help='Reference id of the member who creates the issues',
+        ),
+        Argument(
+            '-b',
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Issues per transaction, default: 500',
+        ),
+    ]
+
+    def __call__(self, args):
+        member = DBSession.query(Member) \
+            .filter(Member.reference_id == args.member) \
+            .one_or_none()
+        if member is None:
+            print(f'Member not found: {args.member}', file=sys.stderr)
+            return 1
+
+        format_ = args.format
+        if format_ is None:
+            format_ = 'csv' if splitext(args.filename)[1].lower() == '.csv' \
+                else 'ndjson'
+
+        importer = IssueImporter(member, batch_size=args.batch_size)
+        read = importer.read_csv if format_ == 'csv' \
+            else importer.read_ndjson
+
+        if args.filename == '-':
+            issue_ids = importer.import_(read(sys.stdin))
+
+        else:
+            with open(args.filename, newline='') as file:
+                issue_ids = importer.import_(read(file))
+
+        for line_number, message in importer.errors:
+            print(f'Line {line_number}: {message}', file=sys.stderr)
+
+        print(
+            f'{len(issue_ids)} issues have been imported, their chat rooms '
+            f'are being created by the mule workers'
+        )
+        return 1 if importer.errors else 0
+
+
+class IssueSubCommand(SubCommand):  # pragma: no cover
+    __help__ = 'Manage issues.'
+    __command__ = 'issue'
+    __arguments__ = [
+        ImportIssueSubSubCommand,
+    ]
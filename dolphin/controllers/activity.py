@@ -3,10 +3,10 @@ from datetime import datetime
 from nanohttp import context, int_or_notfound, json
 from nanohttp.exceptions import HTTPForbidden, HTTPNotFound, HTTPStatus
 from restfulpy.authorization import authorize
-from restfulpy.controllers import ModelRestController
 from restfulpy.orm import DBSession, commit
 
 from ..models import Activity, Member, Item, IssuePhase
+from .metadata import ModelRestController
 
 
 class ActivityController(ModelRestController):
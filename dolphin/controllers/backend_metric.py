@@ -0,0 +1,17 @@
+from nanohttp import json
+from restfulpy.authorization import authorize
+from restfulpy.controllers import RestController
+
+from ..backends import metrics
+
+
+class BackendMetricController(RestController):
+    """The in-flight requests, latency, failures and circuit state of the
+    calls to the backend servers, by the worker process which answers.
+
+    """
+
+    @authorize
+    @json(prevent_form='709 Form Not Allowed')
+    def get(self):
+        return metrics.to_dict()
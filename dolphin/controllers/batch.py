@@ -1,10 +1,11 @@
-from nanohttp import json
 from restfulpy.controllers import RestController
 
+from .metadata import cached_metadata
+
 
 class BatchController(RestController):
 
-    @json
+    @cached_metadata
     def metadata(self):
         metadata = dict(
             name='Batch',
@@ -0,0 +1,74 @@
+import time
+
+from nanohttp import json, context, settings, validate
+from restfulpy.authorization import authorize
+from restfulpy.controllers import RestController
+from restfulpy.orm import DBSession
+
+from .. import cooperative
+from ..changefeed import change_bus
+from ..models import Change
+
+
+class ChangeController(RestController):
+    """Long polls the changes of the issues, items and subscriptions which
+    the current member is subscribed to.
+
+    The ``after`` query string field is the id of the last received change,
+    the changes after it are returned as soon as there is any, or an empty
+    list after ``timeout`` seconds. The id to poll after next is in the
+    ``X-Change-Cursor`` header, when ``after`` is not given it's the id of
+    the last change, so only the next changes are returned. A change is
+    returned after the transactions which are started before it are ended,
+    so the cursor never passes a change which is not committed yet.
+
+    A waiting request holds its worker, so it waits only in the cooperative
+    workers of ``./gunicorn-gevent``. The other workers answer at once, and
+    the clients poll again.
+
+    """
+
+    @authorize
+    @json(prevent_form='709 Form Not Allowed')
+    @validate(
+        after=dict(
+            type_=int,
+        ),
+        timeout=dict(
+            type_=int,
+        ),
+    )
+    def list(self):
+        after = context.query.get('after')
+        if after is None:
+            after = Change.get_last_id()
+
+        timeout = min(
+            context.query.get('timeout', settings.changefeed.timeout),
+            settings.changefeed.max_timeout
+        ) if cooperative.is_cooperative() else 0
+        member_id = context.identity.id
+        deadline = time.monotonic() + timeout
+
+        generation = change_bus.generation
+        changes = self._get_changes(member_id, after)
+        while not changes and time.monotonic() < deadline:
+            # The transaction is ended, so no connection is held while
+            # waiting.
+            DBSession.rollback()
+            change_bus.ensure_listening(DBSession.get_bind())
+            if not change_bus.wait(generation, deadline - time.monotonic()):
+                break
+
+            generation = change_bus.generation
+            changes = self._get_changes(member_id, after)
+
+        cursor = changes[-1].id if changes else after
+        context.response_headers.add_header('X-Change-Cursor', str(cursor))
+        return [c.to_dict() for c in changes]
+
+    @staticmethod
+    def _get_changes(member_id, after):
+        return Change.create_member_query(member_id, after) \
+            .limit(settings.changefeed.take) \
+            .all()
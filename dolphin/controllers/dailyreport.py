@@ -1,6 +1,5 @@
-from restfulpy.controllers import ModelRestController
-
 from ..models import Dailyreport
+from .metadata import ModelRestController
 
 
 # The only reason to keep this class is to serve the METADATA verb.
@@ -1,17 +1,16 @@
 from nanohttp import json, context, HTTPNotFound, HTTPUnauthorized, \
     int_or_notfound, HTTPStatus
 from restfulpy.authorization import authorize
-from restfulpy.controllers import ModelRestController, JSONPatchControllerMixin
+from restfulpy.controllers import JSONPatchControllerMixin
 from restfulpy.orm import commit, DBSession
 from sqlalchemy import and_, exists
 
-from ..backends import ChatClient
-from ..exceptions import StatusRoomMemberAlreadyExist, \
-    StatusChatRoomNotFound, StatusIssueBugMustHaveRelatedIssue
+from ..exceptions import StatusIssueBugMustHaveRelatedIssue
 from ..models import Issue, Member, DraftIssue, DraftIssueTag, Tag, IssueTag, \
-    RelatedIssue, DraftIssueIssue
+    RelatedIssue, DraftIssueIssue, RoomProvisioningJob
 from ..validators import draft_issue_finalize_validator, \
     draft_issue_define_validator, draft_issue_relate_validator
+from .metadata import ModelRestController
 from .tag import TagController
 
 
@@ -35,24 +34,6 @@ FROM_WHITELISTS_STRING = ', '.join(FORM_WHITELIST)
 class DraftIssueController(ModelRestController, JSONPatchControllerMixin):
     __model__ = DraftIssue
 
-    def _ensure_room(self, title, token, access_token):
-        create_room_error = 1
-        room = None
-        while create_room_error is not None:
-            try:
-                room = ChatClient().create_room(
-                    title,
-                    token,
-                    access_token,
-                    context.identity.reference_id
-                )
-                create_room_error = None
-
-            except StatusChatRoomNotFound:
-                create_room_error = 1
-
-        return room
-
     def __call__(self, *remaining_paths):
         if len(remaining_paths) > 1:
 
@@ -103,7 +84,6 @@ class DraftIssueController(ModelRestController, JSONPatchControllerMixin):
             raise HTTPNotFound()
 
         form = context.form
-        token = context.environ['HTTP_AUTHORIZATION']
 
         issue = Issue()
         issue.update_from_request()
@@ -111,48 +91,18 @@ class DraftIssueController(ModelRestController, JSONPatchControllerMixin):
         if issue.kind == 'bug' and not draft_issue.related_issues:
             raise StatusIssueBugMustHaveRelatedIssue()
 
-        current_member = Member.current()
-        room = self._ensure_room(
-            issue.get_room_title(),
-            token,
-            current_member.access_token
-        )
-
-        chat_client = ChatClient()
-        issue.room_id = room['id']
-        try:
-            chat_client.add_member(
-                issue.room_id,
-                current_member.reference_id,
-                token,
-                current_member.access_token
-            )
-
-        except StatusRoomMemberAlreadyExist:
-            # Exception is passed because it means `add_member()` is already
-            # called and `member` successfully added to room. So there is
-            # no need to call `add_member()` API again and re-add the member to
-            # room.
-            pass
-
-        # The exception type is not specified because after consulting with
-        # Mr.Mardani, the result got: there must be no specification on
-        # exception type because nobody knows what exception may be raised
-        try:
-            issue.room_id = room['id']
-
-        except:
-            chat_client.delete_room(
-                issue.room_id,
-                token,
-                current_member.access_token
-            )
-            raise
-
         DBSession.add(issue)
         DBSession.flush()
         draft_issue.issue_id = issue.id
 
+        # The room is created and bound by `RoomProvisioningJob`, so the
+        # response is not held by the chat server
+        RoomProvisioningJob.enqueue(
+            DBSession,
+            Member.current().id,
+            [issue.id]
+        )
+
         if draft_issue.tags:
             tags = DBSession.query(Tag) \
                 .join(DraftIssueTag, DraftIssueTag.tag_id == Tag.id) \
@@ -1,6 +1,5 @@
 from nanohttp import json, HTTPNotFound, int_or_notfound, context
 from restfulpy.authorization import authorize
-from restfulpy.controllers import ModelRestController
 from restfulpy.orm import DBSession, commit
 from sqlalchemy import exists
 
@@ -8,6 +7,7 @@ from ..exceptions import StatusEndDateMustBeGreaterThanStartDate, \
     StatusRepetitiveTitle
 from ..models import Event
 from ..validators import event_add_validator, event_update_validator
+from .metadata import ModelRestController
 
 
 FORM_WHITELIST = [
@@ -1,11 +1,11 @@
 from nanohttp import json, context, int_or_notfound, HTTPNotFound
 from restfulpy.authorization import authorize
-from restfulpy.controllers import ModelRestController
 from restfulpy.orm import DBSession, commit
 
 from ..exceptions import StatusRepetitiveTitle
 from ..models import EventType
 from ..validators import eventtype_create_validator, eventtype_update_validator
+from .metadata import ModelRestController
 
 
 FORM_WHITELIST = [
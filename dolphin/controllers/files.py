@@ -1,11 +1,11 @@
 from nanohttp import json, HTTPNotFound, context, HTTPStatus, int_or_notfound
 from restfulpy.authorization import authorize
-from restfulpy.controllers import ModelRestController
 from restfulpy.orm import DBSession, commit
 from sqlalchemy_media import store_manager
 
 from ..models import Attachment, Member
 from ..validators import attachment_validator
+from .metadata import ModelRestController
 
 
 class FileController(ModelRestController):
@@ -26,9 +26,7 @@ class FileController(ModelRestController):
         if not (self.project or self.issue):
             raise HTTPNotFound()
 
-        current_member = DBSession.query(Member) \
-            .filter(Member.reference_id == context.identity.reference_id) \
-            .one()
+        current_member = Member.current()
         attachment = Attachment(
             file=form['attachment'],
             caption=form['caption'] if 'caption' in form else None,
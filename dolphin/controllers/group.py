@@ -1,6 +1,5 @@
 from nanohttp import json, context, HTTPNotFound, int_or_notfound
 from restfulpy.authorization import authorize
-from restfulpy.controllers import ModelRestController
 from restfulpy.orm import DBSession, commit
 
 from ..models import Group, GroupMember, Member
@@ -8,6 +7,7 @@ from ..validators import group_create_validator, group_add_validator, \
     group_remove_validator, group_update_validator
 from ..exceptions import StatusMemberNotFound, StatusAlreadyAddedToGroup, \
     StatusMemberNotExistsInGroup, StatusRepetitiveTitle
+from .metadata import ModelRestController
 
 
 FORM_WHITELIST = [
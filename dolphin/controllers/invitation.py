@@ -2,7 +2,7 @@ from datetime import datetime, timedelta
 
 from nanohttp import context, json, HTTPForbidden, settings
 from restfulpy.authorization import authorize
-from restfulpy.controllers import ModelRestController, JSONPatchControllerMixin
+from restfulpy.controllers import JSONPatchControllerMixin
 from restfulpy.orm import commit, DBSession
 from sqlalchemy import exists, and_
 from sqlalchemy_media import store_manager
@@ -12,6 +12,7 @@ from ..models import Member, Organization, OrganizationMember, \
     OrganizationInvitationEmail, Invitation
 from ..tokens import OrganizationInvitationToken
 from ..validators import organization_invite_validator
+from .metadata import ModelRestController
 
 
 class InvitationController(ModelRestController, JSONPatchControllerMixin):
@@ -5,23 +5,25 @@ from auditor import context as AuditLogContext
 from nanohttp import HTTPStatus, context, json, HTTPNotFound, \
     HTTPUnauthorized, int_or_notfound, validate, HTTPNoContent, action
 from restfulpy.authorization import authorize
-from restfulpy.controllers import ModelRestController, JSONPatchControllerMixin
+from restfulpy.controllers import JSONPatchControllerMixin
 from restfulpy.orm import DBSession, commit
-from sqlalchemy import and_, exists, func, join, or_, Text, cast
+from sqlalchemy import and_, exists, func, join
 
-from ..backends import ChatClient
-from ..exceptions import StatusRoomMemberAlreadyExist, \
-    StatusRoomMemberNotFound, StatusRelatedIssueNotFound, \
-    StatusIssueBugMustHaveRelatedIssue, StatusIssueNotFound, \
+from ..exceptions import StatusRoomMemberNotFound, \
+    StatusRelatedIssueNotFound, StatusIssueBugMustHaveRelatedIssue, \
+    StatusIssueNotFound, \
     StatusQueryParameterNotInFormOrQueryString
 from ..models import Issue, Subscription, Phase, Item, Member, Project, \
     RelatedIssue, IssueTag, Tag, AbstractResourceSummaryView, \
-    AbstractPhaseSummaryView, IssuePhase, ReturnToTriageJob
+    AbstractPhaseSummaryView, IssuePhase, ReturnToTriageJob, \
+    ChatMembershipJob
+from ..search import get_search_engine
 from ..validators import update_issue_validator, assign_issue_validator, \
     issue_move_validator, unassign_issue_validator, issue_relate_validator, \
     issue_unrelate_validator, search_issue_validator
 from .activity import ActivityController
 from .files import FileController
+from .metadata import ModelRestController
 from .tag import TagController
 
 
@@ -125,17 +127,11 @@ class IssueController(ModelRestController, JSONPatchControllerMixin):
                     )
 
         issue.update_from_request()
-
-        subscriptions = DBSession.query(Subscription) \
-            .filter(
-                and_(
-                    Subscription.member_id != context.identity.id,
-                    Subscription.subscribable_id == issue.id,
-                    Subscription.one_shot.is_(None),
-                )
-            )
-
-        self._unsee_subscriptions(subscriptions)
+        Subscription.unsee(
+            Subscription.member_id != context.identity.id,
+            Subscription.subscribable_id == issue.id,
+            Subscription.one_shot.is_(None),
+        )
         return issue
 
     @authorize
@@ -285,9 +281,7 @@ class IssueController(ModelRestController, JSONPatchControllerMixin):
     @Issue.expose
     @commit
     def subscribe(self, id=None):
-        token = context.environ['HTTP_AUTHORIZATION']
         member = Member.current()
-        chat_client = ChatClient()
 
         id = int_or_notfound(id)
         issue = DBSession.query(Issue).filter(Issue.id == id).one_or_none()
@@ -315,21 +309,8 @@ class IssueController(ModelRestController, JSONPatchControllerMixin):
             DBSession.add(subscription)
             DBSession.flush()
 
-        try:
-            chat_client.add_member(
-                issue.room_id,
-                context.identity.reference_id,
-                token,
-                member.access_token
-            )
-
-        except StatusRoomMemberAlreadyExist:
-            # Exception is passed because it means `add_member()` is already
-            # called and `member` successfully added to room. So there is
-            # no need to call `add_member()` API again and re-add the member to
-            # room.
-            pass
-
+        # The chat membership does not hold the response
+        ChatMembershipJob.enqueue(DBSession, member.id, issue.id)
         return issue
 
     @authorize
@@ -337,7 +318,6 @@ class IssueController(ModelRestController, JSONPatchControllerMixin):
     @Issue.expose
     @commit
     def unsubscribe(self, id):
-        token = context.environ['HTTP_AUTHORIZATION']
         id = int_or_notfound(id)
 
         issue = DBSession.query(Issue).filter(Issue.id == id).one_or_none()
@@ -357,21 +337,7 @@ class IssueController(ModelRestController, JSONPatchControllerMixin):
         DBSession.delete(subscription)
         DBSession.flush()
 
-        chat_client = ChatClient()
-        try:
-            chat_client.kick_member(
-                issue.room_id,
-                context.identity.reference_id,
-                token,
-                member.access_token
-            )
-        except StatusRoomMemberNotFound:
-            # Exception is passed because it means `kick_member()` is already
-            # called and `member` successfully removed from room. So there is
-            # no need to call `kick_member()` API again and re-add the member
-            # to room.
-            pass
-
+        ChatMembershipJob.enqueue(DBSession, member.id, issue.id)
         return issue
 
     @authorize
@@ -580,6 +546,10 @@ class IssueController(ModelRestController, JSONPatchControllerMixin):
     @Issue.expose
     def get(self, id):
         id = int_or_notfound(id)
+        Issue.validate_conditional_request(
+            DBSession.query(Issue).filter(Issue.id == id),
+            collection=False
+        )
 
         issue = DBSession.query(Issue).filter(Issue.id == id).one_or_none()
         if not issue:
@@ -620,14 +590,10 @@ class IssueController(ModelRestController, JSONPatchControllerMixin):
         if issue is None:
             raise HTTPNotFound()
 
-        subscriptions = DBSession.query(Subscription) \
-            .filter(and_(
-                Subscription.member_id == context.identity.id,
-                Subscription.subscribable_id == issue.id,
-            ))
-
-        for subscription in subscriptions:
-            subscription.seen_at = datetime.utcnow()
+        Subscription.see(
+            Subscription.member_id == context.identity.id,
+            Subscription.subscribable_id == issue.id,
+        )
         return issue
 
     @authorize
@@ -640,13 +606,10 @@ class IssueController(ModelRestController, JSONPatchControllerMixin):
         if issue is None:
             raise HTTPNotFound()
 
-        subscriptions = DBSession.query(Subscription) \
-            .filter(
-                Subscription.subscribable_id == issue.id,
-                Subscription.member_id == context.identity.id,
-            )
-
-        self._unsee_subscriptions(subscriptions)
+        Subscription.unsee(
+            Subscription.subscribable_id == issue.id,
+            Subscription.member_id == context.identity.id,
+        )
         return issue
 
     @authorize
@@ -736,12 +699,10 @@ class IssueController(ModelRestController, JSONPatchControllerMixin):
         if member is None:
             raise StatusRoomMemberNotFound()
 
-        subscriptions = DBSession.query(Subscription) \
-            .filter(
-                Subscription.subscribable_id == issue.id,
-                Subscription.member_id != member.id
-            )
-        self._unsee_subscriptions(subscriptions)
+        Subscription.unsee(
+            Subscription.subscribable_id == issue.id,
+            Subscription.member_id != member.id
+        )
         issue.modified_at = datetime.utcnow()
         context.identity = member.create_jwt_principal()
         raise HTTPNoContent()
@@ -792,10 +753,6 @@ class IssueController(ModelRestController, JSONPatchControllerMixin):
         context.identity = member.create_jwt_principal()
         raise HTTPNoContent()
 
-    def _unsee_subscriptions(self, subscriptions):
-        for subscription in subscriptions:
-            subscription.seen_at = None
-
     @authorize
     @search_issue_validator
     @json
@@ -805,13 +762,14 @@ class IssueController(ModelRestController, JSONPatchControllerMixin):
         if query is None:
             raise StatusQueryParameterNotInFormOrQueryString()
 
-        query = f'%{query}%'
-        query = DBSession.query(Issue) \
-            .filter(or_(
-                Issue.title.ilike(query),
-                Issue.description.ilike(query),
-                cast(Issue.id, Text).ilike(query)
-            ))
+        query = get_search_engine().search(
+            DBSession.query(Issue),
+            query,
+            titles=[Issue.title],
+            texts=[Issue.description],
+            identifier=Issue.id,
+            rank='sort' not in context.query,
+        )
 
         if 'unread' in context.query:
             query = query \
@@ -838,9 +796,9 @@ class IssuePhaseSummaryController(ModelRestController):
     @AbstractPhaseSummaryView.expose
     @commit
     def list(self):
-        phase_summary_view = AbstractPhaseSummaryView \
-            .create_mapped_class(self.issue.id)
-        query = DBSession.query(phase_summary_view)
+        phase_summary_view = AbstractPhaseSummaryView.get_mapped_class()
+        query = DBSession.query(phase_summary_view) \
+            .params(issue_id=self.issue.id)
         return query
 
 
@@ -880,11 +838,9 @@ class IssuePhaseResourceSummaryController(ModelRestController):
     @json(prevent_form='709 Form Not Allowed')
     @AbstractResourceSummaryView.expose
     def list(self):
-        phase_summary_view = AbstractResourceSummaryView.create_mapped_class(
-            issue_id=self.issue.id,
-            phase_id=self.phase.id
-        )
-        query = DBSession.query(phase_summary_view)
+        phase_summary_view = AbstractResourceSummaryView.get_mapped_class()
+        query = DBSession.query(phase_summary_view) \
+            .params(issue_id=self.issue.id, phase_id=self.phase.id)
         return query
 
 
@@ -3,7 +3,6 @@ from datetime import datetime
 from auditor import context as AuditLogContext
 from nanohttp import json, context, HTTPNotFound, int_or_notfound
 from restfulpy.authorization import authorize
-from restfulpy.controllers import ModelRestController
 from restfulpy.orm import DBSession, commit
 from sqlalchemy import exists, and_
 from sqlalchemy.sql.expression import all_
@@ -13,6 +12,7 @@ from ..exceptions import StatusEndDateMustBeGreaterThanStartDate, \
 from ..models import Item, Dailyreport, Issue, Project, Phase, IssuePhase
 from ..validators import dailyreport_update_validator, \
     estimate_item_validator, dailyreport_create_validator
+from .metadata import ModelRestController
 
 
 FORM_WHITLELIST_ITEM = [
@@ -1,16 +1,16 @@
 from nanohttp import json, HTTPNotFound, context, HTTPUnauthorized, \
     int_or_notfound
 from restfulpy.authorization import authorize
-from restfulpy.controllers import ModelRestController
 from restfulpy.orm import DBSession, commit
-from sqlalchemy import or_
 from sqlalchemy_media import store_manager
 
 from ..exceptions import StatusAlreadyGrantedSpecialty, \
     StatusSpecialtyNotGrantedYet, StatusQueryParameterNotInFormOrQueryString
 from ..models import Member, Specialty, SpecialtyMember, Organization, \
     OrganizationMember, Group, GroupMember
+from ..search import get_search_engine
 from ..validators import search_member_validator
+from .metadata import ModelRestController
 
 
 class MemberController(ModelRestController):
@@ -79,15 +79,12 @@ class MemberController(ModelRestController):
         if query is None:
             raise StatusQueryParameterNotInFormOrQueryString()
 
-        query = f'%{query}%'
-        query = DBSession.query(Member) \
-            .filter(or_(
-                Member.title.ilike(query),
-                Member.first_name.ilike(query),
-                Member.last_name.ilike(query),
-            ))
-
-        return query
+        return get_search_engine().search(
+            DBSession.query(Member),
+            query,
+            titles=[Member.title, Member.first_name, Member.last_name],
+            rank='sort' not in context.query,
+        )
 
 
 class MemberSpecialtyController(ModelRestController):
@@ -0,0 +1,120 @@
+import functools
+import hashlib
+import threading
+
+import ujson
+from nanohttp import action, context, Controller
+from restfulpy import logger
+from restfulpy.controllers import ModelRestController as \
+    BaseModelRestController
+
+from ..exceptions import StatusNotModified
+from ..mixins import match_etag
+
+
+class MetadataEntry:
+    def __init__(self, metadata):
+        self.body = ujson.dumps(metadata, indent=4)
+        self.etag = f'"{hashlib.sha1(self.body.encode()).hexdigest()}"'
+
+
+class MetadataCache:
+    """Process local cache of the encoded responses of the METADATA verb,
+    by the controller class.
+
+    The metadata depends only on the code and the configuration, so the
+    entries are never invalidated, and their ETags are the same in all of
+    the processes of a release.
+
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, factory):
+        entry = self._entries.get(key)
+        if entry is None:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is None:
+                    entry = self._entries[key] = MetadataEntry(factory())
+
+        return entry
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def warm_up(self, root):
+        """Fills the cache for the controllers which are reachable from the
+        ``root`` controller class, the ones created per request are filled
+        by their first METADATA request.
+
+        """
+        for controller in iter_controllers(root):
+            handler = getattr(type(controller), 'metadata', None)
+            create_metadata = getattr(handler, 'create_metadata', None)
+            if create_metadata is None:
+                continue
+
+            try:
+                self.get(
+                    type(controller),
+                    functools.partial(create_metadata, controller)
+                )
+
+            except Exception:
+                # Left to fail by its own requests, like before the cache
+                logger.error(
+                    f'Cannot warm the metadata of {type(controller).__name__}'
+                )
+
+
+metadata_cache = MetadataCache()
+
+
+def iter_controllers(root, seen=None):
+    seen = set() if seen is None else seen
+    for value in vars(root).values():
+        if not isinstance(value, Controller) or id(value) in seen:
+            continue
+
+        seen.add(id(value))
+        yield value
+        yield from iter_controllers(type(value), seen)
+
+
+def cache_metadata(func):
+
+    @functools.wraps(func)
+    def wrapper(self):
+        entry = metadata_cache.get(type(self), functools.partial(func, self))
+        context.response_headers.add_header('ETag', entry.etag)
+        context.response_headers.add_header('Cache-Control', 'no-cache')
+
+        if_none_match = context.environ.get('HTTP_IF_NONE_MATCH')
+        if if_none_match is not None and match_etag(if_none_match, entry.etag):
+            raise StatusNotModified()
+
+        return entry.body
+
+    wrapper.create_metadata = func
+    return wrapper
+
+
+#: METADATA action decorator
+#:
+#: Caches the metadata the action returns, per controller class.
+cached_metadata = functools.partial(
+    action,
+    content_type='application/json',
+    inner_decorator=cache_metadata
+)
+
+
+class ModelRestController(BaseModelRestController):
+
+    @cached_metadata
+    def metadata(self):
+        return self.__model__.json_metadata()
@@ -1,7 +1,6 @@
 from nanohttp import context, json, HTTPNotFound, HTTPUnauthorized, \
     int_or_notfound
 from restfulpy.authorization import authorize
-from restfulpy.controllers import ModelRestController
 from restfulpy.orm import commit, DBSession
 from sqlalchemy_media import store_manager
 
@@ -9,6 +8,7 @@ from ..exceptions import StatusRepetitiveTitle
 from ..models import Member, Organization, OrganizationMember
 from ..validators import organization_create_validator
 from .invitation import InvitationController
+from .metadata import ModelRestController
 
 
 class OrganizationController(ModelRestController):
@@ -1,12 +1,13 @@
-from nanohttp import json, RestController
+from nanohttp import RestController
 
 from ..models import AbstractPhaseSummaryView
+from .metadata import cached_metadata
 
 
 class PhaseSummaryController(RestController):
-    @json
+    @cached_metadata
     def metadata(self):
         return AbstractPhaseSummaryView \
-            .create_mapped_class(None) \
+            .get_mapped_class() \
             .json_metadata()
 
@@ -1,10 +1,10 @@
 from nanohttp import json, HTTPNotFound, HTTPUnauthorized, context, \
     int_or_notfound
 from restfulpy.authorization import authorize
-from restfulpy.controllers import ModelRestController
 from restfulpy.orm import DBSession
 
 from ..models import Phase
+from .metadata import ModelRestController
 from .resource import ResourceController
 
 
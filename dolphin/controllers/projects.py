@@ -1,19 +1,19 @@
 from auditor import context as AuditLogContext
 from nanohttp import HTTPStatus, json, context, HTTPNotFound, int_or_notfound
 from restfulpy.authorization import authorize
-from restfulpy.controllers import ModelRestController, RestController
+from restfulpy.controllers import RestController
 from restfulpy.orm import DBSession, commit
 
-from ..backends import ChatClient
-from ..exceptions import StatusChatRoomNotFound, \
-    StatusRoomMemberAlreadyExist, StatusRoomMemberNotFound, \
-    StatusManagerNotFound, StatusSecondaryManagerNotFound, StatusIssueNotFound
+from ..exceptions import StatusManagerNotFound, \
+    StatusSecondaryManagerNotFound, StatusIssueNotFound
 from ..models import Project, Member, Subscription, Workflow, Group, \
-    Release, Issue, ReturnToTriageJob
+    Release, Issue, ReturnToTriageJob, RoomProvisioningJob, \
+    ChatMembershipJob
 from ..validators import project_validator, update_project_validator, \
     batch_append_validator, batch_remove_validator
 from .files import FileController
 from .issues import IssueController
+from .metadata import ModelRestController
 
 
 FORM_WHITELIST = [
@@ -58,24 +58,6 @@ class ProjectController(ModelRestController):
 
         return project
 
-    def _ensure_room(self, title, token, access_token):
-        create_room_error = 1
-        room = None
-        while create_room_error is not None:
-            try:
-                room = ChatClient().create_room(
-                    title,
-                    token,
-                    access_token,
-                    context.identity.reference_id
-                )
-                create_room_error = None
-            except StatusChatRoomNotFound:
-                # FIXME: Cover here
-                create_room_error = 1
-
-        return room
-
     def _create_auditlog(self, project):
         workflow_id = context.form.get('workflowId')
         group_id = context.form.get('groupId')
@@ -153,7 +135,6 @@ class ProjectController(ModelRestController):
     @commit
     def create(self):
         form = context.form
-        token = context.environ['HTTP_AUTHORIZATION']
         manager = DBSession.query(Member).get(form['managerId'])
         creator = Member.current()
         if manager is None:
@@ -190,45 +171,12 @@ class ProjectController(ModelRestController):
                 .one()
             project.workflow_id = default_workflow.id
 
-        room = self._ensure_room(
-            project.get_room_title(),
-            token,
-            creator.access_token
-        )
-
-        chat_client = ChatClient()
-        project.room_id = room['id']
-        try:
-            chat_client.add_member(
-                project.room_id,
-                manager.reference_id,
-                token,
-                creator.access_token
-            )
-
-        except StatusRoomMemberAlreadyExist:
-            # Exception is passed because it means `add_member()` is already
-            # called and `manager` successfully added to room. So there is
-            # no need to call `add_member()` API again and re-add the manager to
-            # room.
-            pass
-
-        # The exception type is not specified because after consulting with
-        # Mr.Mardani, the result got: there must be no specification on
-        # exception type because nobody knows what exception may be raised
-        try:
-            project.room_id = room['id']
-            DBSession.flush()
-
-        except:
-            chat_client.delete_room(
-                project.room_id,
-                token,
-                creator.access_token
-            )
-            raise
-
         DBSession.add(project)
+        DBSession.flush()
+
+        # The room is created and bound by `RoomProvisioningJob`, so the
+        # response is not held by the chat server
+        RoomProvisioningJob.enqueue(DBSession, creator.id, [project.id])
         return project
 
     @authorize
@@ -365,8 +313,6 @@ class ProjectController(ModelRestController):
     @Project.expose
     @commit
     def subscribe(self, id):
-        token = context.environ['HTTP_AUTHORIZATION']
-        identity = context.identity
         id = int_or_notfound(id)
 
         project = DBSession.query(Project).get(id)
@@ -386,32 +332,8 @@ class ProjectController(ModelRestController):
         )
         DBSession.add(subscription)
 
-        chat_client = ChatClient()
-        try:
-            chat_client.add_member(
-                project.room_id,
-                identity.reference_id,
-                token,
-                member.access_token
-            )
-        except StatusRoomMemberAlreadyExist:
-            # Exception is passed because it means `add_member()` is already
-            # called and `member` successfully added to room. So there is
-            # no need to call `add_member()` API again and re-add the member to
-            # room.
-            pass
-
-        try:
-            DBSession.flush()
-        except:
-            chat_client.kick_member(
-                project.room_id,
-                identity.reference_id,
-                token,
-                member.access_token
-            )
-            raise
-
+        # The chat membership does not hold the response
+        ChatMembershipJob.enqueue(DBSession, member.id, project.id)
         return project
 
     @authorize
@@ -419,8 +341,6 @@ class ProjectController(ModelRestController):
     @Project.expose
     @commit
     def unsubscribe(self, id):
-        token = context.environ['HTTP_AUTHORIZATION']
-        identity = context.identity
         id = int_or_notfound(id)
 
         project = DBSession.query(Project).get(id)
@@ -436,35 +356,7 @@ class ProjectController(ModelRestController):
             raise HTTPStatus('612 Not Subscribed Yet')
 
         DBSession.delete(subscription)
-
-        chat_client = ChatClient()
-        try:
-            chat_client.kick_member(
-                project.room_id,
-                identity.reference_id,
-                token,
-                member.access_token
-            )
-
-        except StatusRoomMemberNotFound:
-            # Exception is passed because it means `kick_member()` is already
-            # called and `member` successfully removed from room. So there is
-            # no need to call `kick_member()` API again and re-add the member
-            # to room.
-            pass
-
-        try:
-            DBSession.flush()
-
-        except:
-            chat_client.add_member(
-                project.room_id,
-                identity.reference_id,
-                token,
-                member.access_token
-            )
-            raise
-
+        ChatMembershipJob.enqueue(DBSession, member.id, project.id)
         return project
 
     @authorize
@@ -472,6 +364,10 @@ class ProjectController(ModelRestController):
     @Project.expose
     def get(self, id):
         id = int_or_notfound(id)
+        Project.validate_conditional_request(
+            DBSession.query(Project).filter(Project.id == id),
+            collection=False
+        )
 
         project = DBSession.query(Project).get(id)
         if not project:
@@ -1,6 +1,5 @@
 from nanohttp import json, context, HTTPNotFound, HTTPStatus, int_or_notfound
 from restfulpy.authorization import authorize
-from restfulpy.controllers import ModelRestController
 from restfulpy.orm import DBSession, commit
 
 from ..backends import ChatClient
@@ -9,6 +8,7 @@ from ..exceptions import StatusManagerNotFound, \
     StatusGroupNotFound
 from ..models import Release, Subscription, Member, Group
 from ..validators import release_validator, update_release_validator
+from .metadata import ModelRestController
 
 
 FORM_WHITELIST = [
@@ -207,6 +207,10 @@ class ReleaseController(ModelRestController):
     @Release.expose
     def get(self, id):
         id = int_or_notfound(id)
+        Release.validate_conditional_request(
+            DBSession.query(Release).filter(Release.id == id),
+            collection=False
+        )
 
         release = DBSession.query(Release).get(id)
         if not release:
@@ -1,9 +1,9 @@
 from nanohttp import json
 from restfulpy.authorization import authorize
-from restfulpy.controllers import ModelRestController
 from restfulpy.orm import DBSession
 
 from ..models import Resource, Phase, SpecialtyMember
+from .metadata import ModelRestController
 
 
 class ResourceController(ModelRestController):
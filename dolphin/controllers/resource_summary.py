@@ -1,12 +1,13 @@
-from nanohttp import json, RestController
+from nanohttp import RestController
 
 from ..models import AbstractResourceSummaryView
+from .metadata import cached_metadata
 
 
 class ResourceSummaryController(RestController):
-    @json
+    @cached_metadata
     def metadata(self):
         return AbstractResourceSummaryView \
-            .create_mapped_class(None, None) \
+            .get_mapped_class() \
             .json_metadata()
 
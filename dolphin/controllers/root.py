@@ -6,7 +6,9 @@ from restfulpy.controllers import RootController, RestController, \
 
 import dolphin
 from .activity import ActivityController
+from .backend_metric import BackendMetricController
 from .batch import BatchController
+from .changes import ChangeController
 from .dailyreport import DailyreportController
 from .draft_issue import DraftIssueController
 from .event import EventController
@@ -29,6 +31,7 @@ from .skill import SkillController
 from .specialty import SpecialtyController
 from .tag import TagController
 from .tokens import TokenController
+from .unread_counter import UnreadCounterController
 from .workflows import WorkflowController
 
 
@@ -63,6 +66,9 @@ class Apiv1(RestController, JSONPatchControllerMixin):
     resourcessummaries = ResourceSummaryController()
     batches = BatchController()
     skills = SkillController()
+    unreadcounters = UnreadCounterController()
+    changes = ChangeController()
+    backendmetrics = BackendMetricController()
 
     @json
     def version(self):
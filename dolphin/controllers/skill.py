@@ -1,10 +1,10 @@
 from nanohttp import json
 from restfulpy.authorization import authorize
-from restfulpy.controllers import ModelRestController
 from restfulpy.orm import DBSession, commit
 
 from ..models import Skill
 from ..validators import skill_create_validator
+from .metadata import ModelRestController
 
 
 FORM_WHITELIST = [
@@ -1,11 +1,11 @@
 from nanohttp import json, int_or_notfound, HTTPNotFound, context
 from restfulpy.authorization import authorize
-from restfulpy.controllers import ModelRestController
 from restfulpy.orm import DBSession, commit
 
 from ..exceptions import StatusRepetitiveTitle
 from ..models import Specialty
 from ..validators import specialty_create_validator, specialty_update_validator
+from .metadata import ModelRestController
 
 
 FORM_WHITELIST = [
@@ -1,7 +1,7 @@
 from nanohttp import json, context, HTTPNotFound, HTTPForbidden, \
     int_or_notfound
 from restfulpy.authorization import authorize
-from restfulpy.controllers import ModelRestController, JSONPatchControllerMixin
+from restfulpy.controllers import JSONPatchControllerMixin
 from restfulpy.orm import DBSession, commit
 from sqlalchemy import and_, exists
 
@@ -9,6 +9,7 @@ from ..exceptions import StatusAlreadyTagAdded, StatusAlreadyTagRemoved, \
     StatusRepetitiveTitle
 from ..models import Tag, DraftIssueTag, IssueTag
 from ..validators import tag_create_validator, tag_update_validator
+from .metadata import ModelRestController
 
 
 FORM_WHITELIST = [
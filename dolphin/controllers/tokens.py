@@ -4,7 +4,10 @@ from restfulpy.orm import DBSession, commit
 from sqlalchemy import exists, and_
 
 from ..backends import CASClient, ChatClient
-from ..models import Member, Invitation, OrganizationMember
+from ..exceptions import StatusChatServerNotAvailable, \
+    StatusChatInternallError
+from ..models import Member, Invitation, OrganizationMember, \
+    ChatMembershipJob
 from ..validators import token_obtain_validator
 
 
@@ -91,6 +94,13 @@ class TokenController(RestController):
         principal.payload['organizationId'] = organization_id
         token = principal.dump().decode('utf-8')
 
-        ensured_member = ChatClient().ensure_member(token, member.access_token)
+        # Degraded mode: the member is ensured later when the chat server
+        # is down, slow or rejected by the circuit breaker
+        try:
+            ChatClient().ensure_member(token, member.access_token)
+
+        except (StatusChatServerNotAvailable, StatusChatInternallError):
+            ChatMembershipJob.enqueue(DBSession, member.id)
+
         return dict(token=token)
 
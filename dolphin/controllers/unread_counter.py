@@ -0,0 +1,17 @@
+from nanohttp import json, context
+from restfulpy.authorization import authorize
+from restfulpy.orm import DBSession
+
+from ..models import UnreadCounter
+from .metadata import ModelRestController
+
+
+class UnreadCounterController(ModelRestController):
+    __model__ = UnreadCounter
+
+    @authorize
+    @json(prevent_form='709 Form Not Allowed')
+    @UnreadCounter.expose
+    def list(self):
+        return DBSession.query(UnreadCounter) \
+            .filter(UnreadCounter.member_id == context.identity.id)
@@ -1,6 +1,6 @@
 from nanohttp import json, context, HTTPNotFound, int_or_notfound, HTTPStatus
 from restfulpy.authorization import authorize
-from restfulpy.controllers import ModelRestController, RestController
+from restfulpy.controllers import RestController
 from restfulpy.orm import DBSession, commit
 
 from ..exceptions import StatusRepetitiveTitle, StatusRepetitiveOrder, \
@@ -8,6 +8,7 @@ from ..exceptions import StatusRepetitiveTitle, StatusRepetitiveOrder, \
 from ..models import Workflow, Phase, Specialty
 from ..validators import workflow_create_validator, \
     workflow_update_validator, phase_update_validator, phase_validator
+from .metadata import ModelRestController
 
 
 FORM_WHITELIST_PHASE = [
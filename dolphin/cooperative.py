@@ -0,0 +1,40 @@
+"""Support of the cooperative (gevent) workers of gunicorn.
+
+The gevent worker monkey patches the standard library before the
+application is loaded, so the sockets of the backend clients, the locks and
+the thread locals, including the scope of ``DBSession``, are green already.
+Two things are left to the application: psycopg2 waits for Postgres in C,
+so it is made to yield to the hub by ``psycogreen``, and the connection
+pool of SQLAlchemy is sized for the greenlets of a worker instead of its
+single thread.
+
+"""
+from nanohttp import settings
+from sqlalchemy import create_engine as sa_create_engine
+
+
+def is_cooperative():
+    """Whether the process is monkey patched by gevent."""
+    try:
+        from gevent import monkey
+
+    except ImportError:
+        return False
+
+    return monkey.is_module_patched('socket')
+
+
+def patch_psycopg():
+    from psycogreen.gevent import patch_psycopg
+    patch_psycopg()
+
+
+def create_engine():
+    pool = settings.cooperative.db_pool
+    return sa_create_engine(
+        settings.db.url,
+        echo=settings.db.echo,
+        pool_size=pool.size,
+        max_overflow=pool.max_overflow,
+        pool_timeout=pool.timeout,
+    )
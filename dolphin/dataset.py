@@ -0,0 +1,232 @@
+import random
+from datetime import datetime, timedelta
+
+from auditor.context import Context as AuditLogContext
+from nanohttp import context
+from nanohttp.contexts import Context
+from restfulpy.orm import DBSession
+from sqlalchemy import func
+from sqlalchemy_media import StoreManager
+
+from .models import Member, Admin, Resource, Organization, \
+    OrganizationMember, Workflow, Phase, Group, Skill, Specialty, Release, \
+    Project, Issue, IssuePhase, Item, Dailyreport
+from .models.issue import issue_kinds, issue_priorities, issue_stages
+
+
+WORDS = [
+    'account', 'archive', 'backend', 'billing', 'cache', 'calendar',
+    'client', 'dashboard', 'database', 'deploy', 'editor', 'email',
+    'export', 'feed', 'filter', 'gateway', 'import', 'invoice', 'login',
+    'mobile', 'notification', 'payment', 'profile', 'report', 'search',
+    'session', 'settings', 'storage', 'sync', 'upload', 'webhook', 'widget',
+]
+
+
+class DatasetGenerator:
+    """Builds a reproducible synthetic dataset of organizations, each one
+    with its resources, releases, projects, issues, phases, items and
+    dailyreports.
+
+    The same ``seed`` and sizes always produce the same rows, so the
+    benchmarks of different revisions can be compared. The dates are
+    relative to ``today``, the current date by default, so the items keep
+    filling all the zones, the same ``today`` reproduces the same dates.
+
+    """
+
+    def __init__(self, organizations=1, members=10, projects=5, issues=20,
+                 items=2, dailyreports=5, seed=0, today=None):
+        self.organizations = organizations
+        self.members = members
+        self.projects = projects
+        self.issues = issues
+        self.items = items
+        self.dailyreports = dailyreports
+        self.seed = seed
+        self.random = random.Random(seed)
+        self.today = (today or datetime.now()).replace(
+            hour=0,
+            minute=0,
+            second=0,
+            microsecond=0
+        )
+
+    def sentence(self, words):
+        return ' '.join(self.random.choice(WORDS) for _ in range(words))
+
+    def create_room_id(self):
+        self._room_id += 1
+        return self._room_id
+
+    def create_workflow(self):
+        workflow = Workflow(title=f'Synthetic {self.prefix}')
+        skill = Skill(title=f'Synthetic {self.prefix}')
+        DBSession.add(workflow)
+
+        phases = []
+        for order, title in enumerate(
+                ('Triage', 'Design', 'Development', 'Test'),
+                start=1
+        ):
+            specialty = Specialty(
+                title=f'{title} {self.prefix}',
+                skill=skill
+            )
+            phase = Phase(
+                title=title,
+                order=order,
+                workflow=workflow,
+                specialty=specialty
+            )
+            DBSession.add(phase)
+            phases.append(phase)
+
+        return workflow, phases
+
+    def create_resources(self, organization, phases):
+        resources = []
+        for i in range(self.members):
+            self._reference_id += 1
+            reference_id = self._reference_id
+            resource = Resource(
+                title=f'resource{reference_id}',
+                email=f'resource{reference_id}@{self.prefix}.example.com',
+                access_token=f'access token {reference_id}',
+                reference_id=reference_id,
+                specialty=self.random.choice(phases).specialty,
+            )
+            DBSession.add(resource)
+            resources.append(resource)
+
+        DBSession.flush()
+        for i, resource in enumerate(resources):
+            DBSession.add(OrganizationMember(
+                organization_id=organization.id,
+                member_id=resource.id,
+                role='owner' if i == 0 else 'member',
+            ))
+
+        return resources
+
+    def create_items(self, issue_phase, resources, due_date):
+        for resource in self.random.sample(
+                resources,
+                min(len(resources), self.random.randint(1, self.items))
+        ):
+            item = Item(issue_phase=issue_phase, member_id=resource.id)
+            DBSession.add(item)
+
+            # A quarter of the items are left unestimated, the rest are
+            # spread from the past to the future to fill all the zones.
+            if self.random.random() < .25:
+                continue
+
+            # The due date of the issue is the latest end date of its
+            # items, by the rollup
+            item.end_date = \
+                due_date - timedelta(days=self.random.randint(0, 5))
+            item.start_date = \
+                item.end_date - timedelta(days=self.random.randint(1, 15))
+            item.estimated_hours = self.random.randint(1, 40)
+
+            reports = min(
+                self.dailyreports,
+                (min(item.end_date, self.today) - item.start_date).days
+            )
+            for day in range(max(reports, 0)):
+                DBSession.add(Dailyreport(
+                    item=item,
+                    date=(item.start_date + timedelta(days=day)).date(),
+                    hours=self.random.randint(0, 8),
+                    note=self.sentence(6),
+                ))
+
+    def create_issues(self, project, phases, resources):
+        for i in range(self.issues):
+            issue = Issue(
+                project=project,
+                title=f'{self.sentence(3)} {i + 1}',
+                description=self.sentence(20),
+                kind=self.random.choice(issue_kinds),
+                stage=self.random.choice(issue_stages),
+                priority=self.random.choice(issue_priorities),
+                days=self.random.randint(1, 10),
+                room_id=self.create_room_id(),
+            )
+            DBSession.add(issue)
+
+            issue.members.extend(
+                self.random.sample(resources, min(len(resources), 3))
+            )
+
+            due_date = \
+                self.today + timedelta(days=self.random.randint(-10, 60))
+            for phase in phases[:self.random.randint(0, len(phases))]:
+                issue_phase = IssuePhase(issue=issue, phase=phase)
+                DBSession.add(issue_phase)
+                self.create_items(issue_phase, resources, due_date)
+
+    def create_organization(self, index, workflow, phases):
+        organization = Organization(title=f'{self.prefix}-{index + 1}')
+        DBSession.add(organization)
+        DBSession.flush()
+
+        resources = self.create_resources(organization, phases)
+        group = Group(title=f'{organization.title} group')
+        release = Release(
+            title=f'{organization.title} release',
+            description=self.sentence(10),
+            cutoff=self.today + timedelta(days=30),
+            launch_date=self.today + timedelta(days=45),
+            manager=resources[0],
+            room_id=self.create_room_id(),
+            group=group,
+        )
+        DBSession.add(release)
+
+        for i in range(self.projects):
+            project = Project(
+                release=release,
+                workflow=workflow,
+                group=group,
+                manager=self.random.choice(resources),
+                title=f'{self.sentence(2)} {i + 1}',
+                description=self.sentence(10),
+                room_id=self.create_room_id(),
+            )
+            DBSession.add(project)
+            self.create_issues(project, phases, resources)
+
+            # Flushing per project keeps the identity map and the rollup
+            # refresh statements small.
+            DBSession.flush()
+
+    def generate(self):
+        self.prefix = f'synthetic{self.seed}'
+        self._reference_id = \
+            DBSession.query(func.coalesce(func.max(Member.reference_id), 0)) \
+            .scalar()
+        self._room_id = 1000000 + self._reference_id
+
+        with AuditLogContext(dict()), Context(dict()), \
+                StoreManager(DBSession):
+            self._reference_id += 1
+            god = Admin(
+                title=f'{self.prefix} admin',
+                email=f'admin@{self.prefix}.example.com',
+                access_token=f'access token {self._reference_id}',
+                reference_id=self._reference_id,
+            )
+            DBSession.add(god)
+            DBSession.flush()
+            context.identity = god
+
+            workflow, phases = self.create_workflow()
+            for i in range(self.organizations):
+                self.create_organization(i, workflow, phases)
+
+            DBSession.commit()
+
+        return god
+
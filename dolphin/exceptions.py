@@ -1,4 +1,5 @@
-from nanohttp import HTTPKnownStatus
+from nanohttp import HTTPKnownStatus, HTTPNotModified
+from nanohttp.exceptions import KeepResponseHeadersMixin
 
 
 class StatusRoomMemberAlreadyExist(HTTPKnownStatus):
@@ -25,6 +26,14 @@ class StatusChatInternallError(HTTPKnownStatus):
     status = '801 Chat Server Internal Error'
 
 
+class StatusChatRequestRejected(StatusChatInternallError):
+    # A 4xx answer of the chat server, repeating the request is useless
+
+    def __init__(self, status_code):
+        self.status_code = status_code
+        super().__init__()
+
+
 class StatusOutOfLimitRoomSubscription(HTTPKnownStatus):
     status = '804 Number Of Chat Room Subscription Is Out Of Limit'
 
@@ -530,3 +539,20 @@ class StatusIssueIdNotInForm(HTTPKnownStatus):
 class StatusInvalidBatch(HTTPKnownStatus):
     status = '936 Invalid Batch More Than 100'
 
+
+class StatusMalformedCursor(HTTPKnownStatus):
+    status = '937 Malformed Cursor'
+
+
+class StatusInvalidCursorSortKey(HTTPKnownStatus):
+    status = '938 Invalid Sort Key For Cursor Pagination'
+
+
+class StatusInvalidFieldset(HTTPKnownStatus):
+    status = '939 Invalid Field In Fieldset'
+
+
+class StatusNotModified(KeepResponseHeadersMixin, HTTPNotModified):
+
+    def render(self):
+        return ''
@@ -0,0 +1,287 @@
+import csv
+import json
+import re
+from datetime import datetime
+
+from restfulpy.orm import DBSession
+from sqlalchemy import select, func, insert
+
+from .models import Subscribable, Issue, IssueTag, RelatedIssue, Project, \
+    Tag, Change, RoomProvisioningJob
+from .models.issue import issue_kinds, issue_priorities, issue_stages
+from .validators import TITLE_PATTERN
+
+
+LIST_SEPARATOR_PATTERN = re.compile(r'[\s;]+')
+TITLE_MAX_LENGTH = 128
+DESCRIPTION_MAX_LENGTH = 8192
+
+
+class IssueImporter:
+    """Imports issues in bulk, read from NDJSON or CSV, by a few set based
+    statements per batch instead of defining and finalizing draft issues
+    one by one.
+
+    A row has the ``title``, ``projectId`` and ``days`` fields, and
+    optionally the ``description``, ``kind``, ``priority``, ``stage``,
+    ``tagIds`` and ``relatedIssueIds``. The list fields of CSV are
+    separated by spaces or semicolons. The rows are validated by the rules
+    of finalizing a draft issue, including the unique titles of the issues
+    of a project. The invalid rows are skipped and reported by ``errors``.
+
+    The issues are created without a chat room, the rooms are created in
+    the background by ``RoomProvisioningJob``.
+
+    """
+
+    def __init__(self, member, batch_size=500):
+        self.member = member
+        self.batch_size = batch_size
+        self.errors = []
+
+    @staticmethod
+    def read_ndjson(file):
+        for line_number, line in enumerate(file, start=1):
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                row = json.loads(line)
+
+            except ValueError:
+                row = None
+
+            yield line_number, row
+
+    @staticmethod
+    def read_csv(file):
+        reader = csv.DictReader(file)
+        for row in reader:
+            for name in ('tagIds', 'relatedIssueIds'):
+                value = (row.get(name) or '').strip()
+                row[name] = LIST_SEPARATOR_PATTERN.split(value) \
+                    if value else []
+
+            row = {k: v for k, v in row.items() if v != ''}
+            yield reader.line_num, row
+
+    def import_(self, rows):
+        """Imports the ``(line_number, row)`` pairs and returns the ids of
+        the created issues.
+
+        """
+        issue_ids = []
+        batch = []
+        for line_number, row in rows:
+            try:
+                batch.append((line_number, self.create_values(row)))
+
+            except ValueError as ex:
+                self.errors.append((line_number, str(ex)))
+                continue
+
+            if len(batch) >= self.batch_size:
+                issue_ids.extend(self.import_batch(batch))
+                batch = []
+
+        if batch:
+            issue_ids.extend(self.import_batch(batch))
+
+        return issue_ids
+
+    @staticmethod
+    def create_values(row):
+        if not isinstance(row, dict):
+            raise ValueError('Malformed row')
+
+        # The same rules as of finalizing a draft issue
+        title = row.get('title')
+        if not isinstance(title, str) or not title.strip():
+            raise ValueError('Title is required')
+
+        if len(title) > TITLE_MAX_LENGTH:
+            raise ValueError(
+                f'At most {TITLE_MAX_LENGTH} characters are valid for title'
+            )
+
+        if not TITLE_PATTERN.match(title):
+            raise ValueError('Invalid title format')
+
+        description = row.get('description')
+        if description is not None and not isinstance(description, str):
+            raise ValueError(f'Invalid description: {description!r}')
+
+        if description is not None \
+                and len(description) > DESCRIPTION_MAX_LENGTH:
+            raise ValueError(
+                f'At most {DESCRIPTION_MAX_LENGTH} characters are valid for '
+                f'description'
+            )
+
+        days = to_int(row.get('days'), 'days')
+        if days < 0:
+            raise ValueError(f'Invalid days: {days!r}')
+
+        values = dict(
+            title=title,
+            description=description,
+            project_id=to_int(row.get('projectId'), 'projectId'),
+            days=days,
+            kind=to_choice(row.get('kind', 'feature'), issue_kinds, 'kind'),
+            priority=to_choice(
+                row.get('priority', 'low'),
+                issue_priorities,
+                'priority'
+            ),
+            stage=to_choice(row.get('stage', 'triage'), issue_stages, 'stage'),
+            tag_ids=set(
+                to_int(i, 'tagIds') for i in row.get('tagIds') or []
+            ),
+            related_issue_ids=set(
+                to_int(i, 'relatedIssueIds')
+                for i in row.get('relatedIssueIds') or []
+            ),
+        )
+        if values['kind'] == 'bug' and not values['related_issue_ids']:
+            raise ValueError('Bug must have related issues')
+
+        return values
+
+    def validate_references(self, batch):
+        project_ids = set(v['project_id'] for _, v in batch)
+        tag_ids = set().union(*(v['tag_ids'] for _, v in batch))
+        issue_ids = set().union(*(v['related_issue_ids'] for _, v in batch))
+
+        existing_project_ids = set(
+            i for i, in DBSession.query(Project.id)
+            .filter(Project.id.in_(project_ids))
+        )
+        existing_tag_ids = set(
+            i for i, in DBSession.query(Tag.id).filter(Tag.id.in_(tag_ids))
+        ) if tag_ids else set()
+        existing_issue_ids = set(
+            i for i, in DBSession.query(Issue.id)
+            .filter(Issue.id.in_(issue_ids))
+        ) if issue_ids else set()
+
+        # The titles of the issues of a project are unique, the titles of
+        # the previous batches are committed already
+        titles = set(
+            DBSession.query(Issue.project_id, Issue.title)
+            .filter(Issue.project_id.in_(project_ids))
+            .filter(Issue.title.in_(set(v['title'] for _, v in batch)))
+        )
+
+        valid = []
+        for line_number, values in batch:
+            title = (values['project_id'], values['title'])
+            if values['project_id'] not in existing_project_ids:
+                self.errors.append((line_number, 'Project not found'))
+
+            elif title in titles:
+                self.errors.append((line_number, 'Repetitive title'))
+
+            elif not values['tag_ids'] <= existing_tag_ids:
+                self.errors.append((line_number, 'Tag not found'))
+
+            elif not values['related_issue_ids'] <= existing_issue_ids:
+                self.errors.append((line_number, 'Related issue not found'))
+
+            else:
+                titles.add(title)
+                valid.append(values)
+
+        return valid
+
+    def import_batch(self, batch):
+        batch = self.validate_references(batch)
+        if not batch:
+            return []
+
+        # The ids are taken beforehand, so the rows of all of the tables
+        # are inserted by one statement per table.
+        ids = [
+            i for i, in DBSession.execute(
+                select([func.nextval('subscribable_id_seq')])
+                .select_from(func.generate_series(1, len(batch)))
+            )
+        ]
+        created_at = datetime.utcnow()
+        now = datetime.now()
+
+        DBSession.execute(insert(Subscribable.__table__).values([
+            dict(
+                id=id,
+                type_=Issue.__tablename__,
+                title=values['title'],
+                description=values['description'],
+                created_at=created_at,
+            )
+            for id, values in zip(ids, batch)
+        ]))
+        DBSession.execute(insert(Issue.__table__).values([
+            dict(
+                id=id,
+                project_id=values['project_id'],
+                room_id=None,
+                kind=values['kind'],
+                days=values['days'],
+                origin='new',
+                stage=values['stage'],
+                priority=values['priority'],
+                last_moving_time=now,
+                created_by_reference_id=self.member.reference_id,
+                created_by_member_id=self.member.id,
+            )
+            for id, values in zip(ids, batch)
+        ]))
+
+        issue_tags = [
+            dict(issue_id=id, tag_id=tag_id)
+            for id, values in zip(ids, batch)
+            for tag_id in values['tag_ids']
+        ]
+        if issue_tags:
+            DBSession.execute(insert(IssueTag.__table__).values(issue_tags))
+
+        related_issues = set()
+        for id, values in zip(ids, batch):
+            for related_issue_id in values['related_issue_ids']:
+                related_issues.add((id, related_issue_id))
+                related_issues.add((related_issue_id, id))
+
+        if related_issues:
+            DBSession.execute(insert(RelatedIssue.__table__).values([
+                dict(issue_id=i, related_issue_id=r)
+                for i, r in sorted(related_issues)
+            ]))
+
+        Change.record(DBSession, [
+            dict(
+                entity='issue',
+                entity_id=id,
+                action='create',
+                subscribable_id=id,
+                member_id=None,
+            )
+            for id in ids
+        ])
+        RoomProvisioningJob.enqueue(DBSession, self.member.id, ids)
+        DBSession.commit()
+        return ids
+
+
+def to_int(value, name):
+    try:
+        return int(value)
+
+    except (TypeError, ValueError):
+        raise ValueError(f'Invalid {name}: {value!r}')
+
+
+def to_choice(value, choices, name):
+    if value not in choices:
+        raise ValueError(f'Invalid {name}: {value!r}')
+
+    return value
@@ -0,0 +1,130 @@
+import re
+import threading
+import time
+from collections import deque
+
+import ujson
+from nanohttp import settings
+from restfulpy import logger
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+PARAMETER_PATTERN = re.compile(r'%\(\w+\)s|%s|\$\d+')
+PARAMETERS_LIST_PATTERN = re.compile(r'\(\?(?:, \?)+\)')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def normalize_statement(statement):
+    """Replaces the parameters with `?` and collapses the `IN` lists, so
+    the same query issued with different values is logged the same way.
+
+    """
+    statement = PARAMETER_PATTERN.sub('?', statement)
+    statement = PARAMETERS_LIST_PATTERN.sub('(...)', statement)
+    return WHITESPACE_PATTERN.sub(' ', statement).strip()
+
+
+# The statistics of the request of the current thread, or greenlet
+_local = threading.local()
+
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def before_cursor_execute(connection, cursor, statement, parameters, context,
+                          executemany):
+    if getattr(_local, 'statistics', None) is None:
+        return
+
+    # Kept by the execution context of the statement, so the start times
+    # of the failed statements do not pile up on the pooled connections
+    context._query_started_at = time.monotonic()
+
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def after_cursor_execute(connection, cursor, statement, parameters, context,
+                         executemany):
+    statistics = getattr(_local, 'statistics', None)
+    started_at = getattr(context, '_query_started_at', None)
+    if statistics is None or started_at is None:
+        return
+
+    elapsed = (time.monotonic() - started_at) * 1000
+    statistics['queries'] += 1
+    statistics['time'] += elapsed
+
+    threshold = settings.sql_instrumentation.slow_query_threshold
+    if elapsed >= threshold:
+        slow_query = dict(
+            statement=normalize_statement(statement),
+            time=round(elapsed, 3),
+            path=statistics['path'],
+        )
+        statistics['slow_queries'].append(slow_query)
+        logger.warning(f'Slow query: {ujson.dumps(slow_query)}')
+
+
+class SQLInstrumentationMiddleWare:
+    """Counts and times the SQL statements of each request.
+
+    The totals are logged as a JSON line when the request is done. The
+    ``X-SQL-Query-Count`` and ``X-SQL-Query-Time`` headers have the totals
+    up to starting the response, so the statements which run after it,
+    e.g. the commits of the audit log callback, are only in the log line.
+    The statements slower than ``sql_instrumentation.slow_query_threshold``
+    are kept in ``slow_queries``, newest last.
+
+    """
+
+    def __init__(self, application):
+        self.application = application
+        self._slow_queries = None
+
+    def __getattr__(self, key):
+        return getattr(self.application, key)
+
+    @property
+    def slow_queries(self):
+        if self._slow_queries is None:
+            self._slow_queries = deque(
+                maxlen=settings.sql_instrumentation.slow_query_log_size
+            )
+
+        return self._slow_queries
+
+    def __call__(self, environ, start_response):
+        if not settings.sql_instrumentation.enabled:
+            return self.application(environ, start_response)
+
+        statistics = _local.statistics = dict(
+            queries=0,
+            time=0.0,
+            path=environ.get('PATH_INFO'),
+            slow_queries=self.slow_queries,
+        )
+        started_at = time.monotonic()
+        response_status = None
+
+        def instrumented_start_response(status, headers, exc_info=None):
+            nonlocal response_status
+            response_status = status
+            headers = list(headers)
+            headers.append(('X-SQL-Query-Count', str(statistics['queries'])))
+            headers.append(
+                ('X-SQL-Query-Time', f'{statistics["time"]:.3f}')
+            )
+            return start_response(status, headers, exc_info)
+
+        try:
+            return self.application(environ, instrumented_start_response)
+
+        finally:
+            _local.statistics = None
+            logger.info(ujson.dumps(dict(
+                event='sql',
+                verb=environ.get('REQUEST_METHOD'),
+                path=statistics['path'],
+                status=response_status,
+                queries=statistics['queries'],
+                sql_time=round(statistics['time'], 3),
+                total_time=round((time.monotonic() - started_at) * 1000, 3),
+            )))
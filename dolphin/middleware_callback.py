@@ -1,24 +1,19 @@
-import traceback
 from datetime import datetime
 
 import ujson
 from auditor.logentry import ChangeAttributeLogEntry, InstantiationLogEntry, \
     AppendLogEntry, RemoveLogEntry, RequestLogEntry
-from nanohttp import context, HTTPStatus
 from restfulpy.datetimehelpers import format_datetime
+from restfulpy.orm import DBSession
 
-from dolphin.backends import ChatClient
-from dolphin.models import Member
-
-
-AUDIT_LOG_MIMETYPE = 'application/x-auditlog'
+from dolphin.models import Member, ChatMessageJob
 
 
 def callback(audit_log):
 
     if audit_log[-1].status == '200 OK' and len(audit_log) > 1:
-        chat_client = ChatClient()
         member = Member.current()
+        room_messages = {}
         for log in audit_log:
             if isinstance(log, ChangeAttributeLogEntry):
                 message = dict(
@@ -54,20 +49,18 @@ def callback(audit_log):
                     new=None,
                 )
 
-            if not isinstance(log, RequestLogEntry):
-                try:
-                    chat_client.send_message(
-                        room_id=log.object_.room_id,
-                        body=ujson.dumps(message),
-                        mimetype=AUDIT_LOG_MIMETYPE,
-                        token=context.environ['HTTP_AUTHORIZATION'],
-                        x_access_token=member.access_token,
-                    )
+            # The rooms of the imported issues may not be provisioned yet
+            if not isinstance(log, RequestLogEntry) \
+                    and log.object_.room_id is not None:
+                room_messages.setdefault(log.object_.room_id, []) \
+                    .append(ujson.dumps(message))
 
-                    # This exception passed because after consulting with
-                    # Mr.Mardani, decision made: This exception will be
-                    # resolved when the dolphin and jaguar merge together
-                except HTTPStatus:
-                    traceback.print_exc()
-                    pass
+        # The messages are sent by the mule worker, coalesced per room
+        for room_id, messages in room_messages.items():
+            DBSession.add(ChatMessageJob(
+                room_id=room_id,
+                member_id=member.id,
+                messages=messages,
+            ))
 
+        DBSession.commit()
@@ -0,0 +1,61 @@
+"""Add unread_counter table
+
+Revision ID: 3b9d6f1e2a47
+Revises: e4a7c2d91b58
+Create Date: 2019-08-14 16:05:31.582410
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+from dolphin.models import UnreadCounter, Subscription
+
+
+# revision identifiers, used by Alembic.
+revision = '3b9d6f1e2a47'
+down_revision = 'e4a7c2d91b58'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'unread_counter',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('member_id', sa.Integer(), nullable=True),
+        sa.Column('project_id', sa.Integer(), nullable=True),
+        sa.Column(
+            'kind',
+            postgresql.ENUM(name='kind', create_type=False),
+            nullable=True
+        ),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ['member_id'],
+            ['member.id'],
+            ondelete='CASCADE'
+        ),
+        sa.ForeignKeyConstraint(
+            ['project_id'],
+            ['project.id'],
+            ondelete='CASCADE'
+        ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('member_id', 'project_id', 'kind')
+    )
+    op.create_index(
+        'ix_unread_counter_member_id',
+        'unread_counter',
+        ['member_id'],
+        unique=False
+    )
+    for statement in UnreadCounter.create_refresh_statements(
+        sa.select([Subscription.member_id])
+    ):
+        op.execute(statement)
+
+
+def downgrade():
+    op.drop_index('ix_unread_counter_member_id', table_name='unread_counter')
+    op.drop_table('unread_counter')
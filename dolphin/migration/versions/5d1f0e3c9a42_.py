@@ -0,0 +1,33 @@
+"""Add chat_message_job table
+
+Revision ID: 5d1f0e3c9a42
+Revises: a3bf7dad2235
+Create Date: 2019-08-07 10:42:13.518204
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '5d1f0e3c9a42'
+down_revision = 'a3bf7dad2235'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'chat_message_job',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('room_id', sa.Integer(), nullable=True),
+        sa.Column('member_id', sa.Integer(), nullable=True),
+        sa.Column('messages', sa.JSON(), nullable=True),
+        sa.ForeignKeyConstraint(['id'], ['mule_task.id'], ),
+        sa.ForeignKeyConstraint(['member_id'], ['member.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade():
+    op.drop_table('chat_message_job')
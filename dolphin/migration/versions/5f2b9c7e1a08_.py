@@ -0,0 +1,34 @@
+"""Add chat_membership_job table
+
+Revision ID: 5f2b9c7e1a08
+Revises: e4a81f6c2d35
+Create Date: 2019-08-27 11:22:39.184650
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '5f2b9c7e1a08'
+down_revision = 'e4a81f6c2d35'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'chat_membership_job',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('member_id', sa.Integer(), nullable=True),
+        sa.Column('subscribable_id', sa.Integer(), nullable=True),
+        sa.Column('attempt', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['id'], ['mule_task.id'], ),
+        sa.ForeignKeyConstraint(['member_id'], ['member.id'], ),
+        sa.ForeignKeyConstraint(['subscribable_id'], ['subscribable.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade():
+    op.drop_table('chat_membership_job')
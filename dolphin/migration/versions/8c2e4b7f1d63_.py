@@ -0,0 +1,50 @@
+"""Add trigram and full-text search indexes
+
+Revision ID: 8c2e4b7f1d63
+Revises: 5d1f0e3c9a42
+Create Date: 2019-08-10 14:05:37.902311
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '8c2e4b7f1d63'
+down_revision = '5d1f0e3c9a42'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.execute(
+        'CREATE INDEX ix_subscribable_title_trgm ON subscribable '
+        'USING gin (title gin_trgm_ops)'
+    )
+    op.execute(
+        'CREATE INDEX ix_subscribable_description_tsvector ON subscribable '
+        'USING gin (to_tsvector(\'simple\', description))'
+    )
+    op.execute(
+        'CREATE INDEX ix_member_title_trgm ON member '
+        'USING gin (title gin_trgm_ops)'
+    )
+    op.execute(
+        'CREATE INDEX ix_member_first_name_trgm ON member '
+        'USING gin (first_name gin_trgm_ops)'
+    )
+    op.execute(
+        'CREATE INDEX ix_member_last_name_trgm ON member '
+        'USING gin (last_name gin_trgm_ops)'
+    )
+
+
+def downgrade():
+    op.drop_index('ix_member_last_name_trgm', table_name='member')
+    op.drop_index('ix_member_first_name_trgm', table_name='member')
+    op.drop_index('ix_member_title_trgm', table_name='member')
+    op.drop_index(
+        'ix_subscribable_description_tsvector',
+        table_name='subscribable'
+    )
+    op.drop_index('ix_subscribable_title_trgm', table_name='subscribable')
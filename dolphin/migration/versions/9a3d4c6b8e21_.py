@@ -0,0 +1,58 @@
+"""Add chat_room_member and chat_reconciliation_job tables
+
+Revision ID: 9a3d4c6b8e21
+Revises: 5f2b9c7e1a08
+Create Date: 2019-08-31 09:47:15.602318
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '9a3d4c6b8e21'
+down_revision = '5f2b9c7e1a08'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'chat_room_member',
+        sa.Column('subscribable_id', sa.Integer(), nullable=False),
+        sa.Column('member_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['member_id'], ['member.id'], ),
+        sa.ForeignKeyConstraint(['subscribable_id'], ['subscribable.id'], ),
+        sa.PrimaryKeyConstraint('subscribable_id', 'member_id')
+    )
+    op.create_table(
+        'chat_reconciliation_job',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('missing', sa.Integer(), nullable=True),
+        sa.Column('extra', sa.Integer(), nullable=True),
+        sa.Column('added', sa.Integer(), nullable=True),
+        sa.Column('kicked', sa.Integer(), nullable=True),
+        sa.Column('failed', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['id'], ['mule_task.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+    # The subscribers of the existing rooms were added to them by the
+    # subscriptions, so they are not added again by the first
+    # reconciliation.
+    op.execute('''
+        INSERT INTO chat_room_member (subscribable_id, member_id)
+        SELECT subscription.subscribable_id, subscription.member_id
+        FROM subscription
+        WHERE subscription.one_shot IS NULL
+          AND subscription.subscribable_id IN (
+            SELECT id FROM issue WHERE room_id IS NOT NULL
+            UNION
+            SELECT id FROM project WHERE room_id IS NOT NULL
+          )
+    ''')
+
+
+def downgrade():
+    op.drop_table('chat_reconciliation_job')
+    op.drop_table('chat_room_member')
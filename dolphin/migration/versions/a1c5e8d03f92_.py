@@ -0,0 +1,63 @@
+"""Add change table
+
+Revision ID: a1c5e8d03f92
+Revises: 3b9d6f1e2a47
+Create Date: 2019-08-17 11:23:09.417205
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'a1c5e8d03f92'
+down_revision = '3b9d6f1e2a47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'change',
+        sa.Column('id', sa.BigInteger(), nullable=False),
+        sa.Column(
+            'created_at',
+            sa.DateTime(),
+            server_default=sa.text('now()'),
+            nullable=False
+        ),
+        sa.Column(
+            'entity',
+            sa.Enum('issue', 'item', 'subscription', name='change_entity'),
+            nullable=True
+        ),
+        sa.Column('entity_id', sa.Integer(), nullable=True),
+        sa.Column(
+            'action',
+            sa.Enum('create', 'update', 'delete', name='change_action'),
+            nullable=True
+        ),
+        sa.Column('subscribable_id', sa.Integer(), nullable=True),
+        sa.Column('member_id', sa.Integer(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_change_subscribable_id',
+        'change',
+        ['subscribable_id'],
+        unique=False
+    )
+    op.create_index(
+        'ix_change_member_id',
+        'change',
+        ['member_id'],
+        unique=False
+    )
+
+
+def downgrade():
+    op.drop_index('ix_change_member_id', table_name='change')
+    op.drop_index('ix_change_subscribable_id', table_name='change')
+    op.drop_table('change')
+    sa.Enum(name='change_action').drop(op.get_bind(), checkfirst=False)
+    sa.Enum(name='change_entity').drop(op.get_bind(), checkfirst=False)
@@ -0,0 +1,41 @@
+"""Add issue_rollup table
+
+Revision ID: a3bf7dad2235
+Revises: 1c26290cdc15
+Create Date: 2019-08-05 11:20:41.331502
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+from dolphin.models import IssueRollup
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3bf7dad2235'
+down_revision = '1c26290cdc15'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'issue_rollup',
+        sa.Column('issue_id', sa.Integer(), nullable=False),
+        sa.Column('due_date', sa.DateTime(), nullable=True),
+        sa.Column('is_done', sa.Boolean(), nullable=True),
+        sa.Column('phase_id', sa.Integer(), nullable=True),
+        sa.Column('need_estimated_phase_id', sa.Integer(), nullable=True),
+        sa.Column('status', sa.Unicode(length=20), nullable=False),
+        sa.ForeignKeyConstraint(
+            ['issue_id'],
+            ['issue.id'],
+            ondelete='CASCADE'
+        ),
+        sa.PrimaryKeyConstraint('issue_id')
+    )
+    op.execute(IssueRollup.create_refresh_statement())
+
+
+def downgrade():
+    op.drop_table('issue_rollup')
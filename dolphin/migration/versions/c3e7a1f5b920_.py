@@ -0,0 +1,32 @@
+"""Add transaction_id to change
+
+Revision ID: c3e7a1f5b920
+Revises: 9a3d4c6b8e21
+Create Date: 2019-09-03 10:14:52.318407
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3e7a1f5b920'
+down_revision = '9a3d4c6b8e21'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        'change',
+        sa.Column(
+            'transaction_id',
+            sa.BigInteger(),
+            server_default=sa.text('txid_current()'),
+            nullable=False
+        )
+    )
+
+
+def downgrade():
+    op.drop_column('change', 'transaction_id')
@@ -0,0 +1,36 @@
+"""Add room_provisioning_job table and make issue.room_id nullable
+
+Revision ID: c7d2e5a90f14
+Revises: a1c5e8d03f92
+Create Date: 2019-08-19 10:14:52.318406
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7d2e5a90f14'
+down_revision = 'a1c5e8d03f92'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.alter_column('issue', 'room_id', existing_type=sa.Integer(),
+                    nullable=True)
+    op.create_table(
+        'room_provisioning_job',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('member_id', sa.Integer(), nullable=True),
+        sa.Column('subscribable_ids', sa.JSON(), nullable=True),
+        sa.ForeignKeyConstraint(['id'], ['mule_task.id'], ),
+        sa.ForeignKeyConstraint(['member_id'], ['member.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade():
+    op.drop_table('room_provisioning_job')
+    op.alter_column('issue', 'room_id', existing_type=sa.Integer(),
+                    nullable=False)
@@ -0,0 +1,45 @@
+"""Add item_rollup table
+
+Revision ID: e4a7c2d91b58
+Revises: 8c2e4b7f1d63
+Create Date: 2019-08-12 10:42:17.204836
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+from dolphin.models import ItemRollup
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4a7c2d91b58'
+down_revision = '8c2e4b7f1d63'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'item_rollup',
+        sa.Column('item_id', sa.Integer(), nullable=False),
+        sa.Column('hours', sa.Float(), nullable=False),
+        sa.Column('reports', sa.Integer(), nullable=False),
+        sa.Column('last_report_date', sa.Date(), nullable=True),
+        sa.Column(
+            'report_dates',
+            postgresql.ARRAY(sa.Date()),
+            nullable=False
+        ),
+        sa.ForeignKeyConstraint(
+            ['item_id'],
+            ['item.id'],
+            ondelete='CASCADE'
+        ),
+        sa.PrimaryKeyConstraint('item_id')
+    )
+    op.execute(ItemRollup.create_refresh_statement())
+
+
+def downgrade():
+    op.drop_table('item_rollup')
@@ -0,0 +1,31 @@
+"""Add room_provisioning_job.attempt and make project.room_id nullable
+
+Revision ID: e4a81f6c2d35
+Revises: c7d2e5a90f14
+Create Date: 2019-08-24 16:41:07.530912
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4a81f6c2d35'
+down_revision = 'c7d2e5a90f14'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        'room_provisioning_job',
+        sa.Column('attempt', sa.Integer(), nullable=True)
+    )
+    op.alter_column('project', 'room_id', existing_type=sa.Integer(),
+                    nullable=True)
+
+
+def downgrade():
+    op.alter_column('project', 'room_id', existing_type=sa.Integer(),
+                    nullable=False)
+    op.drop_column('room_provisioning_job', 'attempt')
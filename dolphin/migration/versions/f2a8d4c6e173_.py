@@ -0,0 +1,27 @@
+"""Add attempt to chat_message_job
+
+Revision ID: f2a8d4c6e173
+Revises: c3e7a1f5b920
+Create Date: 2019-09-04 09:31:26.740915
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2a8d4c6e173'
+down_revision = 'c3e7a1f5b920'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        'chat_message_job',
+        sa.Column('attempt', sa.Integer(), nullable=True)
+    )
+
+
+def downgrade():
+    op.drop_column('chat_message_job', 'attempt')
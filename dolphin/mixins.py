@@ -1,9 +1,41 @@
-from nanohttp import context
-from restfulpy.orm import ModifiedMixin, Field
-from sqlalchemy import Integer
+import base64
+import binascii
+import hashlib
+import json
+from datetime import datetime, timezone
+from email.utils import formatdate, parsedate_to_datetime
+
+from nanohttp import context, HTTPBadRequest
+from restfulpy.orm import ModifiedMixin, Field, PaginationMixin, DBSession
+from sqlalchemy import Integer, and_, or_, false, nullsfirst, nullslast, func
 from sqlalchemy.events import event
+from sqlalchemy.inspection import inspect
+from sqlalchemy.orm import Load
+
+from .exceptions import StatusMalformedCursor, StatusInvalidCursorSortKey, \
+    StatusInvalidFieldset, StatusNotModified
+
+
+def match_etag(if_none_match, etag):
+    """Whether the ``If-None-Match`` header matches the ``etag``, by the weak
+    comparison of RFC 7232, section 2.3.2.
+
+    """
+    candidates = [t.strip() for t in if_none_match.split(',')]
+    if '*' in candidates:
+        return True
+
+    opaque = etag[2:] if etag.startswith('W/') else etag
+    return any(
+        (t[2:] if t.startswith('W/') else t) == opaque
+        for t in candidates
+    )
 
-from .models import Member
+
+def get_current_member_id():
+    # The models are imported lazily, because they import this module
+    from .models import Member
+    return Member.current().id
 
 
 class ModifiedByMixin(ModifiedMixin):
@@ -54,10 +86,380 @@ class CreatedByMixin:
         not_none=True,
         required=False,
         protected=False,
-        default=lambda: Member.current().id,
+        default=get_current_member_id,
         label='Creator',
         example='Lorem Ipsum',
         message='Lorem Ipsum',
         watermark='Lorem Ipsum',
     )
 
+
+class KeysetPaginationMixin(PaginationMixin):
+    """Cursor pagination, enabled by the ``cursor`` query string field.
+
+    The rows are ordered by the keys of the ``sort`` field, which must be in
+    ``get_cursor_sort_columns``, then by the primary key. A page starts right
+    after the keys of the previous page's last row instead of skipping the
+    rows before it, so the deep pages are as cheap as the first one. The
+    cursor of the next page is given by the ``X-Pagination-Next`` header and
+    an empty cursor requests the first page.
+
+    """
+
+    __cursor_key__ = 'cursor'
+    __next_cursor_header_key__ = 'X-Pagination-Next'
+
+    @classmethod
+    def get_cursor_sort_columns(cls):
+        return dict(id=cls.id)
+
+    @classmethod
+    def paginate_by_request(cls, query):
+        if cls.__cursor_key__ not in context.query:
+            return super().paginate_by_request(query)
+
+        try:
+            take = int(
+                context.query.get('take') \
+                or context.environ.get(cls.__take_header_key__) \
+                or cls.__max_take__
+            )
+        except ValueError:
+            raise HTTPBadRequest()
+
+        if take > cls.__max_take__ or take < 1:
+            raise HTTPBadRequest()
+
+        keys = cls._get_cursor_keys()
+        values = cls._decode_cursor(context.query[cls.__cursor_key__])
+        if values is not None:
+            if len(values) != len(keys):
+                raise StatusMalformedCursor()
+
+            query = query.filter(cls._create_cursor_condition(keys, values))
+
+        query = query.order_by(None).order_by(*(
+            nullsfirst(column.desc()) if descending else nullslast(column)
+            for column, descending in keys
+        ))
+
+        # Only the keys of the page are fetched here, one more row tells
+        # whether there is a next page without counting the whole result.
+        key_rows = query \
+            .with_entities(*(column for column, descending in keys)) \
+            .limit(take + 1) \
+            .all()
+
+        context.response_headers.add_header('X-Pagination-Take', str(take))
+        if len(key_rows) > take:
+            context.response_headers.add_header(
+                cls.__next_cursor_header_key__,
+                cls._encode_cursor(key_rows[take - 1])
+            )
+
+        return query.limit(take)
+
+    @classmethod
+    def _get_cursor_keys(cls):
+        sort_columns = cls.get_cursor_sort_columns()
+        sorting_expression = context.query.get('sort', '').strip()
+
+        keys = []
+        names = set()
+        for name in sorting_expression.split(','):
+            name = name.strip()
+            if not name:
+                continue
+
+            descending = name.startswith('-')
+            name = name.lstrip('-')
+            if name not in sort_columns:
+                raise StatusInvalidCursorSortKey()
+
+            if name not in names:
+                names.add(name)
+                keys.append((sort_columns[name], descending))
+
+        if 'id' not in names:
+            keys.append((cls.id, False))
+
+        return keys
+
+    @staticmethod
+    def _create_cursor_condition(keys, values):
+        conditions = []
+        equalities = []
+        for (column, descending), value in zip(keys, values):
+            # The nulls are last when ascending and first when descending,
+            # the same as `OrderingMixin`.
+            if not descending:
+                after = false() if value is None \
+                    else or_(column > value, column.is_(None))
+
+            else:
+                after = column.isnot(None) if value is None \
+                    else column < value
+
+            conditions.append(and_(*equalities, after))
+            equalities.append(
+                column.is_(None) if value is None else column == value
+            )
+
+        return or_(*conditions)
+
+    @staticmethod
+    def _encode_cursor(values):
+        cursor = json.dumps(list(values), default=str).encode()
+        return base64.urlsafe_b64encode(cursor).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor):
+        if not cursor:
+            return None
+
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+
+        except (binascii.Error, ValueError):
+            raise StatusMalformedCursor()
+
+        if not isinstance(values, list):
+            raise StatusMalformedCursor()
+
+        return values
+
+
+class FieldsetMixin:
+    """Exports a chosen subset of the JSON fields of a model.
+
+    The fields are the JSON columns, except the relationships, and the
+    keys of ``__computed_fields__``, which maps the fields that ``to_dict``
+    computes to the methods computing them. Only the chosen fields are read
+    or computed.
+
+    The ``fields`` query string field chooses them for the list endpoints,
+    and only the columns they need are selected, see
+    ``create_fieldset_loading_options``.
+
+    """
+
+    __fieldset_key__ = 'fields'
+    __computed_fields__ = {}
+
+    # Maps the fields to the attributes, columns or relationships, they are
+    # computed from, other than their own column.
+    __fieldset_dependencies__ = {}
+
+    @classmethod
+    def get_fieldset_columns(cls):
+        if '_fieldset_columns' not in cls.__dict__:
+            cls._fieldset_columns = {
+                cls.get_column_info(c)['json']: c
+                for c in cls.iter_json_columns(relationships=False)
+            }
+
+        return cls._fieldset_columns
+
+    @classmethod
+    def get_fieldset(cls):
+        if cls.__fieldset_key__ not in context.query:
+            return None
+
+        return cls.parse_fieldset(context.query[cls.__fieldset_key__])
+
+    @classmethod
+    def parse_fieldset(cls, expression):
+        fields = []
+        for name in expression.split(','):
+            name = name.strip()
+            if name and name not in fields:
+                fields.append(name)
+
+        for name in fields:
+            if name not in cls.__computed_fields__ \
+                    and name not in cls.get_fieldset_columns():
+                raise StatusInvalidFieldset()
+
+        return fields
+
+    def to_fieldset_dict(self, fields):
+        columns = self.get_fieldset_columns()
+        result = {}
+        for name in fields:
+            if name in self.__computed_fields__:
+                result[name] = getattr(self, self.__computed_fields__[name])()
+
+            else:
+                column = columns[name]
+                result.setdefault(
+                    *self.prepare_for_export(column, getattr(self, column.key))
+                )
+
+        return result
+
+    @classmethod
+    def create_fieldset_loading_options(cls, fields, loader):
+        mapper = inspect(cls)
+        columns = cls.get_fieldset_columns()
+        keys = set(mapper.get_property_by_column(c).key
+                   for c in mapper.primary_key)
+        if mapper.polymorphic_on is not None:
+            keys.add(mapper.get_property_by_column(mapper.polymorphic_on).key)
+
+        relationships = set()
+        for name in fields:
+            attributes = list(cls.__fieldset_dependencies__.get(name, []))
+            if name in columns:
+                attributes.append(columns[name].key)
+
+            for key in attributes:
+                if key in mapper.relationships:
+                    relationships.add(key)
+                    # The foreign keys are needed to load the relationship
+                    keys.update(
+                        mapper.get_property_by_column(c).key
+                        for c in mapper.relationships[key].local_columns
+                    )
+
+                elif key in mapper.column_attrs:
+                    keys.add(key)
+
+        # The eager relationships are loaded only if a field needs them
+        return [
+            loader.load_only(*sorted(keys)),
+            loader.lazyload('*'),
+            *(loader.selectinload(key) for key in sorted(relationships)),
+        ]
+
+    @classmethod
+    def dump_query(cls, query=None):
+        fields = cls.get_fieldset()
+        if fields is None:
+            return super().dump_query(query)
+
+        query = cls.filter_paginate_sort_query_by_request(query).options(
+            *cls.create_fieldset_loading_options(fields, Load(cls))
+        )
+        return [o.to_fieldset_dict(fields) for o in query]
+
+
+class ConditionalMixin:
+    """Conditional requests, validated by the ``ETag`` and
+    ``Last-Modified`` headers.
+
+    The validators are aggregates of the probed rows, the latest
+    ``modified_at`` and the count by default, plus the ones
+    ``get_validator_columns`` adds, so a ``304 Not Modified`` is answered
+    by a single cheap query, before the rows and their column properties
+    are loaded. The probe of a collection is an aggregate of the same
+    filtered rows which the offset pagination counts.
+
+    The tags are weak, because the representations embed the computed and
+    the per member fields, and they are computed from the member and the
+    query string too. ``If-Modified-Since`` is honored only for a single
+    row, the deletions of the rows of a list do not advance its latest
+    modification.
+
+    """
+
+    __conditional_methods__ = ('get', 'list')
+
+    @classmethod
+    def get_modified_column(cls):
+        return func.coalesce(cls.modified_at, cls.created_at)
+
+    @classmethod
+    def get_validator_columns(cls, rows):
+        """Returns the aggregates which validate the representations of the
+        ``rows``, a CTE of the ``id`` and ``modified_at`` of the probed
+        rows.
+
+        """
+        return [func.max(rows.c.modified_at), func.count(rows.c.id)]
+
+    @classmethod
+    def probe_validators(cls, query):
+        rows = query \
+            .enable_eagerloads(False) \
+            .order_by(None) \
+            .with_entities(
+                cls.id.label('id'),
+                cls.get_modified_column().label('modified_at')
+            ) \
+            .cte('conditional_rows')
+        return DBSession.query(*cls.get_validator_columns(rows)).one()
+
+    @classmethod
+    def validate_conditional_request(cls, query, collection=True):
+        """Sets the validators of the representation of the ``query`` and
+        raises ``304 Not Modified`` when the client's copy is still valid.
+
+        """
+        if context.method not in cls.__conditional_methods__:
+            return
+
+        validators = cls.probe_validators(query)
+        if not collection and not validators[1]:
+            # The handler raises the not found
+            return
+
+        identity = context.identity
+        digest = hashlib.md5(json.dumps(
+            [
+                cls.__tablename__,
+                identity.id if identity else None,
+                context.environ.get('QUERY_STRING', ''),
+                *validators,
+            ],
+            default=str
+        ).encode()).hexdigest()
+        etag = f'W/"{digest}"'
+
+        last_modified = max(
+            (v for v in validators if isinstance(v, datetime)),
+            default=None
+        )
+
+        context.response_headers.add_header('ETag', etag)
+        context.response_headers.add_header(
+            'Cache-Control',
+            'private, no-cache'
+        )
+        if not collection and last_modified is not None:
+            context.response_headers.add_header(
+                'Last-Modified',
+                formatdate(
+                    last_modified.replace(tzinfo=timezone.utc).timestamp(),
+                    usegmt=True
+                )
+            )
+
+        if_none_match = context.environ.get('HTTP_IF_NONE_MATCH')
+        if if_none_match is not None:
+            if match_etag(if_none_match, etag):
+                raise StatusNotModified()
+
+            return
+
+        if_modified_since = context.environ.get('HTTP_IF_MODIFIED_SINCE')
+        if collection or last_modified is None or not if_modified_since:
+            return
+
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+
+        except (TypeError, ValueError):
+            # An invalid date is ignored, RFC 7232, section 3.3
+            return
+
+        if since.tzinfo is not None:
+            since = since.astimezone(timezone.utc).replace(tzinfo=None)
+
+        if last_modified.replace(microsecond=0) <= since:
+            raise StatusNotModified()
+
+    @classmethod
+    def filter_paginate_sort_query_by_request(cls, query=None):
+        query = cls.filter_by_request(query or cls.query)
+        cls.validate_conditional_request(query)
+        return cls.paginate_by_request(query=cls.sort_by_request(query))
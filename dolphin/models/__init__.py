@@ -26,5 +26,14 @@ from .admin import Admin
 from .phase_summary import AbstractPhaseSummaryView
 from .resource_summary import AbstractResourceSummaryView
 from .issue_phase import IssuePhase
+from .issue_rollup import IssueRollup
+from .item_rollup import ItemRollup
+from .unread_counter import UnreadCounter
+from .change import Change
 from .returntotriagejob import ReturnToTriageJob
+from .chatmessagejob import ChatMessageJob
+from .roomprovisioningjob import RoomProvisioningJob
+from .chatroommember import ChatRoomMember
+from .chatmembershipjob import ChatMembershipJob
+from .chatreconciliationjob import ChatReconciliationJob
 from .skill import Skill
@@ -7,6 +7,8 @@ from sqlalchemy import Integer, ForeignKey, DateTime, Unicode, func, \
     CheckConstraint
 from sqlalchemy.ext.hybrid import hybrid_property
 
+from ..mixins import FieldsetMixin
+
 
 DESCRIPTION_LENGTH = 256
 ISO_FORMAT = '%Y-%m-%dT%H:%M:%S.%f'
@@ -17,7 +19,7 @@ def iso_to_datetime(iso_string):
 
 
 class Activity(ModifiedMixin, TimestampMixin, FilteringMixin, OrderingMixin,
-               DeclarativeBase):
+               FieldsetMixin, DeclarativeBase):
 
     __tablename__ = 'activity'
 
@@ -83,6 +85,8 @@ class Activity(ModifiedMixin, TimestampMixin, FilteringMixin, OrderingMixin,
         readonly=True,
     )
 
+    __fieldset_dependencies__ = dict(timeSpan=['start_time', 'end_time'])
+
     @hybrid_property
     def time_span(self):
         try:
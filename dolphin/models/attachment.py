@@ -8,6 +8,7 @@ from sqlalchemy_media.constants import KB
 from sqlalchemy_media.exceptions import ContentTypeValidationError, \
     MaximumLengthIsReachedError
 
+from ..mixins import FieldsetMixin
 from .member import Member
 
 
@@ -55,7 +56,8 @@ class FileAttachment(File):
 
 
 class Attachment(SoftDeleteMixin, FilteringMixin, OrderingMixin,
-                 PaginationMixin, TimestampMixin, DeclarativeBase):
+                 PaginationMixin, TimestampMixin, FieldsetMixin,
+                 DeclarativeBase):
     __tablename__ = 'attachment'
 
     project_id = Field(
@@ -149,16 +151,28 @@ class Attachment(SoftDeleteMixin, FilteringMixin, OrderingMixin,
         else:
             self._file = None
 
+    __computed_fields__ = dict(isMine='_export_is_mine', file='_export_file')
+    __fieldset_dependencies__ = dict(
+        isMine=['sender_id'],
+        file=['title', '_file', 'removed_at'],
+    )
+
+    def _export_is_mine(self):
+        return self.is_mine
+
+    def _export_file(self):
+        return dict(
+            title=self.title,
+            url=self.file.locate() \
+            if self.file and not self.is_deleted else None,
+            mymetype=self.file.content_type
+        )
+
     def to_dict(self):
         attachment_dictionary = super().to_dict()
         attachment_dictionary.update(
-            isMine=self.is_mine,
-            file=dict(
-                title=self.title,
-                url=self.file.locate() \
-                if self.file and not self.is_deleted else None,
-                mymetype=self.file.content_type
-            )
+            isMine=self._export_is_mine(),
+            file=self._export_file(),
         )
         return attachment_dictionary
 
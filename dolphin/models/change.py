@@ -0,0 +1,270 @@
+from itertools import chain
+
+from nanohttp import settings
+from restfulpy.orm import Field, DeclarativeBase, DBSession
+from sqlalchemy import Integer, BigInteger, Enum, DateTime, Index, select, \
+    func, insert, delete, or_, and_, join, cast
+from sqlalchemy.event import listens_for
+from sqlalchemy.orm import Session
+
+from ..changefeed import change_bus
+from .dailyreport import Dailyreport
+from .issue import Issue
+from .issue_phase import IssuePhase
+from .item import Item
+from .subscribable import Subscription
+
+
+change_entities = [
+    'issue',
+    'item',
+    'subscription',
+]
+
+
+change_actions = [
+    'create',
+    'update',
+    'delete',
+]
+
+
+class Change(DeclarativeBase):
+    """An append only log of the changes of issues, items and subscriptions,
+    which feeds the long polling change feed.
+
+    A change is delivered to the members subscribed to its subscribable, or
+    only to its member, when it has one.
+
+    """
+
+    __tablename__ = 'change'
+    __table_args__ = (
+        Index('ix_change_subscribable_id', 'subscribable_id'),
+        Index('ix_change_member_id', 'member_id'),
+    )
+
+    id = Field(BigInteger, primary_key=True, readonly=True, label='ID')
+    created_at = Field(
+        DateTime,
+        nullable=False,
+        server_default=func.now(),
+        readonly=True,
+        label='Created At',
+    )
+    entity = Field(
+        Enum(*change_entities, name='change_entity'),
+        python_type=str,
+        readonly=True,
+        label='Entity',
+    )
+    entity_id = Field(Integer, readonly=True, label='Entity ID')
+    action = Field(
+        Enum(*change_actions, name='change_action'),
+        python_type=str,
+        readonly=True,
+        label='Action',
+    )
+    subscribable_id = Field(
+        Integer,
+        nullable=True,
+        readonly=True,
+        label='Subscribable ID',
+    )
+    member_id = Field(Integer, nullable=True, readonly=True, label='Member')
+
+    # The ids are taken when the changes are flushed, but they are committed
+    # in any order, so only the changes of the transactions older than every
+    # running one are delivered, the cursor does not skip the others.
+    transaction_id = Field(
+        BigInteger,
+        nullable=False,
+        server_default=func.txid_current(),
+        readonly=True,
+        protected=True,
+        label='Transaction ID',
+    )
+
+    @classmethod
+    def record(cls, session, changes):
+        """Inserts the changes and notifies the listeners of the change feed
+        channel, when the transaction is committed.
+
+        """
+        if not changes:
+            return
+
+        session.execute(insert(cls.__table__), changes)
+        session.execute(
+            select([func.pg_notify(settings.changefeed.channel, '')])
+        )
+        session.info['changefeed_changes'] = True
+
+    @classmethod
+    def create_settled_condition(cls):
+        """Whether a change is committed, or rolled back, along with the
+        changes which are flushed before it.
+
+        The transaction has written the flushed rows when its changes are
+        recorded, so its id is taken before the ids of its changes.
+
+        """
+        return cls.transaction_id < func.txid_snapshot_xmin(
+            func.txid_current_snapshot()
+        )
+
+    @classmethod
+    def create_member_query(cls, member_id, after):
+        subscribables = select([Subscription.subscribable_id]) \
+            .where(Subscription.member_id == member_id)
+        return DBSession.query(cls) \
+            .filter(cls.id > after) \
+            .filter(cls.create_settled_condition()) \
+            .filter(or_(
+                cls.member_id == member_id,
+                and_(
+                    cls.member_id.is_(None),
+                    cls.subscribable_id.in_(subscribables)
+                )
+            )) \
+            .order_by(cls.id)
+
+    @classmethod
+    def get_last_id(cls):
+        return DBSession.query(func.coalesce(func.max(cls.id), 0)) \
+            .filter(cls.create_settled_condition()) \
+            .scalar()
+
+    @classmethod
+    def create_validator_columns(cls, subscribable_ids):
+        """Returns the count and the latest time of the changes of the
+        subscribables, which validate the cached representations of them.
+
+        The count catches the changes committed out of order, and the time
+        is in UTC, like the timestamps of the models.
+
+        """
+        condition = cls.subscribable_id.in_(subscribable_ids)
+        created_at = func.timezone(
+            'UTC',
+            cast(cls.created_at, DateTime(timezone=True))
+        )
+        return [
+            select([func.count(cls.id)])
+            .where(condition)
+            .correlate(None)
+            .as_scalar(),
+            select([func.max(created_at)])
+            .where(condition)
+            .correlate(None)
+            .as_scalar(),
+        ]
+
+    @classmethod
+    def purge(cls, before):
+        return DBSession.execute(
+            delete(cls.__table__).where(cls.created_at < before)
+        ).rowcount
+
+
+def get_action(session, instance):
+    if instance in session.new:
+        return 'create'
+
+    if instance in session.deleted:
+        return 'delete'
+
+    if session.is_modified(instance):
+        return 'update'
+
+    return None
+
+
+@listens_for(Session, 'after_flush')
+def record_changes(session, flush_context):
+    changes = []
+    items = []
+    reported_item_ids = set()
+    for instance in chain(session.new, session.dirty, session.deleted):
+        # A daily report changes the rollups of its item and issue
+        if isinstance(instance, Dailyreport):
+            reported_item_ids.add(instance.item_id)
+            continue
+
+        if not isinstance(instance, (Issue, Item, Subscription)):
+            continue
+
+        action = get_action(session, instance)
+        if action is None:
+            continue
+
+        if isinstance(instance, Issue):
+            changes.append(dict(
+                entity='issue',
+                entity_id=instance.id,
+                action=action,
+                subscribable_id=instance.id,
+                member_id=None,
+            ))
+
+        elif isinstance(instance, Item):
+            items.append((instance, action))
+
+        else:
+            changes.append(dict(
+                entity='subscription',
+                entity_id=instance.id,
+                action=action,
+                subscribable_id=instance.subscribable_id,
+                member_id=instance.member_id,
+            ))
+
+    if items:
+        issue_phase_ids = set(item.issue_phase_id for item, _ in items)
+        issue_ids = dict(session.execute(
+            select([IssuePhase.id, IssuePhase.issue_id])
+            .where(IssuePhase.id.in_(issue_phase_ids))
+        ).fetchall())
+        changes.extend(
+            dict(
+                entity='item',
+                entity_id=item.id,
+                action=action,
+                subscribable_id=issue_ids.get(item.issue_phase_id),
+                member_id=None,
+            )
+            for item, action in items
+        )
+
+    reported_item_ids.difference_update(item.id for item, _ in items)
+    reported_item_ids.discard(None)
+    if reported_item_ids:
+        changes.extend(
+            dict(
+                entity='item',
+                entity_id=item_id,
+                action='update',
+                subscribable_id=issue_id,
+                member_id=None,
+            )
+            for item_id, issue_id in session.execute(
+                select([Item.id, IssuePhase.issue_id])
+                .select_from(
+                    join(Item, IssuePhase, Item.issue_phase_id == IssuePhase.id)
+                )
+                .where(Item.id.in_(reported_item_ids))
+            )
+        )
+
+    Change.record(session, changes)
+
+
+@listens_for(Session, 'after_commit')
+def publish_changes(session):
+    if session.info.pop('changefeed_changes', False):
+        change_bus.publish()
+
+
+@listens_for(Session, 'after_soft_rollback')
+def discard_changes(session, previous_transaction):
+    session.info.pop('changefeed_changes', None)
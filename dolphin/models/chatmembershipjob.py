@@ -0,0 +1,169 @@
+from datetime import datetime, timedelta
+
+from nanohttp import HTTPStatus, settings
+from restfulpy import logger
+from restfulpy.mule import MuleTask
+from restfulpy.orm import Field
+from sqlalchemy import Integer, ForeignKey, exists, and_
+from sqlalchemy.orm.session import object_session
+
+from ..backends import ChatClient
+from ..exceptions import StatusRoomMemberAlreadyExist, \
+    StatusRoomMemberNotFound, StatusChatServerNotAvailable, \
+    StatusChatInternallError, StatusChatRequestRejected
+from .chatroommember import ChatRoomMember
+from .member import Member
+from .roomprovisioningjob import RoomProvisioningJob
+from .subscribable import Subscribable, Subscription
+
+
+class ChatMembershipJob(MuleTask):
+    """Reconciliation queue of the chat membership of the members.
+
+    The subscriptions are committed without waiting for the chat server,
+    then this job adds the member to the room of the subscribable, or
+    kicks them, by whether they are subscribed when the job is done. So the
+    jobs of a member may be done in any order. A job without subscribable
+    ensures the member on the chat server.
+
+    The jobs failed by the chat server being down, slow or rejected by the
+    circuit breaker are retried like the rooms of ``RoomProvisioningJob``,
+    the definitive answers, e.g. ``401``, ``403`` and ``404``, are logged
+    and not retried.
+
+    """
+
+    __tablename__ = 'chat_membership_job'
+    __mapper_args__ = {'polymorphic_identity': __tablename__}
+
+    id = Field(
+        Integer,
+        ForeignKey('mule_task.id'),
+        primary_key=True,
+        readonly=True,
+        not_none=True,
+        required=False,
+        label='ID',
+        minimum=1,
+        example=1,
+        protected=False,
+    )
+    member_id = Field(Integer, ForeignKey('member.id'), readonly=True)
+    subscribable_id = Field(
+        Integer,
+        ForeignKey('subscribable.id'),
+        readonly=True,
+        nullable=True,
+    )
+    attempt = Field(Integer, default=0, readonly=True)
+
+    @classmethod
+    def enqueue(cls, session, member_id, subscribable_id=None, at=None,
+                attempt=0):
+        session.add(cls(
+            member_id=member_id,
+            subscribable_id=subscribable_id,
+            attempt=attempt,
+            at=at or datetime.now(),
+        ))
+
+    def do_(self, context):
+        session = object_session(self)
+        member = session.query(Member).get(self.member_id)
+        if member is None:
+            logger.error(
+                f'Member {self.member_id} is not found, giving up '
+                f'the chat membership in subscribable {self.subscribable_id}'
+            )
+            return
+
+        token = member.create_jwt_principal().dump().decode()
+        chat_client = ChatClient()
+
+        try:
+            if self.subscribable_id is None:
+                chat_client.ensure_member(token, member.access_token)
+                return
+
+            # The subscribers of a pending room are added by
+            # `RoomProvisioningJob`
+            subscribable = session.query(Subscribable) \
+                .get(self.subscribable_id)
+            if subscribable.room_id is None:
+                return
+
+            is_subscribed = session.query(exists().where(and_(
+                Subscription.subscribable_id == self.subscribable_id,
+                Subscription.member_id == self.member_id,
+                Subscription.one_shot.is_(None),
+            ))).scalar()
+
+            if is_subscribed:
+                try:
+                    chat_client.add_member(
+                        subscribable.room_id,
+                        member.reference_id,
+                        token,
+                        member.access_token
+                    )
+
+                except StatusRoomMemberAlreadyExist:
+                    pass
+
+                ChatRoomMember.add(
+                    session,
+                    [(self.subscribable_id, self.member_id)]
+                )
+
+            else:
+                try:
+                    chat_client.kick_member(
+                        subscribable.room_id,
+                        member.reference_id,
+                        token,
+                        member.access_token
+                    )
+
+                except StatusRoomMemberNotFound:
+                    pass
+
+                ChatRoomMember.kick(
+                    session,
+                    [(self.subscribable_id, self.member_id)]
+                )
+
+        except StatusChatRequestRejected as ex:
+            logger.error(
+                f'The chat server has rejected the chat membership of member '
+                f'{self.member_id} in subscribable {self.subscribable_id}: '
+                f'{ex.status_code}'
+            )
+
+        except (StatusChatServerNotAvailable, StatusChatInternallError) as ex:
+            attempt = self.attempt + 1
+            if attempt >= settings.room_provisioning.max_attempts:
+                logger.error(
+                    f'Giving up the chat membership of member '
+                    f'{self.member_id} in subscribable '
+                    f'{self.subscribable_id}: {ex.status}'
+                )
+                return
+
+            self.enqueue(
+                session,
+                self.member_id,
+                self.subscribable_id,
+                at=datetime.now() + timedelta(
+                    seconds=RoomProvisioningJob.get_backoff(attempt)
+                ),
+                attempt=attempt,
+            )
+
+        except HTTPStatus as ex:
+            # The rest of the answers are definitive too, e.g. the room is
+            # not found
+            logger.error(
+                f'Cannot reconcile the chat membership of member '
+                f'{self.member_id} in subscribable {self.subscribable_id}: '
+                f'{ex.status}'
+            )
@@ -0,0 +1,110 @@
+from datetime import datetime, timedelta
+
+from nanohttp import HTTPStatus, settings
+from restfulpy import logger
+from restfulpy.mule import MuleTask
+from restfulpy.orm import Field
+from sqlalchemy import Integer, ForeignKey, JSON
+from sqlalchemy.orm.session import object_session
+
+from ..backends import ChatClient
+from ..exceptions import StatusChatServerNotAvailable, \
+    StatusChatInternallError, StatusChatRequestRejected
+from .member import Member
+from .roomprovisioningjob import RoomProvisioningJob
+
+
+AUDIT_LOG_MIMETYPE = 'application/x-auditlog'
+
+
+class ChatMessageJob(MuleTask):
+    """Outbox of the audit log messages of a request, one job per room.
+
+    The messages are sent by the mule worker in the same order they are
+    logged, so the request does not wait for the chat server.
+
+    When the chat server is down, slow or rejected by the circuit breaker,
+    the unsent messages are retried by another job, like the rooms of
+    ``RoomProvisioningJob``. The messages which are answered definitively,
+    e.g. the room is not found, are logged and dropped.
+
+    """
+
+    __tablename__ = 'chat_message_job'
+    __mapper_args__ = {'polymorphic_identity': __tablename__}
+
+    id = Field(
+        Integer,
+        ForeignKey('mule_task.id'),
+        primary_key=True,
+        readonly=True,
+        not_none=True,
+        required=False,
+        label='ID',
+        minimum=1,
+        example=1,
+        protected=False,
+    )
+    room_id = Field(Integer, readonly=True)
+    member_id = Field(Integer, ForeignKey('member.id'), readonly=True)
+    messages = Field(JSON, readonly=True)
+    attempt = Field(Integer, default=0, readonly=True)
+
+    def do_(self, context):
+        session = object_session(self)
+        member = session.query(Member).get(self.member_id)
+        if member is None:
+            logger.error(
+                f'Member {self.member_id} is not found, giving up '
+                f'the messages of room {self.room_id}'
+            )
+            return
+
+        token = member.create_jwt_principal().dump().decode()
+
+        chat_client = ChatClient()
+        for index, body in enumerate(self.messages):
+            try:
+                chat_client.send_message(
+                    room_id=self.room_id,
+                    body=body,
+                    mimetype=AUDIT_LOG_MIMETYPE,
+                    token=token,
+                    x_access_token=member.access_token,
+                )
+
+            except StatusChatRequestRejected as ex:
+                logger.error(
+                    f'The chat server has rejected a message of room '
+                    f'{self.room_id}: {ex.status_code}'
+                )
+
+            except (StatusChatServerNotAvailable, StatusChatInternallError) \
+                    as ex:
+                self.retry(session, self.messages[index:], ex)
+                return
+
+            except HTTPStatus as ex:
+                logger.error(
+                    f'Cannot send a message to room {self.room_id}: '
+                    f'{ex.status}'
+                )
+
+    def retry(self, session, messages, ex):
+        attempt = (self.attempt or 0) + 1
+        if attempt >= settings.room_provisioning.max_attempts:
+            logger.error(
+                f'Giving up {len(messages)} messages of room {self.room_id} '
+                f'after {attempt} attempts: {ex.status}'
+            )
+            return
+
+        session.add(ChatMessageJob(
+            room_id=self.room_id,
+            member_id=self.member_id,
+            messages=messages,
+            attempt=attempt,
+            at=datetime.now() + timedelta(
+                seconds=RoomProvisioningJob.get_backoff(attempt)
+            ),
+        ))
@@ -0,0 +1,169 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from nanohttp import HTTPStatus, settings
+from restfulpy import logger
+from restfulpy.mule import MuleTask
+from restfulpy.orm import Field
+from sqlalchemy import Integer, ForeignKey, select, func, exists, and_
+from sqlalchemy.orm.session import object_session
+
+from ..backends import ChatClient
+from ..exceptions import StatusRoomMemberAlreadyExist, \
+    StatusRoomMemberNotFound
+from .chatroommember import ChatRoomMember
+from .member import Member
+
+
+class ChatReconciliationJob(MuleTask):
+    """Periodically diffs the subscriptions against the chat room members,
+    then adds the missing members and kicks the extra ones.
+
+    At most ``chat_reconciliation.batch_size`` members of each kind are
+    fixed by a job, by at most ``chat_reconciliation.concurrency``
+    concurrent requests to the chat server. The drift which is found, and
+    the fixes, are kept by the job. The next one is scheduled
+    ``chat_reconciliation.interval`` seconds later before the work, so it
+    is scheduled even when this one fails.
+
+    """
+
+    __tablename__ = 'chat_reconciliation_job'
+    __mapper_args__ = {'polymorphic_identity': __tablename__}
+
+    id = Field(
+        Integer,
+        ForeignKey('mule_task.id'),
+        primary_key=True,
+        readonly=True,
+        not_none=True,
+        required=False,
+        label='ID',
+        minimum=1,
+        example=1,
+        protected=False,
+    )
+    missing = Field(Integer, nullable=True, readonly=True)
+    extra = Field(Integer, nullable=True, readonly=True)
+    added = Field(Integer, nullable=True, readonly=True)
+    kicked = Field(Integer, nullable=True, readonly=True)
+    failed = Field(Integer, nullable=True, readonly=True)
+
+    @classmethod
+    def schedule(cls, session, at=None):
+        """Adds the next job, unless one is already waiting."""
+        is_scheduled = session.query(exists().where(and_(
+            MuleTask.type == cls.__tablename__,
+            MuleTask.status == 'new',
+        ))).scalar()
+        if is_scheduled:
+            return None
+
+        job = cls(at=at or datetime.now())
+        session.add(job)
+        return job
+
+    def do_(self, context):
+        session = object_session(self)
+        chat_reconciliation = settings.chat_reconciliation
+        batch_size = chat_reconciliation.batch_size
+
+        # Scheduled and committed first, a failed job is rolled back, so
+        # it does not stop the next ones
+        self.schedule(
+            session,
+            at=datetime.now() + timedelta(
+                seconds=chat_reconciliation.interval
+            )
+        )
+        session.commit()
+
+        missing_query, extra_query = ChatRoomMember.create_drift_queries()
+        self.missing = count(session, missing_query)
+        self.extra = count(session, extra_query)
+
+        operations = [
+            ('add', ) + tuple(row)
+            for row in session.execute(missing_query.limit(batch_size))
+        ] + [
+            ('kick', ) + tuple(row)
+            for row in session.execute(extra_query.limit(batch_size))
+        ]
+
+        # The members are loaded and their tokens are made before going
+        # concurrent, the session is not shared by the threads.
+        members = {
+            m.id: (m, m.create_jwt_principal().dump().decode())
+            for m in session.query(Member)
+            .filter(Member.id.in_(set(o[2] for o in operations)))
+        } if operations else {}
+
+        chat_client = ChatClient()
+        circuit_breaker = chat_client.circuit_breaker
+
+        def apply(operation):
+            action, subscribable_id, member_id, room_id = operation
+            if circuit_breaker is not None \
+                    and circuit_breaker.state == 'open':
+                return False
+
+            member, token = members[member_id]
+            try:
+                if action == 'add':
+                    chat_client.add_member(
+                        room_id,
+                        member.reference_id,
+                        token,
+                        member.access_token
+                    )
+
+                else:
+                    chat_client.kick_member(
+                        room_id,
+                        member.reference_id,
+                        token,
+                        member.access_token
+                    )
+
+            except (StatusRoomMemberAlreadyExist, StatusRoomMemberNotFound):
+                pass
+
+            except HTTPStatus as ex:
+                logger.error(
+                    f'Cannot {action} member {member.reference_id} of room '
+                    f'{room_id}: {ex.status}'
+                )
+                return False
+
+            return True
+
+        with ThreadPoolExecutor(
+                max_workers=chat_reconciliation.concurrency
+        ) as executor:
+            results = list(executor.map(apply, operations))
+
+        added = []
+        kicked = []
+        for (action, subscribable_id, member_id, _), succeeded in \
+                zip(operations, results):
+            if succeeded:
+                (added if action == 'add' else kicked) \
+                    .append((subscribable_id, member_id))
+
+        ChatRoomMember.add(session, added)
+        ChatRoomMember.kick(session, kicked)
+        self.added = len(added)
+        self.kicked = len(kicked)
+        self.failed = len(operations) - len(added) - len(kicked)
+
+        logger.info(
+            f'Chat rooms drift: {self.missing} missing and {self.extra} '
+            f'extra members, {self.added} added, {self.kicked} kicked and '
+            f'{self.failed} failed'
+        )
+
+
+def count(session, query):
+    return session.execute(
+        select([func.count()]).select_from(query.alias())
+    ).scalar()
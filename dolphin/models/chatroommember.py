@@ -0,0 +1,125 @@
+from restfulpy.orm import Field, DeclarativeBase
+from sqlalchemy import Integer, ForeignKey, select, union, delete, \
+    tuple_, and_
+from sqlalchemy.dialects.postgresql import insert
+
+from .issue import Issue
+from .project import Project
+from .subscribable import Subscription
+
+
+class ChatRoomMember(DeclarativeBase):
+    """The subscribers which are known to be members of the chat room of
+    their subscribable.
+
+    The chat server does not list the members of a room, so the membership
+    which is applied by the jobs is kept here, and the subscriptions are
+    diffed against it by ``ChatReconciliationJob``.
+
+    """
+
+    __tablename__ = 'chat_room_member'
+
+    subscribable_id = Field(
+        Integer,
+        ForeignKey('subscribable.id'),
+        primary_key=True,
+    )
+    member_id = Field(Integer, ForeignKey('member.id'), primary_key=True)
+
+    @classmethod
+    def add(cls, session, pairs):
+        """Records the ``(subscribable_id, member_id)`` pairs as added."""
+        if not pairs:
+            return
+
+        session.execute(
+            insert(cls.__table__)
+            .values([
+                dict(subscribable_id=s, member_id=m) for s, m in pairs
+            ])
+            .on_conflict_do_nothing()
+        )
+
+    @classmethod
+    def kick(cls, session, pairs):
+        """Records the ``(subscribable_id, member_id)`` pairs as kicked."""
+        if not pairs:
+            return
+
+        session.execute(
+            delete(cls.__table__)
+            .where(tuple_(cls.subscribable_id, cls.member_id).in_(pairs))
+        )
+
+    @staticmethod
+    def create_rooms_query():
+        """The ``(id, room_id)`` of the subscribables which have a room."""
+        return union(
+            select([Issue.id, Issue.room_id])
+            .where(Issue.room_id.isnot(None)),
+            select([Project.id, Project.room_id])
+            .where(Project.room_id.isnot(None)),
+        ).alias('rooms')
+
+    @classmethod
+    def create_desired_query(cls):
+        """The ``(subscribable_id, member_id, room_id)`` of the subscribers
+        who should be members of the rooms.
+
+        """
+        rooms = cls.create_rooms_query()
+        return select([
+            Subscription.subscribable_id,
+            Subscription.member_id,
+            rooms.c.room_id,
+        ]) \
+            .select_from(
+                Subscription.__table__.join(
+                    rooms,
+                    rooms.c.id == Subscription.subscribable_id
+                )
+            ) \
+            .where(Subscription.one_shot.is_(None))
+
+    @classmethod
+    def create_drift_queries(cls):
+        """The queries of the missing and the extra members of the rooms, by
+        ``(subscribable_id, member_id, room_id)``.
+
+        """
+        desired = cls.create_desired_query().alias('desired')
+        rooms = cls.create_rooms_query()
+        applied = cls.__table__
+
+        missing = select([
+            desired.c.subscribable_id,
+            desired.c.member_id,
+            desired.c.room_id,
+        ]) \
+            .select_from(
+                desired.outerjoin(applied, and_(
+                    applied.c.subscribable_id == desired.c.subscribable_id,
+                    applied.c.member_id == desired.c.member_id,
+                ))
+            ) \
+            .where(applied.c.member_id.is_(None)) \
+            .order_by(desired.c.subscribable_id, desired.c.member_id)
+
+        extra = select([
+            applied.c.subscribable_id,
+            applied.c.member_id,
+            rooms.c.room_id,
+        ]) \
+            .select_from(
+                applied
+                .join(rooms, rooms.c.id == applied.c.subscribable_id)
+                .outerjoin(desired, and_(
+                    desired.c.subscribable_id == applied.c.subscribable_id,
+                    desired.c.member_id == applied.c.member_id,
+                ))
+            ) \
+            .where(desired.c.member_id.is_(None)) \
+            .order_by(applied.c.subscribable_id, applied.c.member_id)
+
+        return missing, extra
@@ -4,9 +4,11 @@ from restfulpy.orm import Field, DeclarativeBase, OrderingMixin, \
     FilteringMixin, PaginationMixin, relationship
 from sqlalchemy import Integer, Unicode, ForeignKey, Date, Float
 
+from ..mixins import FieldsetMixin
+
 
 class Dailyreport(OrderingMixin, FilteringMixin, PaginationMixin, \
-               DeclarativeBase):
+               FieldsetMixin, DeclarativeBase):
     __tablename__ = 'dailyreport'
 
     item_id = Field(
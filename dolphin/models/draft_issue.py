@@ -1,6 +1,7 @@
 from restfulpy.orm import Field, DeclarativeBase, relationship, ModifiedMixin
 from sqlalchemy import Integer, ForeignKey
 
+from ..mixins import FieldsetMixin
 from .issue import Issue
 
 
@@ -35,7 +36,7 @@ class DraftIssueIssue(DeclarativeBase):
     )
 
 
-class DraftIssue(ModifiedMixin, DeclarativeBase):
+class DraftIssue(ModifiedMixin, FieldsetMixin, DeclarativeBase):
 
     __tablename__ = 'draft_issue'
 
@@ -5,6 +5,8 @@ from restfulpy.orm import Field, DeclarativeBase, OrderingMixin, \
 from sqlalchemy import Integer, Unicode, DateTime, ForeignKey, Enum, exists, \
     and_
 
+from ..mixins import FieldsetMixin
+
 
 event_repeats = [
     'yearly',
@@ -13,7 +15,8 @@ event_repeats = [
 ]
 
 
-class Event(OrderingMixin, FilteringMixin, PaginationMixin, DeclarativeBase):
+class Event(OrderingMixin, FilteringMixin, PaginationMixin, FieldsetMixin,
+            DeclarativeBase):
     __tablename__ = 'event'
 
     id = Field(
@@ -2,9 +2,11 @@ from restfulpy.orm import Field, DeclarativeBase, OrderingMixin, \
     FilteringMixin, PaginationMixin, relationship
 from sqlalchemy import Integer, Unicode
 
+from ..mixins import FieldsetMixin
+
 
 class EventType(OrderingMixin, FilteringMixin, PaginationMixin,
-                DeclarativeBase):
+                FieldsetMixin, DeclarativeBase):
     __tablename__ = 'event_type'
 
     id = Field(
@@ -2,6 +2,8 @@ from restfulpy.orm import DeclarativeBase, Field, relationship, \
     OrderingMixin, FilteringMixin, PaginationMixin
 from sqlalchemy import Integer, String, BOOLEAN, ForeignKey, Unicode
 
+from ..mixins import FieldsetMixin
+
 
 class GroupMember(DeclarativeBase):
     __tablename__ = 'group_member'
@@ -10,7 +12,8 @@ class GroupMember(DeclarativeBase):
     member_id= Field(Integer, ForeignKey('member.id'), primary_key=True)
 
 
-class Group(OrderingMixin, FilteringMixin, PaginationMixin, DeclarativeBase):
+class Group(OrderingMixin, FilteringMixin, PaginationMixin, FieldsetMixin,
+            DeclarativeBase):
     __tablename__ = 'group'
 
     id = Field(
@@ -3,20 +3,20 @@ from datetime import datetime, timedelta
 from auditor import observe
 from nanohttp import context
 from restfulpy.orm import Field, DeclarativeBase, relationship, \
-    OrderingMixin, FilteringMixin, PaginationMixin
+    OrderingMixin, FilteringMixin
 from restfulpy.orm.metadata import MetadataField
 from sqlalchemy import Integer, ForeignKey, Enum, select, func, bindparam, \
-    case, join, and_, exists, DateTime, Boolean, null
+    case, join, DateTime, Boolean, null, union, literal
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.event import listens_for
 from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy.orm import column_property
+from sqlalchemy.orm import column_property, Load
 
 from ..constants import ISSUE_RESPONSE_TIME
-from ..mixins import ModifiedByMixin, CreatedByMixin
-from .issue_phase import IssuePhase
-from .item import Item
+from ..mixins import ModifiedByMixin, CreatedByMixin, KeysetPaginationMixin, \
+    FieldsetMixin, ConditionalMixin
+from .issue_rollup import IssueRollup
 from .member import Member
-from .phase import Phase
 from .subscribable import Subscribable, Subscription
 
 
@@ -69,14 +69,19 @@ issue_origins = [
 ]
 
 
+# The fields which are computed from the current time
+TIME_DEPENDENT_FIELDS = {'responseTime', 'boarding'}
+
+
 class Priority:
     low =      (1, 'low')
     normal =   (2, 'normal')
     high =     (3, 'high')
 
 
-class Issue(OrderingMixin, FilteringMixin, PaginationMixin, ModifiedByMixin,
-            CreatedByMixin, Subscribable):
+class Issue(OrderingMixin, FilteringMixin, KeysetPaginationMixin,
+            FieldsetMixin, ConditionalMixin, ModifiedByMixin, CreatedByMixin,
+            Subscribable):
 
     __tablename__ = 'issue'
     __mapper_args__ = {'polymorphic_identity': __tablename__}
@@ -104,7 +109,8 @@ class Issue(OrderingMixin, FilteringMixin, PaginationMixin, ModifiedByMixin,
         required=False,
         example='Lorem Ipsum'
     )
-    room_id = Field(Integer, readonly=True)
+    # The room is bound later by `RoomProvisioningJob`
+    room_id = Field(Integer, readonly=True, nullable=True)
     kind = Field(
         Enum(*issue_kinds, name='kind'),
         python_type=str,
@@ -165,7 +171,7 @@ class Issue(OrderingMixin, FilteringMixin, PaginationMixin, ModifiedByMixin,
     last_moving_time = Field(
         DateTime,
         python_type=datetime,
-        default=datetime.now(),
+        default=datetime.now,
         label='Last Moving Time',
         nullable=True,
         protected=True,
@@ -241,21 +247,15 @@ class Issue(OrderingMixin, FilteringMixin, PaginationMixin, ModifiedByMixin,
         lazy='selectin',
     )
     due_date = column_property(
-        select([func.max(Item.end_date)]) \
-        .select_from(
-            join(IssuePhase, Item, IssuePhase.id == Item.issue_phase_id)
-        ) \
-        .where(IssuePhase.issue_id == id) \
-        .correlate_except(Item)
+        select([IssueRollup.due_date])
+        .where(IssueRollup.issue_id == id)
+        .as_scalar()
     )
 
     is_done = column_property(
-        select([func.bool_and(Item.is_done)]) \
-        .select_from(
-            join(IssuePhase, Item, IssuePhase.id == Item.issue_phase_id)
-        ) \
-        .where(IssuePhase.issue_id == id) \
-        .correlate_except(Item)
+        select([IssueRollup.is_done])
+        .where(IssueRollup.issue_id == id)
+        .as_scalar()
     )
 
     is_subscribed = column_property(
@@ -291,53 +291,25 @@ class Issue(OrderingMixin, FilteringMixin, PaginationMixin, ModifiedByMixin,
         deferred=True
     )
 
-    _not_estimated_phases = select([Item.issue_phase_id]) \
-        .where(Item.estimated_hours.is_(None)) \
-        .group_by(Item.issue_phase_id)
-
     phase_id = column_property(
-        select([IssuePhase.phase_id])
-        .select_from(join(IssuePhase, Phase, IssuePhase.phase_id == Phase.id))
-        .where(IssuePhase.id.notin_(_not_estimated_phases))
-        .where(IssuePhase.issue_id == id)
-        .order_by(Phase.order.desc())
-        .limit(1)
+        select([IssueRollup.phase_id])
+        .where(IssueRollup.issue_id == id)
+        .as_scalar()
     )
 
     _need_estimated_phase_id = column_property(
-        select([IssuePhase.phase_id]) \
-            .select_from(
-                join(IssuePhase, Phase, IssuePhase.phase_id == Phase.id)
-                .join(Item, IssuePhase.id == Item.issue_phase_id)
-            ) \
-            .where(IssuePhase.issue_id == id) \
-            .where(Item.estimated_hours.is_(None)) \
-            .order_by(Phase.order) \
-            .limit(1) \
-            .as_scalar()
+        select([IssueRollup.need_estimated_phase_id])
+        .where(IssueRollup.issue_id == id)
+        .as_scalar()
     )
 
     status = column_property(
-        case([
-            (
-                is_done,
-                'done'
-            ),
-            (
-                exists(
-                    select([IssuePhase.status])
-                    .where(and_(
-                        IssuePhase.issue_id == id,
-                        IssuePhase.phase_id == phase_id
-                    ))
-                ),
-                select([IssuePhase.status])
-                .where(and_(
-                    IssuePhase.issue_id == id,
-                    IssuePhase.phase_id == phase_id
-                )).as_scalar()
-            )
-        ], else_='to-do').label('status'),
+        func.coalesce(
+            select([IssueRollup.status])
+            .where(IssueRollup.issue_id == id)
+            .as_scalar(),
+            'to-do'
+        ).label('status'),
         deferred=True
     )
 
@@ -580,7 +552,39 @@ class Issue(OrderingMixin, FilteringMixin, PaginationMixin, ModifiedByMixin,
             readonly=True
         )
 
-    def to_dict(self, include_relations=True):
+    __computed_fields__ = dict(
+        responseTime='_export_response_time',
+        status='_export_status',
+        boarding='_export_boarding',
+        isSubscribed='_export_is_subscribed',
+        seenAt='_export_seen_at',
+        items='_export_items',
+        dueDate='_export_due_date',
+        isDone='_export_is_done',
+        stage='_export_stage',
+    )
+    __fieldset_dependencies__ = dict(
+        responseTime=['last_moving_time'],
+        priorityValue=['priority'],
+    )
+
+    def _export_response_time(self):
+        return self._get_hours(self.response_time) \
+            if self.response_time else None
+
+    def _export_status(self):
+        return self.status
+
+    def _export_boarding(self):
+        return self.boarding
+
+    def _export_is_subscribed(self):
+        return True if self.is_subscribed else False
+
+    def _export_seen_at(self):
+        return self.seen_at.isoformat() if self.seen_at else None
+
+    def _export_items(self):
         # The `issue` relationship on Item model is `protected=False`, So the
         # `items` relationship on Issue model must be `protected=True`, So that
         # this causes recursively getting the instances of `issue` and `item`
@@ -595,29 +599,190 @@ class Issue(OrderingMixin, FilteringMixin, PaginationMixin, ModifiedByMixin,
                     phaseId=issue_phase.phase_id,
                 ))
 
+        return items_list
+
+    def _export_due_date(self):
+        return self.due_date.isoformat() if self.due_date else None
+
+    def _export_is_done(self):
+        return self.is_done
+
+    def _export_stage(self):
+        return self.stage
+
+    def to_dict(self, include_relations=True):
         issue_dict = super().to_dict()
-        issue_dict['responseTime'] = \
-            self._get_hours(self.response_time) \
-            if self.response_time else None
-        issue_dict['status'] = self.status
-        issue_dict['boarding'] = self.boarding
-        issue_dict['isSubscribed'] = True if self.is_subscribed else False
-        issue_dict['seenAt'] = \
-            self.seen_at.isoformat() if self.seen_at else None
-        issue_dict['items'] = items_list
-        issue_dict['dueDate'] = \
-            self.due_date.isoformat() if self.due_date else None
-        issue_dict['isDone'] = self.is_done
+        for name, method in self.__computed_fields__.items():
+            issue_dict[name] = getattr(self, method)()
+
         if include_relations:
             issue_dict['relations'] = []
             for x in self.relations:
                 issue_dict['relations'].append(
                     x.to_dict(include_relations=False)
                 )
-        issue_dict['stage'] = self.stage
 
         return issue_dict
 
+    @classmethod
+    def create_fieldset_loading_options(cls, fields, loader):
+        options = super().create_fieldset_loading_options(fields, loader)
+        if 'items' in fields:
+            options.extend(cls._create_items_loading_options(loader))
+
+        return options
+
+    @staticmethod
+    def _create_items_loading_options(loader):
+        items_loader = loader.selectinload('issue_phases') \
+            .load_only('id', 'phase_id') \
+            .selectinload('items')
+        return [
+            items_loader
+                .load_only('id', 'issue_phase_id', 'member_id', 'created_at'),
+            items_loader.noload('rollup'),
+        ]
+
+    @classmethod
+    def get_cursor_sort_columns(cls):
+        from .phase import Phase
+        from .tag import Tag
+
+        # The `phaseTitle` and `tagTitle` keys are joined by the controller
+        return dict(
+            id=cls.id,
+            title=cls.title,
+            kind=cls.kind,
+            stage=cls.stage,
+            days=cls.days,
+            createdAt=cls.created_at,
+            modifiedAt=cls.modified_at,
+            dueDate=cls.due_date,
+            priorityValue=cls.priority_value,
+            phaseTitle=Phase.title,
+            tagTitle=Tag.title,
+        )
+
+    @classmethod
+    def create_bulk_loading_options(cls, loader=None):
+        # Everything `to_dict` touches is loaded for the whole page by a fixed
+        # number of `IN` queries, instead of lazy loading it per issue.
+        include_relations = loader is None
+        loader = loader if loader is not None else Load(cls)
+        options = [
+            loader.undefer('status'),
+            loader.undefer('is_subscribed'),
+            loader.undefer('seen_at'),
+            *cls._create_items_loading_options(loader),
+            loader.selectinload('tags'),
+            loader.selectinload('returntotriagejobs'),
+            loader.selectinload('project').undefer('is_subscribed'),
+        ]
+        if include_relations:
+            options.extend(cls.create_bulk_loading_options(
+                loader.selectinload('relations')
+            ))
+
+        return options
+
+    @classmethod
+    def get_validator_columns(cls, rows):
+        # The items, the daily reports and the subscriptions change the
+        # issues without modifying them, and the representation embeds the
+        # related issues, the tags and the project too.
+        from .change import Change
+        from .project import Project
+        from .tag import Tag
+
+        issue_table = cls.__table__
+        project_table = Project.__table__
+        tag_table = Tag.__table__
+        related_issue_table = RelatedIssue.__table__
+        issue_tag_table = IssueTag.__table__
+        subscribable_table = Subscribable.__table__
+
+        def select_latest_modification(table, ids):
+            return select([func.max(func.coalesce(
+                table.c.modified_at,
+                subscribable_table.c.created_at
+            ))]) \
+                .select_from(table.join(
+                    subscribable_table,
+                    subscribable_table.c.id == table.c.id
+                )) \
+                .where(table.c.id.in_(ids)) \
+                .correlate(None) \
+                .as_scalar()
+
+        issue_ids = select([rows.c.id]).correlate(None)
+        related_issue_ids = select([related_issue_table.c.related_issue_id]) \
+            .where(related_issue_table.c.issue_id.in_(issue_ids))
+        embedded_issue_ids = union(issue_ids, related_issue_ids)
+        project_ids = select([issue_table.c.project_id]) \
+            .where(issue_table.c.id.in_(embedded_issue_ids))
+        tags = select([
+            func.md5(func.string_agg(
+                func.concat_ws(
+                    ':',
+                    issue_tag_table.c.issue_id,
+                    *tag_table.c
+                ),
+                aggregate_order_by(
+                    literal(','),
+                    issue_tag_table.c.issue_id,
+                    issue_tag_table.c.tag_id
+                )
+            ))
+        ]) \
+            .select_from(issue_tag_table.join(tag_table)) \
+            .where(issue_tag_table.c.issue_id.in_(embedded_issue_ids))
+
+        columns = super().get_validator_columns(rows) + \
+            Change.create_validator_columns(
+                union(embedded_issue_ids, project_ids)
+            ) + [
+                select([func.md5(func.string_agg(
+                    func.concat_ws(
+                        ':',
+                        related_issue_table.c.issue_id,
+                        related_issue_table.c.related_issue_id
+                    ),
+                    aggregate_order_by(
+                        literal(','),
+                        related_issue_table.c.issue_id,
+                        related_issue_table.c.related_issue_id
+                    )
+                ))])
+                .where(related_issue_table.c.issue_id.in_(issue_ids))
+                .correlate(None)
+                .as_scalar(),
+                select_latest_modification(issue_table, related_issue_ids),
+                tags.correlate(None).as_scalar(),
+                select_latest_modification(project_table, project_ids),
+            ]
+
+        fields = cls.get_fieldset()
+        if fields is None or not TIME_DEPENDENT_FIELDS.isdisjoint(fields):
+            # The response time and the boarding are computed from now, so
+            # the representation is valid up to the next hour at most.
+            columns.append(func.date_trunc(
+                'hour',
+                func.timezone('UTC', func.now())
+            ))
+
+        return columns
+
+    @classmethod
+    def dump_query(cls, query=None):
+        if cls.get_fieldset() is not None:
+            return super().dump_query(query)
+
+        query = cls.filter_paginate_sort_query_by_request(query)
+        return [
+            o.to_dict()
+            for o in query.options(*cls.create_bulk_loading_options())
+        ]
+
     @classmethod
     def __declare_last__(cls):
         super().__declare_last__()
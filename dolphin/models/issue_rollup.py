@@ -0,0 +1,199 @@
+from itertools import chain
+
+from restfulpy.orm import Field, DeclarativeBase
+from sqlalchemy import Integer, ForeignKey, DateTime, Boolean, Unicode, \
+    select, func, join, case, exists, and_, or_, table, column, inspect
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.event import listens_for
+from sqlalchemy.orm import Session
+
+from .dailyreport import Dailyreport
+from .issue_phase import IssuePhase
+from .item import Item
+from .phase import Phase
+
+
+# A lightweight handle of the `issue` table, the `Issue` model could not be
+# imported here because it reads its computed columns from this module.
+issue_table = table('issue', column('id'))
+
+
+class IssueRollup(DeclarativeBase):
+    """Denormalized per issue aggregates over `issue_phase` and `item`.
+
+    The rows are recomputed in the same flush which writes an `Item`,
+    `IssuePhase`, `Dailyreport` or `Phase`, So the `Issue` model reads them
+    by primary key instead of running the correlated subqueries per row.
+
+    """
+
+    __tablename__ = 'issue_rollup'
+
+    issue_id = Field(
+        Integer,
+        ForeignKey('issue.id', ondelete='CASCADE'),
+        primary_key=True,
+    )
+    due_date = Field(DateTime, nullable=True)
+    is_done = Field(Boolean, nullable=True)
+    phase_id = Field(Integer, nullable=True)
+    need_estimated_phase_id = Field(Integer, nullable=True)
+    status = Field(Unicode(20), nullable=False, default='to-do')
+
+    @classmethod
+    def create_refresh_statement(cls, condition=None):
+        issue_id = issue_table.c.id
+
+        due_date = select([func.max(Item.end_date)]) \
+            .select_from(
+                join(IssuePhase, Item, IssuePhase.id == Item.issue_phase_id)
+            ) \
+            .where(IssuePhase.issue_id == issue_id) \
+            .as_scalar()
+
+        is_done = select([func.bool_and(Item.is_done)]) \
+            .select_from(
+                join(IssuePhase, Item, IssuePhase.id == Item.issue_phase_id)
+            ) \
+            .where(IssuePhase.issue_id == issue_id) \
+            .as_scalar()
+
+        not_estimated_phases = select([Item.issue_phase_id]) \
+            .where(Item.estimated_hours.is_(None)) \
+            .group_by(Item.issue_phase_id)
+
+        phase_id = select([IssuePhase.phase_id]) \
+            .select_from(
+                join(IssuePhase, Phase, IssuePhase.phase_id == Phase.id)
+            ) \
+            .where(IssuePhase.id.notin_(not_estimated_phases)) \
+            .where(IssuePhase.issue_id == issue_id) \
+            .order_by(Phase.order.desc()) \
+            .limit(1) \
+            .correlate(issue_table) \
+            .as_scalar()
+
+        need_estimated_phase_id = select([IssuePhase.phase_id]) \
+            .select_from(
+                join(IssuePhase, Phase, IssuePhase.phase_id == Phase.id)
+                .join(Item, IssuePhase.id == Item.issue_phase_id)
+            ) \
+            .where(IssuePhase.issue_id == issue_id) \
+            .where(Item.estimated_hours.is_(None)) \
+            .order_by(Phase.order) \
+            .limit(1) \
+            .as_scalar()
+
+        lead_phase_status = select([IssuePhase.status]) \
+            .where(and_(
+                IssuePhase.issue_id == issue_id,
+                IssuePhase.phase_id == phase_id
+            ))
+
+        status = case([
+            (is_done, 'done'),
+            (exists(lead_phase_status), lead_phase_status.as_scalar()),
+        ], else_='to-do')
+
+        query = select([
+            issue_id,
+            due_date,
+            is_done,
+            phase_id,
+            need_estimated_phase_id,
+            status,
+        ])
+        if condition is not None:
+            query = query.where(condition)
+
+        statement = insert(cls.__table__).from_select(
+            [
+                cls.issue_id,
+                cls.due_date,
+                cls.is_done,
+                cls.phase_id,
+                cls.need_estimated_phase_id,
+                cls.status,
+            ],
+            query
+        )
+        return statement.on_conflict_do_update(
+            index_elements=[cls.issue_id],
+            set_=dict(
+                due_date=statement.excluded.due_date,
+                is_done=statement.excluded.is_done,
+                phase_id=statement.excluded.phase_id,
+                need_estimated_phase_id=\
+                    statement.excluded.need_estimated_phase_id,
+                status=statement.excluded.status,
+            )
+        )
+
+
+def get_values(instance, attribute):
+    """The current value of the attribute and the ones it has been moved
+    from in this flush, the history is not reset until the flush ends.
+
+    """
+    history = inspect(instance).attrs[attribute].history
+    return {getattr(instance, attribute), *history.deleted}
+
+
+@listens_for(Session, 'after_flush')
+def refresh_issue_rollups(session, flush_context):
+    issue_ids = set()
+    issue_phase_ids = set()
+    item_ids = set()
+    phase_ids = set()
+
+    for instance in chain(session.new, session.dirty, session.deleted):
+        # The issues which are left by the moved rows are refreshed too
+        if isinstance(instance, Item):
+            issue_phase_ids.update(get_values(instance, 'issue_phase_id'))
+
+        elif isinstance(instance, IssuePhase):
+            issue_ids.update(get_values(instance, 'issue_id'))
+
+        elif isinstance(instance, Dailyreport):
+            item_ids.update(get_values(instance, 'item_id'))
+
+        elif isinstance(instance, Phase) and instance not in session.new:
+            phase_ids.add(instance.id)
+
+    issue_ids.discard(None)
+    issue_phase_ids.discard(None)
+    item_ids.discard(None)
+    phase_ids.discard(None)
+
+    related_issue_ids = []
+    if issue_phase_ids:
+        related_issue_ids.append(
+            select([IssuePhase.issue_id])
+            .where(IssuePhase.id.in_(issue_phase_ids))
+        )
+
+    if item_ids:
+        related_issue_ids.append(
+            select([IssuePhase.issue_id])
+            .select_from(
+                join(IssuePhase, Item, IssuePhase.id == Item.issue_phase_id)
+            )
+            .where(Item.id.in_(item_ids))
+        )
+
+    if phase_ids:
+        related_issue_ids.append(
+            select([IssuePhase.issue_id])
+            .where(IssuePhase.phase_id.in_(phase_ids))
+        )
+
+    conditions = [
+        issue_table.c.id.in_(query) for query in related_issue_ids
+    ]
+    if issue_ids:
+        conditions.append(issue_table.c.id.in_(issue_ids))
+
+    if not conditions:
+        return
+
+    session.execute(IssueRollup.create_refresh_statement(or_(*conditions)))
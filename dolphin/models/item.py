@@ -1,21 +1,24 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, time
 
+from nanohttp import context
 from restfulpy.orm import Field, DeclarativeBase, relationship
 from restfulpy.orm.metadata import MetadataField
 from restfulpy.orm.mixins import TimestampMixin, OrderingMixin, \
-    FilteringMixin, PaginationMixin
+    FilteringMixin
 from sqlalchemy import Integer, ForeignKey, DateTime, String, select, func, \
     Boolean, case, exists, and_
 from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy.orm import column_property
+from sqlalchemy.orm import Load
 
 from ..constants import ITEM_RESPONSE_TIME, ITEM_GRACE_PERIOD
+from ..mixins import KeysetPaginationMixin, FieldsetMixin
 from .dailyreport import Dailyreport
 
 
-class Item(TimestampMixin, OrderingMixin, FilteringMixin, PaginationMixin,
-           DeclarativeBase):
+class Item(TimestampMixin, OrderingMixin, FilteringMixin,
+           KeysetPaginationMixin, FieldsetMixin, DeclarativeBase):
     __tablename__ = 'item'
+    __issue_fieldset_key__ = 'issueFields'
 
     id = Field(
         Integer,
@@ -138,44 +141,120 @@ class Item(TimestampMixin, OrderingMixin, FilteringMixin, PaginationMixin,
         lazy='selectin',
         order_by='Dailyreport.id',
     )
-    hours_worked = column_property(
-        select([func.sum(Dailyreport.hours)])
-        .where(Dailyreport.item_id == id)
-        .group_by(Dailyreport.item_id)
+    rollup = relationship(
+        'ItemRollup',
+        uselist=False,
+        lazy='selectin',
+        viewonly=True,
     )
-    status = column_property(
-        case([
+
+    @property
+    def _report_dates(self):
+        return self.rollup.report_dates if self.rollup else []
+
+    @property
+    def _reported_hours(self):
+        if self.rollup is None or not self.rollup.reports:
+            return None
+
+        return self.rollup.hours
+
+    @property
+    def _estimated_days(self):
+        if self.start_date is None or self.end_date is None:
+            return None
+
+        return self._get_days(self.end_date - self.start_date) + 1
+
+    @hybrid_property
+    def hours_worked(self):
+        return self._reported_hours
+
+    @hours_worked.expression
+    def hours_worked(cls):
+        return select([func.sum(Dailyreport.hours)]) \
+            .where(Dailyreport.item_id == cls.id) \
+            .group_by(Dailyreport.item_id) \
+            .as_scalar()
+
+    @hybrid_property
+    def status(self):
+        hours = self._reported_hours
+        if self.estimated_hours is not None and hours is not None \
+                and self.estimated_hours <= hours:
+            return 'complete'
+
+        if self._report_dates:
+            return 'in-progress'
+
+        return 'to-do'
+
+    @status.expression
+    def status(cls):
+        return case([
             (
-                estimated_hours <= select([func.sum(Dailyreport.hours)])
-                .where(Dailyreport.item_id == id)
-                .group_by(Dailyreport.item_id),
+                cls.estimated_hours <= select([func.sum(Dailyreport.hours)])
+                .where(Dailyreport.item_id == cls.id)
+                .group_by(Dailyreport.item_id)
+                .as_scalar(),
                 'complete'
             ),
             (
                 exists(
                     select([Dailyreport.item_id])
-                    .where(Dailyreport.item_id == id)
+                    .where(Dailyreport.item_id == cls.id)
                     .group_by(Dailyreport.item_id)
                 ),
                 'in-progress'
             ),
-        ], else_='to-do').label('status'),
-        deferred=True
-    )
-    perspective = column_property(
-        case([
+        ], else_='to-do').label('status')
+
+    @hybrid_property
+    def perspective(self):
+        report_dates = self._report_dates
+        if not report_dates:
+            return 'overdue'
+
+        today = datetime.now().date()
+        if self.start_date is not None and self.end_date is not None:
+            today_start = datetime.combine(today, time())
+            reports_before_today = len([d for d in report_dates if d < today])
+
+            if self._get_days(self.end_date - today_start) >= 0 and \
+                    self._get_days(today_start - self.start_date) > \
+                    reports_before_today:
+                return 'overdue'
+
+            if self._get_days(today_start - self.end_date) > 0 and \
+                    self._estimated_days > reports_before_today:
+                return 'overdue'
+
+        if today not in report_dates:
+            return 'due'
+
+        return 'submitted'
+
+    @perspective.expression
+    def perspective(cls):
+        return case([
             (
                 select([func.count(Dailyreport.hours)])
-                .where(Dailyreport.item_id == id)
+                .where(Dailyreport.item_id == cls.id)
                 .as_scalar() == 0,
                 'overdue'
             ),
             (
                 and_(
-                    func.date_part('DAY', end_date - func.date(func.now())) >= 0,
-                    func.date_part('DAY', func.date(func.now()) - start_date) >
+                    func.date_part(
+                        'DAY',
+                        cls.end_date - func.date(func.now())
+                    ) >= 0,
+                    func.date_part(
+                        'DAY',
+                        func.date(func.now()) - cls.start_date
+                    ) >
                     select([func.count(Dailyreport.id)])
-                    .where(Dailyreport.item_id == id)
+                    .where(Dailyreport.item_id == cls.id)
                     .where(Dailyreport.date < datetime.now().date())
                     .as_scalar(),
                 ),
@@ -183,10 +262,13 @@ class Item(TimestampMixin, OrderingMixin, FilteringMixin, PaginationMixin,
             ),
             (
                 and_(
-                    func.date_part('DAY', func.date(func.now()) - end_date) > 0,
-                    func.date_part('DAY', end_date - start_date) + 1 >
+                    func.date_part(
+                        'DAY',
+                        func.date(func.now()) - cls.end_date
+                    ) > 0,
+                    func.date_part('DAY', cls.end_date - cls.start_date) + 1 >
                     select([func.count(Dailyreport.id)])
-                    .where(Dailyreport.item_id == id)
+                    .where(Dailyreport.item_id == cls.id)
                     .where(Dailyreport.date < datetime.now().date())
                     .as_scalar(),
                 ),
@@ -195,57 +277,96 @@ class Item(TimestampMixin, OrderingMixin, FilteringMixin, PaginationMixin,
             (
                 ~exists(
                     select([Dailyreport.note])
-                    .where(Dailyreport.item_id == id)
+                    .where(Dailyreport.item_id == cls.id)
                     .where(Dailyreport.date == datetime.now().date())
                 ),
                 'due'
             )
-        ], else_='submitted').label('perspective'),
-        deferred=True
-    )
+        ], else_='submitted').label('perspective')
 
-    mojo_remaining_hours = column_property(
-        select([estimated_hours - func.sum(Dailyreport.hours)]) \
-        .where(Dailyreport.item_id == id) \
-        .as_scalar()
-    )
+    @hybrid_property
+    def mojo_remaining_hours(self):
+        hours = self._reported_hours
+        if self.estimated_hours is None or hours is None:
+            return None
 
-    mojo_progress = column_property(
-        select([(func.sum(Dailyreport.hours) / estimated_hours) * 100]) \
-        .where(Dailyreport.item_id == id) \
-        .as_scalar()
-    )
+        return self.estimated_hours - hours
+
+    @mojo_remaining_hours.expression
+    def mojo_remaining_hours(cls):
+        return select([cls.estimated_hours - func.sum(Dailyreport.hours)]) \
+            .where(Dailyreport.item_id == cls.id) \
+            .as_scalar()
+
+    @hybrid_property
+    def mojo_progress(self):
+        hours = self._reported_hours
+        if not self.estimated_hours or hours is None:
+            return None
+
+        return hours / self.estimated_hours * 100
+
+    @mojo_progress.expression
+    def mojo_progress(cls):
+        return select([
+            (func.sum(Dailyreport.hours) / cls.estimated_hours) * 100
+        ]) \
+            .where(Dailyreport.item_id == cls.id) \
+            .as_scalar()
 
-    _days_left_to_estimate = column_property(
-        select([
-            func.date_part('days', end_date - start_date) + 1 \
+    @hybrid_property
+    def _days_left_to_estimate(self):
+        if self._estimated_days is None:
+            return None
+
+        return self._estimated_days - len(self._report_dates)
+
+    @_days_left_to_estimate.expression
+    def _days_left_to_estimate(cls):
+        return select([
+            func.date_part('days', cls.end_date - cls.start_date) + 1 \
             - func.count(Dailyreport.id)
         ]) \
-        .where(Dailyreport.item_id == id) \
-        .as_scalar()
-    )
+            .where(Dailyreport.item_id == cls.id) \
+            .as_scalar()
+
+    @hybrid_property
+    def mojo_boarding(self):
+        remaining_hours = self.mojo_remaining_hours
+        days_left = self._days_left_to_estimate
+        if remaining_hours is None or days_left is None:
+            return 'on-time'
+
+        if remaining_hours > days_left * self._reported_hours:
+            return 'at-risk'
+
+        if self._estimated_days and remaining_hours > \
+                days_left * (self.estimated_hours / self._estimated_days):
+            return 'delayed'
 
-    mojo_boarding = column_property(
-        case([
+        return 'on-time'
+
+    @mojo_boarding.expression
+    def mojo_boarding(cls):
+        return case([
             (
-                mojo_remaining_hours > _days_left_to_estimate * (
+                cls.mojo_remaining_hours > cls._days_left_to_estimate * (
                     select([func.sum(Dailyreport.hours)]) \
-                    .where(Dailyreport.item_id == id) \
+                    .where(Dailyreport.item_id == cls.id) \
                     .as_scalar()
                 ),
                 'at-risk'
             ),
             (
-                mojo_remaining_hours > _days_left_to_estimate * (
-                    estimated_hours / (
-                        func.date_part('days', end_date - start_date) + 1
+                cls.mojo_remaining_hours > cls._days_left_to_estimate * (
+                    cls.estimated_hours / (
+                        func.date_part('days', cls.end_date - cls.start_date)
+                        + 1
                     )
                 ),
                 'delayed'
             ),
-        ], else_='on-time').label('mojo_boarding'),
-        deferred=True
-    )
+        ], else_='on-time').label('mojo_boarding')
 
     @hybrid_property
     def response_time(self):
@@ -308,8 +429,65 @@ class Item(TimestampMixin, OrderingMixin, FilteringMixin, PaginationMixin,
             )
         ])
 
-    def to_dict(self):
-        mojo = {
+    @classmethod
+    def get_cursor_sort_columns(cls):
+        from .issue import Issue
+        from .issue_phase import IssuePhase
+        from .project import Project
+
+        return dict(
+            id=cls.id,
+            createdAt=cls.created_at,
+            startDate=cls.start_date,
+            endDate=cls.end_date,
+            estimatedHours=cls.estimated_hours,
+            issueId=Issue.id,
+            issueTitle=Issue.title,
+            issueKind=Issue.kind,
+            issueBoarding=Issue.boarding,
+            projectTitle=Project.title,
+            phaseId=IssuePhase.phase_id,
+        )
+
+    @classmethod
+    def get_issue_fieldset(cls):
+        if cls.__issue_fieldset_key__ not in context.query:
+            return None
+
+        from .issue import Issue
+        return Issue.parse_fieldset(context.query[cls.__issue_fieldset_key__])
+
+    __computed_fields__ = dict(
+        issue='_export_issue',
+        phaseId='_export_phase_id',
+        mojo='_export_mojo',
+    )
+    __fieldset_dependencies__ = dict(
+        hoursWorked=['rollup'],
+        status=['rollup', 'estimated_hours'],
+        perspective=['rollup', 'start_date', 'end_date'],
+        mojoRemainingHours=['rollup', 'estimated_hours'],
+        mojoProgress=['rollup', 'estimated_hours'],
+        DaysLeftToEstimate=['rollup', 'start_date', 'end_date'],
+        mojoBoarding=['rollup', 'start_date', 'end_date', 'estimated_hours'],
+        mojo=['rollup', 'start_date', 'end_date', 'estimated_hours'],
+        responseTime=['need_estimate_timestamp'],
+        gracePeriod=['need_estimate_timestamp'],
+        issue=['issue_phase'],
+        phaseId=['issue_phase'],
+    )
+
+    def _export_issue(self):
+        issue_fields = self.get_issue_fieldset()
+        issue = self.issue_phase.issue
+        return issue.to_dict() if issue_fields is None \
+            else issue.to_fieldset_dict(issue_fields)
+
+    def _export_phase_id(self):
+        return self.issue_phase.phase_id
+
+    def _export_mojo(self):
+        return {
             'remainingHours': self.mojo_remaining_hours,
             'boarding': self.mojo_boarding,
             'progress': 100 \
@@ -317,14 +495,51 @@ class Item(TimestampMixin, OrderingMixin, FilteringMixin, PaginationMixin,
                 and self.mojo_progress >= 100 \
                 else self.mojo_progress
         }
+
+    @classmethod
+    def create_issue_loading_options(cls, loader):
+        from .issue import Issue
+        issue_loader = loader.selectinload('issue_phase').selectinload('issue')
+        issue_fields = cls.get_issue_fieldset()
+        if issue_fields is None:
+            return [
+                issue_loader,
+                *Issue.create_bulk_loading_options(issue_loader)
+            ]
+
+        return [
+            issue_loader,
+            *Issue.create_fieldset_loading_options(issue_fields, issue_loader)
+        ]
+
+    @classmethod
+    def create_fieldset_loading_options(cls, fields, loader):
+        options = super().create_fieldset_loading_options(fields, loader)
+        if 'issue' in fields:
+            options.extend(cls.create_issue_loading_options(loader))
+
+        return options
+
+    @classmethod
+    def dump_query(cls, query=None):
+        if cls.get_fieldset() is not None or cls.get_issue_fieldset() is None:
+            return super().dump_query(query)
+
+        query = cls.filter_paginate_sort_query_by_request(query)
+        return [
+            o.to_dict()
+            for o in query.options(*cls.create_issue_loading_options(Load(cls)))
+        ]
+
+    def to_dict(self):
         item_dict = super().to_dict()
         item_dict['responseTime'] = self.response_time
         item_dict['hoursWorked'] = self.hours_worked
         item_dict['perspective'] = self.perspective
-        item_dict['issue'] = self.issue_phase.issue.to_dict()
-        item_dict['phaseId'] = self.issue_phase.phase_id
+        item_dict['issue'] = self._export_issue()
+        item_dict['phaseId'] = self._export_phase_id()
         item_dict['status'] = self.status
-        item_dict['mojo'] = mojo
+        item_dict['mojo'] = self._export_mojo()
         return item_dict
 
     @classmethod
@@ -378,3 +593,12 @@ class Item(TimestampMixin, OrderingMixin, FilteringMixin, PaginationMixin,
     def _get_hours(timedelta):
         return timedelta.total_seconds() // 3600
 
+    @staticmethod
+    def _get_days(timedelta_):
+        # Like the `DAY` field of a PostgreSQL interval, the days are
+        # truncated toward zero.
+        if timedelta_ < timedelta():
+            return -(-timedelta_).days
+
+        return timedelta_.days
+
@@ -0,0 +1,106 @@
+from itertools import chain
+
+from restfulpy.orm import Field, DeclarativeBase
+from sqlalchemy import Integer, ForeignKey, Date, Float, select, func, join
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.event import listens_for
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.util import identity_key
+
+from .dailyreport import Dailyreport
+from .item import Item
+
+
+class ItemRollup(DeclarativeBase):
+    """Denormalized per item aggregates over `dailyreport`.
+
+    The rows are recomputed in the same flush which writes a `Dailyreport`,
+    So the `Item` model derives its perspective and mojo metrics from one
+    row instead of running the correlated subqueries per item.
+
+    The report dates are kept instead of a count of the reports before
+    today, because such a count goes stale at midnight.
+
+    """
+
+    __tablename__ = 'item_rollup'
+
+    item_id = Field(
+        Integer,
+        ForeignKey('item.id', ondelete='CASCADE'),
+        primary_key=True,
+    )
+    hours = Field(Float, nullable=False, default=0)
+    reports = Field(Integer, nullable=False, default=0)
+    last_report_date = Field(Date, nullable=True)
+    report_dates = Field(ARRAY(Date), nullable=False, default=[])
+
+    @classmethod
+    def create_refresh_statement(cls, condition=None):
+        query = select([
+            Item.id,
+            func.coalesce(func.sum(Dailyreport.hours), 0),
+            func.count(Dailyreport.id),
+            func.max(Dailyreport.date),
+            func.array_remove(func.array_agg(Dailyreport.date), None),
+        ]) \
+            .select_from(
+                join(
+                    Item,
+                    Dailyreport,
+                    Item.id == Dailyreport.item_id,
+                    isouter=True
+                )
+            ) \
+            .group_by(Item.id)
+
+        if condition is not None:
+            query = query.where(condition)
+
+        statement = insert(cls.__table__).from_select(
+            [
+                cls.item_id,
+                cls.hours,
+                cls.reports,
+                cls.last_report_date,
+                cls.report_dates,
+            ],
+            query
+        )
+        return statement.on_conflict_do_update(
+            index_elements=[cls.item_id],
+            set_=dict(
+                hours=statement.excluded.hours,
+                reports=statement.excluded.reports,
+                last_report_date=statement.excluded.last_report_date,
+                report_dates=statement.excluded.report_dates,
+            )
+        )
+
+
+@listens_for(Session, 'after_flush')
+def refresh_item_rollups(session, flush_context):
+    item_ids = set(
+        instance.item_id
+        for instance in chain(session.new, session.dirty, session.deleted)
+        if isinstance(instance, Dailyreport)
+    )
+    item_ids.discard(None)
+    if not item_ids:
+        return
+
+    session.execute(
+        ItemRollup.create_refresh_statement(Item.id.in_(item_ids))
+    )
+
+    # The loaded rollups, and the items which have been loaded without one,
+    # must be read again after the refresh.
+    for item_id in item_ids:
+        rollup = session.identity_map.get(identity_key(ItemRollup, item_id))
+        if rollup is not None:
+            session.expire(rollup)
+
+        item = session.identity_map.get(identity_key(Item, item_id))
+        if item is not None:
+            session.expire(item, ['rollup'])
+
@@ -10,11 +10,12 @@ from restfulpy.principal import JWTRefreshToken
 from sqlalchemy import Integer, String, Unicode, BigInteger, select, bindparam
 from sqlalchemy.orm import column_property
 
+from ..mixins import FieldsetMixin
 from .organization import OrganizationMember
 
 
 class Member(ModifiedMixin, OrderingMixin, FilteringMixin, PaginationMixin,
-             SoftDeleteMixin, DeclarativeBase):
+             SoftDeleteMixin, FieldsetMixin, DeclarativeBase):
 
     __tablename__ = 'member'
 
@@ -202,9 +203,33 @@ class Member(ModifiedMixin, OrderingMixin, FilteringMixin, PaginationMixin,
 
     @classmethod
     def current(cls):
-        return DBSession.query(cls) \
-            .filter(cls.reference_id == context.identity.reference_id) \
+        # Only the id of the current member is kept per request and the
+        # instance is taken from the identity map of the session, so it's
+        # queried once per request and never outlives its session.
+        reference_id = context.identity.reference_id
+        member_id = cls._get_current_member_ids().get(reference_id)
+        if member_id is not None:
+            member = DBSession.query(cls).get(member_id)
+            if member is not None:
+                return member
+
+        member = DBSession.query(cls) \
+            .filter(cls.reference_id == reference_id) \
             .one()
+        cls.remember_current(member)
+        return member
+
+    @classmethod
+    def remember_current(cls, member):
+        cls._get_current_member_ids()[member.reference_id] = member.id
+
+    @staticmethod
+    def _get_current_member_ids():
+        member_ids = getattr(context, 'current_member_ids', None)
+        if member_ids is None:
+            member_ids = context.current_member_ids = {}
+
+        return member_ids
 
     def __repr__(self):
         return f'\tTitle: {self.title}, Email: {self.email}\n'
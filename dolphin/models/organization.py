@@ -13,6 +13,8 @@ from sqlalchemy_media.exceptions import DimensionValidationError, \
     AspectRatioValidationError, MaximumLengthIsReachedError, \
     ContentTypeValidationError
 
+from ..mixins import FieldsetMixin
+
 
 roles = [
     'owner',
@@ -98,7 +100,8 @@ class Logo(Image):
 
 
 class Organization(OrderingMixin, FilteringMixin, PaginationMixin,
-                   ModifiedMixin, TimestampMixin, DeclarativeBase):
+                   ModifiedMixin, TimestampMixin, FieldsetMixin,
+                   DeclarativeBase):
 
     __tablename__ = 'organization'
 
@@ -255,9 +258,15 @@ class Organization(OrderingMixin, FilteringMixin, PaginationMixin,
         else:
             self._logo = None
 
+    __computed_fields__ = dict(logo='_export_logo')
+    __fieldset_dependencies__ = dict(logo=['_logo'])
+
+    def _export_logo(self):
+        return self.logo
+
     def to_dict(self):
         organization = super().to_dict()
-        organization['logo'] = self.logo
+        organization['logo'] = self._export_logo()
         return organization
 
     def __repr__(self):# pragma: no cover
@@ -2,8 +2,11 @@ from restfulpy.orm import DeclarativeBase, Field, relationship, \
     FilteringMixin, OrderingMixin, PaginationMixin
 from sqlalchemy import Integer, String, ForeignKey
 
+from ..mixins import FieldsetMixin
 
-class Phase(OrderingMixin, FilteringMixin, PaginationMixin, DeclarativeBase):
+
+class Phase(OrderingMixin, FilteringMixin, PaginationMixin, FieldsetMixin,
+            DeclarativeBase):
     __tablename__ = 'phase'
 
     id = Field(
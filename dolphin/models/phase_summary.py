@@ -1,6 +1,9 @@
+import threading
+
 from restfulpy.orm import Field, PaginationMixin, FilteringMixin, \
     OrderingMixin, BaseModel, MetadataField, DBSession
-from sqlalchemy import Integer, Unicode, select, func, join, DateTime
+from sqlalchemy import Integer, Unicode, select, func, join, DateTime, \
+    bindparam
 from sqlalchemy.orm import mapper
 
 from . import Phase, Item, Dailyreport, Project, Issue
@@ -17,6 +20,8 @@ class AbstractPhaseSummaryView(PaginationMixin, OrderingMixin, FilteringMixin,
         'dailyreport': ('hours'),
         'issue_phase': ('status'),
     }
+    __mapped_class__ = None
+    __mapping_lock__ = threading.Lock()
 
     id = Field('id', Integer, primary_key=True)
     title = Field('title', Unicode(100))
@@ -28,7 +33,20 @@ class AbstractPhaseSummaryView(PaginationMixin, OrderingMixin, FilteringMixin,
     status = Field('status', Unicode(100))
 
     @classmethod
-    def create_mapped_class(cls, issue_id):
+    def get_mapped_class(cls):
+        # The mapping is parameterized by bind parameters, So it is configured
+        # once per process and the values are given by `Query.params`.
+        if cls.__mapped_class__ is None:
+            with cls.__mapping_lock__:
+                if cls.__mapped_class__ is None:
+                    cls.__mapped_class__ = cls.create_mapped_class()
+
+        return cls.__mapped_class__
+
+    @classmethod
+    def create_mapped_class(cls):
+        issue_id = bindparam('issue_id')
+
         item_cte = select([
             Item,
             IssuePhase.issue_id,
@@ -1,13 +1,14 @@
 from auditor import observe
 from nanohttp import context
 from restfulpy.orm import Field, relationship, SoftDeleteMixin, \
-    OrderingMixin, FilteringMixin, PaginationMixin
+    OrderingMixin, FilteringMixin
 from restfulpy.orm.metadata import MetadataField
 from sqlalchemy import Integer, ForeignKey, Enum, select, func, bindparam, \
-    join, case, exists
+    join, case, exists, union
 from sqlalchemy.orm import column_property
 
-from ..mixins import ModifiedByMixin
+from ..mixins import ModifiedByMixin, KeysetPaginationMixin, \
+    FieldsetMixin, ConditionalMixin
 from .issue import Issue
 from .member import Member
 from .subscribable import Subscribable, Subscription
@@ -21,7 +22,8 @@ project_statuses = [
 ]
 
 
-class Project(ModifiedByMixin, OrderingMixin, FilteringMixin, PaginationMixin,
+class Project(ModifiedByMixin, OrderingMixin, FilteringMixin,
+              KeysetPaginationMixin, FieldsetMixin, ConditionalMixin,
               SoftDeleteMixin, Subscribable):
 
     __tablename__ = 'project'
@@ -96,7 +98,8 @@ class Project(ModifiedByMixin, OrderingMixin, FilteringMixin, PaginationMixin,
         message=None
     )
 
-    room_id = Field(Integer, readonly=True)
+    # The room is bound later by `RoomProvisioningJob`
+    room_id = Field(Integer, readonly=True, nullable=True)
 
     status = Field(
         Enum(*project_statuses, name='project_status'),
@@ -257,13 +260,72 @@ class Project(ModifiedByMixin, OrderingMixin, FilteringMixin, PaginationMixin,
             readonly=True
         )
 
+    @classmethod
+    def get_cursor_sort_columns(cls):
+        from .release import Release
+
+        # The `releaseTitle` and `managerTitle` keys are joined by the
+        # controller
+        return dict(
+            id=cls.id,
+            title=cls.title,
+            status=cls.status,
+            createdAt=cls.created_at,
+            modifiedAt=cls.modified_at,
+            dueDate=cls.due_date,
+            releaseTitle=Release.title,
+            managerTitle=Member.title,
+        )
+
+    __computed_fields__ = dict(
+        boarding='_export_boarding',
+        isSubscribed='_export_is_subscribed',
+        dueDate='_export_due_date',
+        releaseCutoff='_export_release_cutoff',
+    )
+
+    def _export_boarding(self):
+        return self.boarding
+
+    def _export_is_subscribed(self):
+        return True if self.is_subscribed else False
+
+    def _export_due_date(self):
+        return self.due_date.isoformat() if self.due_date else None
+
+    def _export_release_cutoff(self):
+        return self.release_cutoff.isoformat()
+
+    @classmethod
+    def get_validator_columns(cls, rows):
+        # The due date and the boarding are computed from the issues, and
+        # the cutoff is of the release.
+        from . import Release
+        from .change import Change
+
+        project_table = cls.__table__
+        release_table = Release.__table__
+        project_ids = select([rows.c.id]).correlate(None)
+        return super().get_validator_columns(rows) + \
+            Change.create_validator_columns(union(
+                project_ids,
+                select([Issue.__table__.c.id])
+                .where(Issue.__table__.c.project_id.in_(project_ids))
+            )) + [
+                select([func.max(release_table.c.modified_at)])
+                .where(release_table.c.id.in_(
+                    select([project_table.c.release_id])
+                    .where(project_table.c.id.in_(project_ids))
+                ))
+                .correlate(None)
+                .as_scalar()
+            ]
+
     def to_dict(self):
         project_dict = super().to_dict()
-        project_dict['boarding'] = self.boarding
-        project_dict['isSubscribed'] = True if self.is_subscribed else False
-        project_dict['dueDate'] = self.due_date.isoformat() \
-            if self.due_date else None
-        project_dict['releaseCutoff'] = self.release_cutoff.isoformat()
+        for name, method in self.__computed_fields__.items():
+            project_dict[name] = getattr(self, method)()
+
         return project_dict
 
     def get_room_title(self):
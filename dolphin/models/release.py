@@ -9,6 +9,7 @@ from sqlalchemy import Integer, Enum, DateTime, ForeignKey, select, func, \
     join, bindparam
 from sqlalchemy.orm import column_property
 
+from ..mixins import FieldsetMixin, ConditionalMixin
 from .member import Member
 from .project import Project
 from .subscribable import Subscribable, Subscription
@@ -23,7 +24,7 @@ release_statuses = [
 
 
 class Release(ModifiedMixin, FilteringMixin, OrderingMixin, PaginationMixin,
-              Subscribable):
+              FieldsetMixin, ConditionalMixin, Subscribable):
 
     __tablename__ = 'release'
     __mapper_args__ = {'polymorphic_identity': __tablename__}
@@ -160,9 +161,24 @@ class Release(ModifiedMixin, FilteringMixin, OrderingMixin, PaginationMixin,
     def get_room_title(self):
         return f'{self.title.lower()}-{self.manager_id}'
 
+    __computed_fields__ = dict(isSubscribed='_export_is_subscribed')
+
+    def _export_is_subscribed(self):
+        return True if self.is_subscribed else False
+
+    @classmethod
+    def get_validator_columns(cls, rows):
+        # The subscriptions change the releases without modifying them
+        from .change import Change
+
+        return super().get_validator_columns(rows) + \
+            Change.create_validator_columns(
+                select([rows.c.id]).correlate(None)
+            )
+
     def to_dict(self):
         release_dict = super().to_dict()
-        release_dict['isSubscribed'] = True if self.is_subscribed else False
+        release_dict['isSubscribed'] = self._export_is_subscribed()
         return release_dict
 
     @classmethod
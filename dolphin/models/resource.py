@@ -49,6 +49,8 @@ class Resource(Member):
         .where(Item.member_id == Member.id)
     )
 
+    __fieldset_dependencies__ = dict(load=['load_value'])
+
     @hybrid_property
     def load(self):
         if self.load_value is None:
@@ -1,6 +1,9 @@
+import threading
+
 from restfulpy.orm import Field, PaginationMixin, FilteringMixin, \
     OrderingMixin, BaseModel, MetadataField
-from sqlalchemy import Integer, Unicode, select, join, DateTime, func
+from sqlalchemy import Integer, Unicode, select, join, DateTime, func, \
+    bindparam
 from sqlalchemy.orm import mapper
 
 from . import Phase, Item, Resource, Dailyreport, SpecialtyMember
@@ -16,6 +19,8 @@ class AbstractResourceSummaryView(PaginationMixin, OrderingMixin,
         'item': ('start_date', 'end_date', 'estimated_hours', 'id', 'status'),
         'dailyreport': ('hours')
     }
+    __mapped_class__ = None
+    __mapping_lock__ = threading.Lock()
 
     id = Field('id', Integer, primary_key=True)
     item_id = Field('item_id', Integer)
@@ -28,7 +33,20 @@ class AbstractResourceSummaryView(PaginationMixin, OrderingMixin,
     status = Field('status', Unicode(100))
 
     @classmethod
-    def create_mapped_class(cls, issue_id, phase_id):
+    def get_mapped_class(cls):
+        # Mapped once, `issue_id` and `phase_id` are bound per query
+        if cls.__mapped_class__ is None:
+            with cls.__mapping_lock__:
+                if cls.__mapped_class__ is None:
+                    cls.__mapped_class__ = cls.create_mapped_class()
+
+        return cls.__mapped_class__
+
+    @classmethod
+    def create_mapped_class(cls):
+        issue_id = bindparam('issue_id')
+        phase_id = bindparam('phase_id')
+
         item_cte = select([
             Item.id,
             Item.start_date,
@@ -0,0 +1,245 @@
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from nanohttp import HTTPStatus, settings
+from restfulpy import logger
+from restfulpy.mule import MuleTask
+from restfulpy.orm import Field
+from sqlalchemy import Integer, ForeignKey, JSON
+from sqlalchemy.orm import with_polymorphic
+from sqlalchemy.orm.session import object_session
+
+from ..backends import ChatClient
+from ..exceptions import StatusRoomMemberAlreadyExist
+from .chatroommember import ChatRoomMember
+from .issue import Issue
+from .member import Member
+from .project import Project
+from .subscribable import Subscribable, Subscription
+
+
+class RoomProvisioningJob(MuleTask):
+    """Creates the chat rooms of the subscribables which are created without
+    one, i.e. the projects, the finalized draft issues and the issues
+    imported in bulk.
+
+    The rooms are created by at most ``room_provisioning.concurrency``
+    concurrent requests to the chat server, then the member of the job, the
+    managers of the projects and the subscribers are added to them. The
+    added subscribers are recorded by ``ChatRoomMember``.
+
+    The rooms which are not created are retried by another job, delayed
+    exponentially, until ``room_provisioning.max_attempts`` is spent. After
+    ``room_provisioning.failure_threshold`` consecutive failures, or while
+    the circuit of the chat server is open, the job stops calling the chat
+    server and leaves the rest of its rooms to the next attempt, without
+    spending their attempts.
+
+    """
+
+    __tablename__ = 'room_provisioning_job'
+    __mapper_args__ = {'polymorphic_identity': __tablename__}
+
+    id = Field(
+        Integer,
+        ForeignKey('mule_task.id'),
+        primary_key=True,
+        readonly=True,
+        not_none=True,
+        required=False,
+        label='ID',
+        minimum=1,
+        example=1,
+        protected=False,
+    )
+    member_id = Field(Integer, ForeignKey('member.id'), readonly=True)
+    subscribable_ids = Field(JSON, readonly=True)
+    attempt = Field(Integer, default=0, readonly=True)
+
+    @classmethod
+    def enqueue(cls, session, member_id, subscribable_ids, at=None,
+                attempt=0):
+        batch_size = settings.room_provisioning.batch_size
+        for i in range(0, len(subscribable_ids), batch_size):
+            session.add(cls(
+                member_id=member_id,
+                subscribable_ids=subscribable_ids[i:i + batch_size],
+                attempt=attempt,
+                at=at or datetime.now(),
+            ))
+
+    @staticmethod
+    def get_backoff(attempt):
+        """Seconds to wait before the ``attempt``th retry, jittered so the
+        jobs failed together are not retried together.
+
+        """
+        room_provisioning = settings.room_provisioning
+        delay = min(
+            room_provisioning.backoff_base * 2 ** (attempt - 1),
+            room_provisioning.backoff_max
+        )
+        return random.uniform(delay / 2, delay)
+
+    def do_(self, context):
+        session = object_session(self)
+        member = session.query(Member).get(self.member_id)
+        if member is None:
+            logger.error(
+                f'Member {self.member_id} is not found, giving up '
+                f'the rooms of subscribables {self.subscribable_ids}'
+            )
+            return
+
+        token = member.create_jwt_principal().dump().decode()
+        chat_client = ChatClient()
+        failure_threshold = settings.room_provisioning.failure_threshold
+
+        # The rooms which are already bound are not created again
+        subscribable = with_polymorphic(Subscribable, [Issue, Project])
+        subscribables = [
+            s for s in session.query(subscribable)
+            .filter(subscribable.id.in_(self.subscribable_ids))
+            .order_by(subscribable.id)
+            if s.room_id is None
+        ]
+
+        circuit_breaker = chat_client.circuit_breaker
+        lock = threading.Lock()
+        consecutive_failures = 0
+        skipped_ids = []
+
+        def create_room(subscribable):
+            nonlocal consecutive_failures
+            with lock:
+                if consecutive_failures >= failure_threshold or (
+                    circuit_breaker is not None
+                    and circuit_breaker.state == 'open'
+                ):
+                    skipped_ids.append(subscribable.id)
+                    return None
+
+            try:
+                room = chat_client.create_room(
+                    subscribable.get_room_title(),
+                    token,
+                    member.access_token,
+                    member.reference_id
+                )
+
+            except HTTPStatus as ex:
+                logger.error(
+                    f'Cannot create the room of subscribable '
+                    f'{subscribable.id}: {ex.status}'
+                )
+                with lock:
+                    consecutive_failures += 1
+
+                return None
+
+            with lock:
+                consecutive_failures = 0
+
+            return room
+
+        def add_member(room_id, reference_id):
+            try:
+                chat_client.add_member(
+                    room_id,
+                    reference_id,
+                    token,
+                    member.access_token
+                )
+
+            except StatusRoomMemberAlreadyExist:
+                pass
+
+            except HTTPStatus as ex:
+                logger.error(
+                    f'Cannot add member {reference_id} to room {room_id}: '
+                    f'{ex.status}'
+                )
+                return False
+
+            return True
+
+        with ThreadPoolExecutor(
+                max_workers=settings.room_provisioning.concurrency
+        ) as executor:
+            rooms = list(executor.map(create_room, subscribables))
+
+            failed_ids = []
+            room_ids = {}
+            for subscribable, room in zip(subscribables, rooms):
+                if room is None:
+                    if subscribable.id not in skipped_ids:
+                        failed_ids.append(subscribable.id)
+
+                    continue
+
+                subscribable.room_id = room_ids[subscribable.id] = room['id']
+
+            members = set()
+            subscribers = {}
+            if room_ids:
+                subscriptions = session.query(
+                    Subscription.subscribable_id,
+                    Member.reference_id,
+                    Member.id
+                ) \
+                    .join(Member, Member.id == Subscription.member_id) \
+                    .filter(Subscription.subscribable_id.in_(room_ids)) \
+                    .filter(Subscription.one_shot.is_(None))
+                subscribers = {(s, r): m for s, r, m in subscriptions}
+                members.update(subscribers)
+                members.update(
+                    session.query(Project.id, Member.reference_id)
+                    .join(Member, Member.id == Project.manager_id)
+                    .filter(Project.id.in_(room_ids))
+                )
+                members.update(
+                    (subscribable_id, member.reference_id)
+                    for subscribable_id in room_ids
+                )
+
+            members = sorted(members)
+            results = list(executor.map(
+                lambda m: add_member(room_ids[m[0]], m[1]),
+                members
+            ))
+
+        ChatRoomMember.add(session, [
+            (m[0], subscribers[m]) for m, added in zip(members, results)
+            if added and m in subscribers
+        ])
+
+        now = datetime.now()
+        if skipped_ids:
+            self.enqueue(
+                session,
+                self.member_id,
+                sorted(skipped_ids),
+                at=now + timedelta(seconds=self.get_backoff(self.attempt + 1)),
+                attempt=self.attempt,
+            )
+
+        if not failed_ids:
+            return
+
+        attempt = self.attempt + 1
+        if attempt >= settings.room_provisioning.max_attempts:
+            logger.error(
+                f'Giving up the rooms of subscribables {failed_ids} after '
+                f'{attempt} attempts'
+            )
+            return
+
+        self.enqueue(
+            session,
+            self.member_id,
+            failed_ids,
+            at=now + timedelta(seconds=self.get_backoff(attempt)),
+            attempt=attempt,
+        )
@@ -2,6 +2,8 @@ from restfulpy.orm import DeclarativeBase, Field, relationship, \
     OrderingMixin, FilteringMixin, PaginationMixin
 from sqlalchemy import Integer, ForeignKey, String
 
+from ..mixins import FieldsetMixin
+
 
 class SpecialtyMember(DeclarativeBase):
     __tablename__ = 'specialty_member'
@@ -19,7 +21,7 @@ class SpecialtyMember(DeclarativeBase):
 
 
 class Specialty(OrderingMixin, FilteringMixin, PaginationMixin, \
-                DeclarativeBase):
+                FieldsetMixin, DeclarativeBase):
     __tablename__ = 'specialty'
 
     id = Field(
@@ -1,6 +1,11 @@
-from restfulpy.orm import DeclarativeBase, Field, TimestampMixin, relationship
+from datetime import datetime
+
+from restfulpy.orm import DeclarativeBase, Field, TimestampMixin, \
+    relationship, DBSession
 from restfulpy.orm.metadata import MetadataField
-from sqlalchemy import Integer, String, ForeignKey, DateTime, BOOLEAN
+from sqlalchemy import Integer, String, ForeignKey, DateTime, BOOLEAN, and_, \
+    update
+from sqlalchemy.orm.util import identity_key
 
 
 class Subscription(DeclarativeBase):
@@ -25,6 +30,62 @@ class Subscription(DeclarativeBase):
     # subscribed yet.
     one_shot = Field(BOOLEAN, nullable=True)
 
+    @classmethod
+    def see(cls, *conditions):
+        """Marks the matching subscriptions as seen by one ``UPDATE``.
+
+        :return: The ids of the members of the updated subscriptions.
+        """
+        return cls._update_seen_at(datetime.utcnow(), conditions)
+
+    @classmethod
+    def unsee(cls, *conditions):
+        """Marks the matching subscriptions as unseen by one ``UPDATE``.
+
+        The subscriptions which are already unseen are not touched.
+
+        :return: The ids of the members of the updated subscriptions.
+        """
+        return cls._update_seen_at(
+            None,
+            conditions + (cls.seen_at.isnot(None), )
+        )
+
+    @classmethod
+    def _update_seen_at(cls, seen_at, conditions):
+        rows = DBSession.execute(
+            update(cls.__table__)
+            .where(and_(*conditions))
+            .values(seen_at=seen_at)
+            .returning(cls.id, cls.member_id, cls.subscribable_id)
+        ).fetchall()
+
+        # The loaded subscriptions must be read again after the update
+        member_ids = []
+        for id_, member_id, subscribable_id in rows:
+            subscription = DBSession.identity_map.get(identity_key(cls, id_))
+            if subscription is not None:
+                DBSession.expire(subscription, ['seen_at'])
+
+            member_ids.append(member_id)
+
+        if member_ids:
+            from .change import Change
+            from .unread_counter import UnreadCounter
+            UnreadCounter.refresh(DBSession, set(member_ids))
+            Change.record(DBSession, [
+                dict(
+                    entity='subscription',
+                    entity_id=id_,
+                    action='update',
+                    subscribable_id=subscribable_id,
+                    member_id=member_id,
+                )
+                for id_, member_id, subscribable_id in rows
+            ])
+
+        return member_ids
+
 
 class Subscribable(TimestampMixin, DeclarativeBase):
     __tablename__ = 'subscribable'
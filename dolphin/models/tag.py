@@ -2,8 +2,11 @@ from restfulpy.orm import Field, DeclarativeBase, relationship, \
     OrderingMixin, FilteringMixin, PaginationMixin
 from sqlalchemy import Integer, ForeignKey, String, Unicode
 
+from ..mixins import FieldsetMixin
 
-class Tag(DeclarativeBase, OrderingMixin, FilteringMixin, PaginationMixin):
+
+class Tag(FieldsetMixin, DeclarativeBase, OrderingMixin, FilteringMixin,
+          PaginationMixin):
 
     __tablename__ = 'tag'
 
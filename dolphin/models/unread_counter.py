@@ -0,0 +1,143 @@
+from itertools import chain
+
+from restfulpy.orm import Field, DeclarativeBase, OrderingMixin, \
+    FilteringMixin
+from sqlalchemy import Integer, ForeignKey, Enum, Index, UniqueConstraint, \
+    select, func, join, insert, delete, table, column
+from sqlalchemy.event import listens_for
+from sqlalchemy.inspection import inspect
+from sqlalchemy.orm import Session
+
+from .issue import Issue, issue_kinds
+from .subscribable import Subscription
+
+
+issue_table = Issue.__table__
+member_table = table('member', column('id'))
+
+
+# The first key of the advisory locks of the refreshes, the second one is
+# the member id
+REFRESH_LOCK_KEY = 1
+
+
+class UnreadCounter(OrderingMixin, FilteringMixin, DeclarativeBase):
+    """Denormalized per member counts of the unread issues, by project and
+    kind.
+
+    An issue is unread by a member whose subscription to it has not been
+    seen. The counters of a member are recomputed in the same flush which
+    changes their subscriptions, and by ``Subscription.see`` and
+    ``Subscription.unsee``, so the badges are read without joining the
+    subscriptions. The refreshes of a member are serialized by an advisory
+    lock, so the concurrent ones do not insert the same counters twice.
+
+    """
+
+    __tablename__ = 'unread_counter'
+    __table_args__ = (
+        Index('ix_unread_counter_member_id', 'member_id'),
+        UniqueConstraint('member_id', 'project_id', 'kind'),
+    )
+
+    id = Field(Integer, primary_key=True, protected=True)
+    member_id = Field(
+        Integer,
+        ForeignKey('member.id', ondelete='CASCADE'),
+        protected=True,
+    )
+    project_id = Field(
+        Integer,
+        ForeignKey('project.id', ondelete='CASCADE'),
+        nullable=True,
+        readonly=True,
+        label='Project',
+    )
+    kind = Field(
+        Enum(*issue_kinds, name='kind'),
+        python_type=str,
+        readonly=True,
+        label='Type',
+    )
+    count = Field(Integer, nullable=False, readonly=True, label='Count')
+
+    @classmethod
+    def create_refresh_statements(cls, member_ids):
+        """Returns the statements which recompute the counters of the given
+        members, ``member_ids`` is either a collection or a select.
+
+        """
+        return [
+            delete(cls.__table__).where(cls.member_id.in_(member_ids)),
+            insert(cls.__table__).from_select(
+                [cls.member_id, cls.project_id, cls.kind, cls.count],
+                select([
+                    Subscription.member_id,
+                    issue_table.c.project_id,
+                    issue_table.c.kind,
+                    func.count(),
+                ])
+                .select_from(
+                    join(
+                        Subscription,
+                        issue_table,
+                        Subscription.subscribable_id == issue_table.c.id
+                    )
+                )
+                .where(Subscription.seen_at.is_(None))
+                .where(Subscription.member_id.in_(member_ids))
+                .group_by(
+                    Subscription.member_id,
+                    issue_table.c.project_id,
+                    issue_table.c.kind
+                )
+            ),
+        ]
+
+    @staticmethod
+    def create_lock_statement(member_ids):
+        """Takes the advisory locks of the given members until the end of
+        the transaction, in order, so the refreshes do not deadlock.
+
+        """
+        return select([
+            func.pg_advisory_xact_lock(REFRESH_LOCK_KEY, member_table.c.id)
+        ]) \
+            .where(member_table.c.id.in_(member_ids)) \
+            .order_by(member_table.c.id)
+
+    @classmethod
+    def refresh(cls, session, member_ids):
+        session.execute(cls.create_lock_statement(member_ids))
+        for statement in cls.create_refresh_statements(member_ids):
+            session.execute(statement)
+
+
+@listens_for(Session, 'after_flush')
+def refresh_unread_counters(session, flush_context):
+    member_ids = set()
+    issue_ids = set()
+    for instance in chain(session.new, session.dirty, session.deleted):
+        if isinstance(instance, Subscription):
+            member_ids.add(instance.member_id)
+
+        elif isinstance(instance, Issue):
+            state = inspect(instance)
+            members = state.attrs.members.history
+            member_ids.update(m.id for m in members.deleted)
+            if instance in session.new or members.added \
+                    or state.attrs.project_id.history.has_changes() \
+                    or state.attrs.kind.history.has_changes():
+                issue_ids.add(instance.id)
+
+    member_ids.discard(None)
+    issue_ids.discard(None)
+    if member_ids:
+        UnreadCounter.refresh(session, member_ids)
+
+    if issue_ids:
+        UnreadCounter.refresh(
+            session,
+            select([Subscription.member_id])
+            .where(Subscription.subscribable_id.in_(issue_ids))
+        )
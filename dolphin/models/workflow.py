@@ -4,11 +4,12 @@ from restfulpy.orm import Field, relationship, SoftDeleteMixin, \
 from restfulpy.orm.metadata import MetadataField
 from sqlalchemy import Integer, String, Unicode
 
+from ..mixins import FieldsetMixin
 from .phase import Phase
 
 
 class Workflow(ModifiedMixin, OrderingMixin, FilteringMixin, PaginationMixin,
-               SoftDeleteMixin, DeclarativeBase):
+               SoftDeleteMixin, FieldsetMixin, DeclarativeBase):
 
     __tablename__ = 'workflow'
 
@@ -0,0 +1,132 @@
+import re
+from abc import ABC, abstractmethod
+from difflib import SequenceMatcher
+
+from nanohttp import settings
+from sqlalchemy import or_, func, case, literal_column, false
+
+
+WORD_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+
+class SearchEngine(ABC):
+    """Filters a query by a search phrase and orders it by relevance.
+
+    ``titles`` are the short columns which are matched by substring,
+    ``texts`` are the long columns which are matched by words and
+    ``identifier`` matches the whole phrase when it is a number.
+
+    """
+
+    @abstractmethod
+    def search(self, query, phrase, titles, texts=(), identifier=None,
+               rank=True):
+        pass
+
+    @staticmethod
+    def get_identifier(phrase):
+        phrase = phrase.strip()
+        return int(phrase) if phrase.isdigit() else None
+
+
+class PostgresqlSearchEngine(SearchEngine):
+    """Uses the `pg_trgm` GIN indexes of the titles and the `tsvector` GIN
+    indexes of the texts, which are created by the migrations.
+
+    """
+
+    configuration = literal_column('\'simple\'')
+
+    def create_tsquery(self, phrase):
+        words = WORD_PATTERN.findall(phrase)
+        if not words:
+            return None
+
+        return func.to_tsquery(
+            self.configuration,
+            ' & '.join(f'{w}:*' for w in words)
+        )
+
+    def search(self, query, phrase, titles, texts=(), identifier=None,
+               rank=True):
+        tsquery = self.create_tsquery(phrase)
+        pattern = f'%{phrase}%'
+
+        conditions = [c.ilike(pattern) for c in titles]
+        ranks = [func.similarity(c, phrase) for c in titles]
+
+        if tsquery is not None:
+            for c in texts:
+                tsvector = func.to_tsvector(self.configuration, c)
+                conditions.append(tsvector.op('@@')(tsquery))
+                ranks.append(func.ts_rank(tsvector, tsquery))
+
+        if identifier is not None and self.get_identifier(phrase) is not None:
+            conditions.append(identifier == self.get_identifier(phrase))
+
+        query = query.filter(or_(*conditions))
+        if rank:
+            rank = func.greatest(*ranks) if len(ranks) > 1 else ranks[0]
+            query = query.order_by(rank.desc())
+
+        return query
+
+
+class InProcessSearchEngine(SearchEngine):
+    """Scans the rows in the application process, a fallback for the
+    databases without the `pg_trgm` extension.
+
+    """
+
+    def search(self, query, phrase, titles, texts=(), identifier=None,
+               rank=True):
+        entity = query.column_descriptions[0]['entity']
+        phrase_identifier = self.get_identifier(phrase)
+        phrase = phrase.casefold()
+        words = set(w.casefold() for w in WORD_PATTERN.findall(phrase))
+
+        scores = {}
+        rows = query.session.query(entity.id, *titles, *texts)
+        for id_, *values in rows:
+            title_values = [v.casefold() for v in values[:len(titles)] if v]
+            text_words = set()
+            for value in values[len(titles):]:
+                if value:
+                    text_words.update(
+                        w.casefold() for w in WORD_PATTERN.findall(value)
+                    )
+
+            is_matched = \
+                any(phrase in v for v in title_values) or \
+                bool(words) and all(
+                    any(t.startswith(w) for t in text_words) for w in words
+                ) or \
+                identifier is not None and id_ == phrase_identifier
+
+            if is_matched:
+                scores[id_] = max(
+                    [SequenceMatcher(None, phrase, v).ratio()
+                     for v in title_values] or [0]
+                )
+
+        if not scores:
+            return query.filter(false())
+
+        query = query.filter(entity.id.in_(scores))
+        if rank:
+            query = query.order_by(case(
+                [(entity.id == id_, score) for id_, score in scores.items()],
+                else_=0
+            ).desc())
+
+        return query
+
+
+search_engines = dict(
+    postgresql=PostgresqlSearchEngine,
+    inprocess=InProcessSearchEngine,
+)
+
+
+def get_search_engine():
+    return search_engines[settings.search.engine]()
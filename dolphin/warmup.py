@@ -0,0 +1,115 @@
+"""Pays the one time costs of a process before it serves requests.
+
+SQLAlchemy configures the mappers, initializes the dialect on the first
+connection, and compiles the statement and builds the loaders of a model
+on its first query, so otherwise the first requests of every worker pay
+for them. The list queries are warmed up with the loading options of
+``dump_query``, but without rows, so the eager loads of the relationships
+are still compiled by the first requests.
+
+``wsgi.py`` warms up once in the master when gunicorn preloads the
+application (``./gunicorn-preload``), then the forked workers inherit the
+result, or once in each worker before it accepts connections. The models
+which fail, e.g. while the database is not reachable, are logged and
+served cold.
+
+The metadata cache is filled by ``Dolphin.initialize_orm``.
+
+"""
+import time
+
+from restfulpy import logger
+from restfulpy.orm import DBSession
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import configure_mappers, Load
+
+from .mixins import FieldsetMixin
+from .models import Issue, Item, IssuePhase, Project, Resource, Release, \
+    Member, Organization, AbstractPhaseSummaryView, \
+    AbstractResourceSummaryView
+
+
+# The models of the common list queries
+MODELS = (
+    Issue,
+    Item,
+    IssuePhase,
+    Project,
+    Resource,
+    Release,
+    Member,
+    Organization,
+)
+
+
+# The views which are mapped on their first use
+VIEWS = (
+    AbstractPhaseSummaryView,
+    AbstractResourceSummaryView,
+)
+
+
+# The values of the parameters which are taken from the identity of the
+# request otherwise, there is no request while warming up
+PARAMETERS = dict(
+    reference_id=None,
+    organization_id=None,
+    member_email=None,
+)
+
+
+def iter_loading_options(model):
+    """The loading options of the list queries of the ``model``, built by
+    the same methods as ``dump_query``.
+
+    """
+    yield []
+
+    if hasattr(model, 'create_bulk_loading_options'):
+        yield model.create_bulk_loading_options()
+
+    if issubclass(model, FieldsetMixin):
+        yield model.create_fieldset_loading_options(
+            list(model.get_fieldset_columns()),
+            Load(model)
+        )
+
+
+def warm_up(engine):
+    """Returns the models which are not warmed up."""
+    started_at = time.monotonic()
+    configure_mappers()
+
+    for view in VIEWS:
+        view.get_mapped_class()
+
+    failed = []
+    try:
+        # No rows are loaded, so only the statements of the models are
+        # compiled and their loaders are built with the options of the real
+        # queries, the eager loads of the relationships are compiled by the
+        # first rows.
+        for model in MODELS:
+            try:
+                for options in iter_loading_options(model):
+                    DBSession.query(model) \
+                        .options(*options) \
+                        .params(**PARAMETERS) \
+                        .limit(0) \
+                        .all()
+
+            except SQLAlchemyError as ex:
+                # The model is served cold instead, e.g. while the database
+                # is not reachable yet
+                logger.error(f'Cannot warm up {model.__name__}: {ex}')
+                DBSession.rollback()
+                failed.append(model)
+
+    finally:
+        DBSession.remove()
+
+        # The connections must not be shared with the forked workers
+        engine.dispose()
+
+    logger.info(f'Warmed up in {time.monotonic() - started_at:.3f} seconds')
+    return failed
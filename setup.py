@@ -24,6 +24,10 @@ setup(
     version=package_version,
     packages=find_packages(),
     install_requires=dependencies,
+    extras_require={
+        # The cooperative workers of `./gunicorn-gevent`
+        'gevent': ['gevent', 'psycogreen'],
+    },
     include_package_data=True,
     entry_points={
         'console_scripts': [
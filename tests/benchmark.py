@@ -0,0 +1,236 @@
+"""Benchmarks the hot endpoints against a synthetic dataset.
+
+The file is not collected by default, run it explicitly:
+
+    $ pytest -s tests/benchmark.py
+
+The dataset is built by :class:`dolphin.dataset.DatasetGenerator`, its size
+and the number of requests per scenario are read from the
+``DOLPHIN_BENCHMARK_*`` environment variables, see ``SIZES``.
+
+"""
+import io
+import itertools
+import math
+import os
+import random
+import time
+from datetime import datetime, timedelta
+from urllib.parse import urlencode
+from wsgiref.util import setup_testing_defaults
+
+import ujson
+from restfulpy.orm import DBSession
+
+from .helpers import LocalApplicationTestCase, oauth_mockup_server, \
+    chat_mockup_server
+from dolphin.controllers.items import VALID_ZONES
+from dolphin.dataset import DatasetGenerator, WORDS
+from dolphin.instrumentation import SQLInstrumentationMiddleWare
+from dolphin.models import Member, OrganizationMember, Issue, IssuePhase, \
+    Item, Phase
+
+
+SIZES = dict(
+    organizations=1,
+    members=10,
+    projects=5,
+    issues=20,
+    items=2,
+    dailyreports=5,
+    seed=0,
+    iterations=50,
+)
+
+
+def get_size(name):
+    return int(os.environ.get(
+        f'DOLPHIN_BENCHMARK_{name.upper()}',
+        SIZES[name]
+    ))
+
+
+def percentile(values, percent):
+    values = sorted(values)
+    return values[max(math.ceil(len(values) * percent / 100) - 1, 0)]
+
+
+class Benchmark:
+    """Calls the WSGI application in-process and records the latency and
+    the SQL query count of each request, per scenario.
+
+    """
+
+    def __init__(self, application, token):
+        self.application = SQLInstrumentationMiddleWare(application)
+        self.token = token
+        self.results = {}
+
+    def request(self, verb, path, query=None, form=None):
+        body = ujson.dumps(form).encode() if form is not None else b''
+        environ = {
+            'REQUEST_METHOD': verb,
+            'PATH_INFO': path,
+            'QUERY_STRING': urlencode(query or {}),
+            'CONTENT_TYPE': 'application/json',
+            'CONTENT_LENGTH': str(len(body)),
+            'HTTP_AUTHORIZATION': self.token,
+            'wsgi.input': io.BytesIO(body),
+        }
+        setup_testing_defaults(environ)
+        response = {}
+
+        def start_response(status, headers, exc_info=None):
+            response['status'] = status
+            response['headers'] = dict(headers)
+
+        started_at = time.monotonic()
+        result = self.application(environ, start_response)
+        try:
+            b''.join(result)
+
+        finally:
+            if hasattr(result, 'close'):
+                result.close()
+
+        elapsed = (time.monotonic() - started_at) * 1000
+        return response['status'], \
+            int(response['headers'].get('X-SQL-Query-Count', 0)), \
+            elapsed
+
+    def run(self, name, requests):
+        result = self.results[name] = dict(
+            latencies=[],
+            queries=[],
+            failures=[],
+        )
+        for request in requests:
+            status, queries, elapsed = self.request(*request)
+            result['latencies'].append(elapsed)
+            result['queries'].append(queries)
+            if not status.startswith('2'):
+                result['failures'].append((request, status))
+
+        return result
+
+    def report(self):
+        lines = [
+            f'{"scenario":<20} {"requests":>8} {"failures":>8} '
+            f'{"p50 ms":>8} {"p99 ms":>8} {"queries":>8} {"max":>5}'
+        ]
+        for name, result in self.results.items():
+            latencies = result['latencies']
+            queries = result['queries']
+            lines.append(
+                f'{name:<20} {len(latencies):>8} '
+                f'{len(result["failures"]):>8} '
+                f'{percentile(latencies, 50):>8.2f} '
+                f'{percentile(latencies, 99):>8.2f} '
+                f'{sum(queries) / len(queries):>8.1f} '
+                f'{max(queries):>5}'
+            )
+
+        return '\n'.join(lines)
+
+
+class TestBenchmark(LocalApplicationTestCase):
+    # The searches are measured by the engine of the production
+    __configuration__ = LocalApplicationTestCase.__configuration__ + '''
+            search:
+              engine: postgresql
+        '''
+
+    @classmethod
+    def mockup(cls):
+        DatasetGenerator(
+            organizations=get_size('organizations'),
+            members=get_size('members'),
+            projects=get_size('projects'),
+            issues=get_size('issues'),
+            items=get_size('items'),
+            dailyreports=get_size('dailyreports'),
+            seed=get_size('seed'),
+        ).generate()
+
+    def create_assignments(self, organization_id, count):
+        members = [m for m, in DBSession.query(OrganizationMember.member_id)
+                   .filter(OrganizationMember.organization_id ==
+                           organization_id)]
+        issues = [i for i, in DBSession.query(Issue.id)]
+        phases = [p for p, in DBSession.query(Phase.id)]
+        assigned = set(
+            DBSession.query(IssuePhase.issue_id, IssuePhase.phase_id,
+                            Item.member_id)
+            .join(Item, Item.issue_phase_id == IssuePhase.id)
+        )
+
+        candidates = list(itertools.product(issues, phases, members))
+        random.Random(0).shuffle(candidates)
+        return [c for c in candidates if c not in assigned][:count]
+
+    def test_benchmark(self):
+        iterations = get_size('iterations')
+        owner = DBSession.query(OrganizationMember) \
+            .filter(OrganizationMember.role == 'owner') \
+            .order_by(OrganizationMember.organization_id) \
+            .first()
+        member = DBSession.query(Member).get(owner.member_id)
+        self.login(member.email, owner.organization_id)
+
+        issues = [i for i, in DBSession.query(Issue.id).order_by(Issue.id)]
+        items = [i for i, in DBSession.query(Item.id)
+                 .filter(Item.member_id == member.id)
+                 .order_by(Item.id)]
+        assignments = self.create_assignments(
+            owner.organization_id,
+            iterations
+        )
+        today = datetime.now().date()
+        page = dict(take=50)
+
+        benchmark = Benchmark(
+            self.__application__,
+            self._authentication_token
+        )
+        with oauth_mockup_server(), chat_mockup_server():
+            benchmark.run('issue list', (
+                ('LIST', '/apiv1/issues', page)
+                for i in range(iterations)
+            ))
+            benchmark.run('issue search', (
+                ('SEARCH', '/apiv1/issues', page,
+                 dict(query=WORDS[i % len(WORDS)]))
+                for i in range(iterations)
+            ))
+            benchmark.run('item zones', (
+                ('LIST', '/apiv1/items',
+                 dict(zone=VALID_ZONES[i % len(VALID_ZONES)], **page))
+                for i in range(iterations)
+            ))
+            benchmark.run('phase summaries', (
+                ('LIST', f'/apiv1/issues/{issues[i % len(issues)]}/'
+                 'phasessummaries')
+                for i in range(iterations)
+            ))
+            benchmark.run('issue assign', (
+                ('ASSIGN', f'/apiv1/issues/{issue_id}', None,
+                 dict(phaseId=phase_id, memberId=member_id))
+                for issue_id, phase_id, member_id in assignments
+            ))
+            if items:
+                benchmark.run('item estimate', (
+                    ('ESTIMATE', f'/apiv1/items/{items[i % len(items)]}',
+                     None, dict(
+                         startDate=today.isoformat(),
+                         endDate=(today + timedelta(days=3)).isoformat(),
+                         estimatedHours=10,
+                     ))
+                    for i in range(iterations)
+                ))
+
+        print()
+        print(benchmark.report())
+
+        for name, result in benchmark.results.items():
+            assert not result['failures'], (name, result['failures'][:3])
+
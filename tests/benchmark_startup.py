@@ -0,0 +1,167 @@
+"""Compares the boot time and the first requests of the gunicorn workers,
+cold, warmed up and preloaded.
+
+The file is not collected by default, gunicorn is required to run it:
+
+    $ pytest -s tests/benchmark_startup.py
+
+Each scenario serves ``wsgi.py`` on the test database, then the common list
+queries are requested once each, which is what the warm up pays for in
+advance, see ``dolphin.warmup``, and ``DOLPHIN_BENCHMARK_ITERATIONS`` times
+more. The boot time is the seconds from starting gunicorn to its first
+response.
+
+"""
+import os
+import tempfile
+import time
+
+import requests
+from nanohttp import settings
+
+from .benchmark_workers import Server, ThreadingWSGIServer, CAS_MEMBER, \
+    create_slow_cas, get_size as get_workers_size, percentile
+from .helpers import LocalApplicationTestCase
+from .mockup import mockup_http_server
+from dolphin.models import Member
+
+
+SIZES = dict(
+    iterations=20,
+)
+
+
+SCENARIOS = (
+    ('cold', False, ()),
+    ('warm', True, ()),
+    ('preloaded', True, ('--preload', )),
+)
+
+
+PATHS = (
+    '/apiv1/issues',
+    '/apiv1/items',
+    '/apiv1/projects',
+    '/apiv1/releases',
+    '/apiv1/members',
+)
+
+
+def get_size(name):
+    if name not in SIZES:
+        return get_workers_size(name)
+
+    return int(os.environ.get(
+        f'DOLPHIN_BENCHMARK_{name.upper()}',
+        SIZES[name]
+    ))
+
+
+class Benchmark:
+    """Records the boot time and the latency of the first and the rest of
+    the requests, per scenario.
+
+    """
+
+    def __init__(self, token):
+        self.token = token
+        self.results = {}
+
+    def request(self, session, url):
+        started_at = time.monotonic()
+        response = session.request(
+            'LIST',
+            url,
+            headers=dict(Authorization=self.token)
+        )
+        return response.status_code, (time.monotonic() - started_at) * 1000
+
+    def run(self, name, server):
+        session = requests.Session()
+        result = self.results[name] = dict(
+            boot_time=server.boot_time,
+            first=[],
+            latencies=[],
+            failures=[],
+        )
+        for i in range(get_size('iterations') + 1):
+            for path in PATHS:
+                status, latency = self.request(session, server.url + path)
+                result['first' if i == 0 else 'latencies'].append(latency)
+                if status != 200:
+                    result['failures'].append((path, status))
+
+        return result
+
+    def report(self):
+        lines = [
+            f'{"scenario":<10} {"boot s":>8} {"failures":>8} '
+            f'{"first ms":>9} {"p50 ms":>8} {"p99 ms":>8}'
+        ]
+        for name, result in self.results.items():
+            latencies = result['latencies']
+            lines.append(
+                f'{name:<10} {result["boot_time"]:>8.2f} '
+                f'{len(result["failures"]):>8} '
+                f'{max(result["first"]):>9.2f} '
+                f'{percentile(latencies, 50):>8.2f} '
+                f'{percentile(latencies, 99):>8.2f}'
+            )
+
+        return '\n'.join(lines)
+
+
+class TestStartupBenchmark(LocalApplicationTestCase):
+
+    @classmethod
+    def mockup(cls):
+        session = cls.create_session()
+        cls.member = Member(
+            title=CAS_MEMBER['title'],
+            email=CAS_MEMBER['email'],
+            avatar=CAS_MEMBER['avatar'],
+            first_name=CAS_MEMBER['firstName'],
+            last_name=CAS_MEMBER['lastName'],
+            access_token='access token 1',
+            reference_id=CAS_MEMBER['id'],
+        )
+        session.add(cls.member)
+        session.commit()
+
+    def test_benchmark(self):
+        self.login(self.member.email)
+        benchmark = Benchmark(self._authentication_token)
+
+        with mockup_http_server(
+                create_slow_cas(0),
+                server_class=ThreadingWSGIServer
+        ) as (_, cas_url):
+            for name, warm_up, options in SCENARIOS:
+                with tempfile.NamedTemporaryFile(
+                        'w',
+                        suffix='.yml'
+                ) as configuration:
+                    configuration.write(f'''
+                        db:
+                          url: {settings.db.url}
+                        oauth:
+                          url: {cas_url}
+                        changefeed:
+                          listen: false
+                        warm_up:
+                          enabled: {str(warm_up).lower()}
+                    ''')
+                    configuration.flush()
+
+                    with Server(
+                            'sync',
+                            configuration.name,
+                            options
+                    ) as server:
+                        benchmark.run(name, server)
+
+        print()
+        print(benchmark.report())
+
+        for name, result in benchmark.results.items():
+            assert not result['failures'], (name, result['failures'][:3])
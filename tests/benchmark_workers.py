@@ -0,0 +1,265 @@
+"""Compares the throughput of the sync and the gevent workers of gunicorn
+while CAS is slow.
+
+The file is not collected by default, gunicorn and the ``gevent`` extra are
+required to run it:
+
+    $ pip install -e .[gevent]
+    $ pytest -s tests/benchmark_workers.py
+
+Each kind of worker serves ``wsgi.py`` on the test database, and every
+request is authenticated against a CAS stand-in which answers after
+``DOLPHIN_BENCHMARK_LATENCY`` milliseconds, the member cache is disabled.
+The requests are sent by ``DOLPHIN_BENCHMARK_CONCURRENCY`` clients, see
+``SIZES``.
+
+A sync worker serves one request at a time, so its throughput is bound to
+``workers / latency``, the gevent workers wait for CAS concurrently.
+
+"""
+import math
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from os import path
+from socketserver import ThreadingMixIn
+from wsgiref.simple_server import WSGIServer
+
+import requests
+import ujson
+from nanohttp import settings
+
+from .helpers import LocalApplicationTestCase
+from .mockup import mockup_http_server
+from dolphin.models import Member
+
+
+HERE = path.abspath(path.dirname(__file__))
+ROOT = path.abspath(path.join(HERE, '..'))
+
+
+SIZES = dict(
+    latency=200,
+    requests=200,
+    concurrency=50,
+    workers=2,
+    worker_connections=100,
+)
+
+
+WORKER_CLASSES = ('sync', 'gevent')
+
+
+CAS_MEMBER = dict(
+    id=1,
+    title='member1',
+    email='member1@example.com',
+    avatar='avatar1',
+    firstName='First',
+    lastName='Last',
+)
+
+
+def get_size(name):
+    return int(os.environ.get(
+        f'DOLPHIN_BENCHMARK_{name.upper()}',
+        SIZES[name]
+    ))
+
+
+def percentile(values, percent):
+    values = sorted(values)
+    return values[max(math.ceil(len(values) * percent / 100) - 1, 0)]
+
+
+def get_free_port():
+    with socket.socket() as s:
+        s.bind(('localhost', 0))
+        return s.getsockname()[1]
+
+
+class ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+
+def create_slow_cas(latency):
+    def application(environ, start_response):
+        time.sleep(latency / 1000)
+        start_response('200 OK', [('Content-Type', 'application/json')])
+        return [ujson.dumps(CAS_MEMBER).encode()]
+
+    return application
+
+
+class Server:
+    """A gunicorn serving ``wsgi.py`` in a subprocess.
+
+    ``boot_time`` is the seconds from starting it to its first response.
+
+    """
+
+    def __init__(self, worker_class, configuration_filename, options=()):
+        self.worker_class = worker_class
+        self.configuration_filename = configuration_filename
+        self.options = list(options)
+        self.url = f'http://localhost:{get_free_port()}'
+        self.process = None
+        self.boot_time = None
+
+    def __enter__(self):
+        started_at = time.monotonic()
+        self.process = subprocess.Popen(
+            [
+                sys.executable, '-m', 'gunicorn',
+                '--worker-class', self.worker_class,
+                '--workers', str(get_size('workers')),
+                '--worker-connections', str(get_size('worker_connections')),
+                '--bind', self.url.replace('http://', ''),
+                *self.options,
+                'wsgi:app',
+            ],
+            cwd=ROOT,
+            env=dict(
+                os.environ,
+                DOLPHIN_CONFIGURATION=self.configuration_filename,
+            ),
+        )
+
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            assert self.process.poll() is None, 'Gunicorn has exited'
+            try:
+                requests.get(f'{self.url}/apiv1/version', timeout=1)
+                self.boot_time = time.monotonic() - started_at
+                return self
+
+            except requests.ConnectionError:
+                time.sleep(.2)
+
+        raise TimeoutError(f'Gunicorn is not serving on {self.url}')
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.process.terminate()
+        self.process.wait()
+
+
+class Benchmark:
+    """Sends the same request by concurrent clients and records the
+    throughput and the latency, per kind of worker.
+
+    """
+
+    def __init__(self, token):
+        self.token = token
+        self.results = {}
+
+    def run(self, name, url):
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_maxsize=get_size('concurrency')
+        )
+        session.mount('http://', adapter)
+
+        def request(_):
+            started_at = time.monotonic()
+            response = session.get(
+                url,
+                headers=dict(Authorization=self.token)
+            )
+            return response.status_code, \
+                (time.monotonic() - started_at) * 1000
+
+        started_at = time.monotonic()
+        with ThreadPoolExecutor(
+                max_workers=get_size('concurrency')
+        ) as executor:
+            responses = list(executor.map(
+                request,
+                range(get_size('requests'))
+            ))
+
+        elapsed = time.monotonic() - started_at
+        result = self.results[name] = dict(
+            throughput=len(responses) / elapsed,
+            latencies=[latency for _, latency in responses],
+            failures=[status for status, _ in responses if status != 200],
+        )
+        return result
+
+    def report(self):
+        lines = [
+            f'{"worker":<10} {"requests":>8} {"failures":>8} '
+            f'{"req/s":>8} {"p50 ms":>8} {"p99 ms":>8}'
+        ]
+        for name, result in self.results.items():
+            latencies = result['latencies']
+            lines.append(
+                f'{name:<10} {len(latencies):>8} '
+                f'{len(result["failures"]):>8} '
+                f'{result["throughput"]:>8.1f} '
+                f'{percentile(latencies, 50):>8.2f} '
+                f'{percentile(latencies, 99):>8.2f}'
+            )
+
+        return '\n'.join(lines)
+
+
+class TestWorkersBenchmark(LocalApplicationTestCase):
+
+    @classmethod
+    def mockup(cls):
+        session = cls.create_session()
+        cls.member = Member(
+            title=CAS_MEMBER['title'],
+            email=CAS_MEMBER['email'],
+            avatar=CAS_MEMBER['avatar'],
+            first_name=CAS_MEMBER['firstName'],
+            last_name=CAS_MEMBER['lastName'],
+            access_token='access token 1',
+            reference_id=CAS_MEMBER['id'],
+        )
+        session.add(cls.member)
+        session.commit()
+
+    def test_benchmark(self):
+        self.login(self.member.email)
+        benchmark = Benchmark(self._authentication_token)
+
+        with mockup_http_server(
+                create_slow_cas(get_size('latency')),
+                server_class=ThreadingWSGIServer
+        ) as (_, cas_url), tempfile.NamedTemporaryFile(
+                'w',
+                suffix='.yml'
+        ) as configuration:
+            configuration.write(f'''
+                db:
+                  url: {settings.db.url}
+                oauth:
+                  url: {cas_url}
+                  member_cache:
+                    ttl: 0
+                changefeed:
+                  listen: false
+            ''')
+            configuration.flush()
+
+            for worker_class in WORKER_CLASSES:
+                with Server(worker_class, configuration.name) as server:
+                    benchmark.run(
+                        worker_class,
+                        f'{server.url}/apiv1/members/{self.member.id}'
+                    )
+
+        print()
+        print(benchmark.report())
+
+        for name, result in benchmark.results.items():
+            assert not result['failures'], (name, result['failures'][:3])
+
+        assert benchmark.results['gevent']['throughput'] > \
+            benchmark.results['sync']['throughput']
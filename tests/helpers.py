@@ -10,6 +10,7 @@ from restfulpy.testing import ApplicableTestCase, db
 from .mockup import mockup_http_server
 from dolphin import Dolphin
 from dolphin.authentication import Authenticator
+from dolphin.backends import BackendClient
 from dolphin.models import Member, Project, Release, Issue, Item, \
     Organization, Invitation, Group, Workflow
 
@@ -73,6 +74,15 @@ class LocalApplicationTestCase(ApplicableTestCase):
                 max_length: 5
         '''
 
+    @classmethod
+    def initialize_orm(cls):
+        super().initialize_orm()
+
+        # The schema of the tests is not created by the migrations, so the
+        # extension of the search engine is created here
+        with cls._engine.connect() as connection:
+            connection.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
     def login(self, email, organization_id=None):
         session = self.create_session()
         member = session.query(Member).filter(Member.email == email).one()
@@ -229,6 +239,7 @@ def chat_mockup_server():
             chat:
               url: {url}
         ''')
+        BackendClient.reset_circuit_breakers()
         yield app
 
 
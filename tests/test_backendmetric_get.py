@@ -0,0 +1,48 @@
+from bddrest import status, when, response
+
+from .helpers import LocalApplicationTestCase, oauth_mockup_server
+from dolphin.backends import metrics
+from dolphin.models import Member
+
+
+class TestBackendMetric(LocalApplicationTestCase):
+
+    @classmethod
+    def mockup(cls):
+        session = cls.create_session()
+        member = Member(
+            title='First Member',
+            email='member1@example.com',
+            access_token='access token 1',
+            phone=123456789,
+            reference_id=1
+        )
+        session.add(member)
+        session.commit()
+
+    def test_get(self):
+        self.login('member1@example.com')
+        metrics.begin('CAS')
+        metrics.end('CAS', 0.5)
+
+        with oauth_mockup_server(), self.given(
+            'Get the metrics of the backends',
+            '/apiv1/backendmetrics',
+            'GET',
+        ):
+            assert status == 200
+
+            cas_metrics = response.json['CAS']
+            assert cas_metrics['requests'] >= 1
+            assert cas_metrics['in_flight'] == 0
+            assert cas_metrics['max_latency'] >= 0.5
+            assert cas_metrics['circuit'] == 'closed'
+
+            when(
+                'Sending form',
+                form=dict(whyDidYouDoThat='IDK'),
+            )
+            assert status == '709 Form Not Allowed'
+
+            when('Request is not authorized', authorization=None)
+            assert status == 401
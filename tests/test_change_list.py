@@ -0,0 +1,173 @@
+import time
+from datetime import datetime, timedelta
+
+from auditor.context import Context as AuditLogContext
+from bddrest import status, when, response, Update
+from nanohttp import context
+from nanohttp.contexts import Context
+from restfulpy.orm import DBSession
+
+from .helpers import LocalApplicationTestCase, oauth_mockup_server
+from dolphin.models import Issue, Project, Member, Workflow, Group, \
+    Subscription, Release, Change
+
+
+class TestChange(LocalApplicationTestCase):
+
+    @classmethod
+    @AuditLogContext(dict())
+    def mockup(cls):
+        session = cls.create_session()
+
+        cls.member1 = Member(
+            title='First Member',
+            email='member1@example.com',
+            access_token='access token 1',
+            phone=123456789,
+            reference_id=1
+        )
+        session.add(cls.member1)
+        session.commit()
+
+        workflow = Workflow(title='Default')
+        group = Group(title='default')
+
+        release = Release(
+            title='My first release',
+            description='A decription for my first release',
+            cutoff='2030-2-20',
+            launch_date='2030-2-20',
+            manager=cls.member1,
+            room_id=0,
+            group=group,
+        )
+
+        project = Project(
+            release=release,
+            workflow=workflow,
+            group=group,
+            manager=cls.member1,
+            title='My first project',
+            description='A decription for my project',
+            room_id=1
+        )
+        session.add(project)
+
+        with Context(dict()):
+            context.identity = cls.member1
+
+            cls.issue1 = Issue(
+                project=project,
+                title='First issue',
+                description='This is description of first issue',
+                kind='feature',
+                days=1,
+                room_id=2
+            )
+            session.add(cls.issue1)
+
+            cls.issue2 = Issue(
+                project=project,
+                title='Second issue',
+                description='This is description of second issue',
+                kind='feature',
+                days=1,
+                room_id=3
+            )
+            session.add(cls.issue2)
+            session.flush()
+
+            session.add(Subscription(
+                subscribable_id=cls.issue1.id,
+                member_id=cls.member1.id,
+            ))
+            session.commit()
+
+    def test_list(self):
+        self.login('member1@example.com')
+
+        with oauth_mockup_server(), self.given(
+            'Poll the changes',
+            '/apiv1/changes',
+            'LIST',
+            query=dict(after=0, timeout=0),
+        ):
+            assert status == 200
+            changes = response.json
+            assert set(c['subscribableId'] for c in changes) == \
+                {self.issue1.id}
+            assert set(c['entity'] for c in changes) == \
+                {'issue', 'subscription'}
+            cursor = int(response.headers['X-Change-Cursor'])
+            assert cursor == changes[-1]['id']
+
+            when('Poll after the cursor', query=Update(after=cursor))
+            assert status == 200
+            assert response.json == []
+            assert response.headers['X-Change-Cursor'] == str(cursor)
+
+            started_at = time.monotonic()
+            when(
+                'The sync workers do not wait',
+                query=Update(after=cursor, timeout=5)
+            )
+            assert status == 200
+            assert response.json == []
+            assert time.monotonic() - started_at < 5
+
+            when('Poll without a cursor', query=dict(timeout=0))
+            assert status == 200
+            assert response.json == []
+            assert int(response.headers['X-Change-Cursor']) >= cursor
+
+            when('Invalid cursor', query=Update(after='first'))
+            assert status == 400
+
+            when('Request is not authorized', authorization=None)
+            assert status == 401
+
+    def test_interleaved_transactions(self):
+        self.login('member1@example.com')
+        change = dict(
+            entity='issue',
+            entity_id=self.issue1.id,
+            action='update',
+            subscribable_id=self.issue1.id,
+            member_id=None,
+        )
+
+        # The first change is taken an id before the second one, but it is
+        # committed after it
+        first_session = self.create_session()
+        first_session.execute('SELECT txid_current()')
+        cursor = Change.get_last_id()
+        Change.record(first_session, [change])
+
+        second_session = self.create_session()
+        Change.record(second_session, [change])
+        second_session.commit()
+
+        with oauth_mockup_server(), self.given(
+            'The second change waits for the first one',
+            '/apiv1/changes',
+            'LIST',
+            query=dict(after=cursor, timeout=0),
+        ):
+            assert status == 200
+            assert response.json == []
+            assert response.headers['X-Change-Cursor'] == str(cursor)
+
+            first_session.commit()
+            when('Both of the changes are delivered in order')
+            assert status == 200
+            assert len(response.json) == 2
+            assert response.json[0]['id'] < response.json[1]['id']
+
+    def test_purge(self):
+        count = DBSession.query(Change).count()
+        assert count > 0
+
+        assert Change.purge(datetime.now() - timedelta(days=1)) == 0
+        assert Change.purge(datetime.now() + timedelta(days=1)) == count
+        DBSession.commit()
+        assert DBSession.query(Change).count() == 0
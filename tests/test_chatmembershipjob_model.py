@@ -0,0 +1,129 @@
+from datetime import datetime
+
+from auditor.context import Context as AuditLogContext
+from restfulpy.mule import MuleTask, worker
+
+from .helpers import LocalApplicationTestCase, chat_mockup_server, \
+    chat_server_status
+from dolphin.models import Project, Member, Workflow, Group, Release, \
+    Subscription, ChatMembershipJob
+
+
+class TestChatMembershipJob(LocalApplicationTestCase):
+
+    @classmethod
+    @AuditLogContext(dict())
+    def mockup(cls):
+        session = cls.create_session()
+
+        cls.member = Member(
+            title='First Member',
+            email='member1@example.com',
+            access_token='access token 1',
+            phone=123456789,
+            reference_id=1,
+        )
+        session.add(cls.member)
+
+        workflow = Workflow(title='Default')
+        group = Group(title='default')
+
+        release = Release(
+            title='My first release',
+            description='A decription for my first release',
+            cutoff='2030-2-20',
+            launch_date='2030-2-20',
+            manager=cls.member,
+            room_id=0,
+            group=group,
+        )
+
+        cls.project1 = Project(
+            release=release,
+            workflow=workflow,
+            group=group,
+            manager=cls.member,
+            title='My first project',
+            room_id=1,
+        )
+        session.add(cls.project1)
+
+        cls.project2 = Project(
+            release=release,
+            workflow=workflow,
+            group=group,
+            manager=cls.member,
+            title='My second project',
+            room_id=2,
+        )
+        session.add(cls.project2)
+        session.flush()
+
+        session.add(Subscription(
+            subscribable_id=cls.project1.id,
+            member_id=cls.member.id,
+        ))
+        session.commit()
+
+    def test_do(self):
+        session = self.create_session()
+        ChatMembershipJob.enqueue(session, self.member.id)
+        ChatMembershipJob.enqueue(session, self.member.id, self.project1.id)
+        ChatMembershipJob.enqueue(session, self.member.id, self.project2.id)
+        session.commit()
+
+        with chat_mockup_server():
+            with chat_server_status('503 Service Not Available'):
+                tasks = worker(
+                    tries=0,
+                    filters=MuleTask.type == 'chat_membership_job',
+                )
+                assert [status for _, status in tasks] == ['success'] * 3
+
+            session = self.create_session()
+            retries = session.query(ChatMembershipJob) \
+                .filter(ChatMembershipJob.status == 'new') \
+                .order_by(ChatMembershipJob.id) \
+                .all()
+            assert [(j.subscribable_id, j.attempt) for j in retries] == [
+                (None, 1),
+                (self.project1.id, 1),
+                (self.project2.id, 1),
+            ]
+
+            # Adds the subscribed member and kicks the other one
+            session.query(MuleTask) \
+                .filter(MuleTask.type == 'chat_membership_job') \
+                .filter(MuleTask.status == 'new') \
+                .update(dict(at=datetime.now()), synchronize_session=False)
+            session.commit()
+            tasks = worker(
+                tries=0,
+                filters=MuleTask.type == 'chat_membership_job',
+            )
+            assert [status for _, status in tasks] == ['success'] * 3
+
+            session = self.create_session()
+            assert session.query(ChatMembershipJob) \
+                .filter(ChatMembershipJob.status == 'new') \
+                .count() == 0
+
+    def test_definitive_answers(self):
+        session = self.create_session()
+        ChatMembershipJob.enqueue(session, self.member.id)
+        ChatMembershipJob.enqueue(session, self.member.id, self.project1.id)
+        ChatMembershipJob.enqueue(session, self.member.id, self.project2.id)
+        session.commit()
+
+        # The rejected jobs are not retried
+        with chat_mockup_server(), chat_server_status('403 Forbidden'):
+            tasks = worker(
+                tries=0,
+                filters=MuleTask.type == 'chat_membership_job',
+            )
+            assert [status for _, status in tasks] == ['success'] * 3
+
+        session = self.create_session()
+        assert session.query(ChatMembershipJob) \
+            .filter(ChatMembershipJob.status == 'new') \
+            .count() == 0
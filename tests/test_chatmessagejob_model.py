@@ -0,0 +1,62 @@
+from datetime import datetime
+
+from restfulpy.mule import MuleTask, worker
+
+from .helpers import LocalApplicationTestCase, chat_mockup_server, \
+    chat_server_status
+from dolphin.models import Member, ChatMessageJob
+
+
+class TestChatMessageJob(LocalApplicationTestCase):
+
+    @classmethod
+    def mockup(cls):
+        session = cls.create_session()
+
+        cls.member = Member(
+            title='First Member',
+            email='member1@example.com',
+            access_token='access token 1',
+            phone=123456789,
+            reference_id=1,
+        )
+        session.add(cls.member)
+        session.commit()
+
+    def send(self):
+        tasks = worker(tries=0, filters=MuleTask.type == 'chat_message_job')
+        assert set(status for _, status in tasks) == {'success'}
+
+        session = self.create_session()
+        return session.query(ChatMessageJob) \
+            .filter(ChatMessageJob.status == 'new') \
+            .order_by(ChatMessageJob.id) \
+            .all()
+
+    def test_do(self):
+        session = self.create_session()
+        session.add(ChatMessageJob(
+            room_id=1,
+            member_id=self.member.id,
+            messages=['first', 'second'],
+        ))
+        session.commit()
+
+        with chat_mockup_server():
+            # The unsent messages are retried
+            with chat_server_status('503 Service Not Available'):
+                retries = self.send()
+                assert [(j.messages, j.attempt) for j in retries] == [
+                    (['first', 'second'], 1),
+                ]
+
+            session = self.create_session()
+            session.query(MuleTask) \
+                .filter(MuleTask.type == 'chat_message_job') \
+                .filter(MuleTask.status == 'new') \
+                .update(dict(at=datetime.now()), synchronize_session=False)
+            session.commit()
+
+            # The rejected messages are not retried
+            with chat_server_status('403 Forbidden'):
+                assert self.send() == []
@@ -0,0 +1,130 @@
+from datetime import datetime
+
+from auditor.context import Context as AuditLogContext
+from restfulpy.mule import MuleTask, worker
+
+from .helpers import LocalApplicationTestCase, chat_mockup_server, \
+    chat_server_status
+from dolphin.models import Project, Member, Workflow, Group, Release, \
+    Subscription, ChatRoomMember, ChatReconciliationJob
+
+
+class TestChatReconciliationJob(LocalApplicationTestCase):
+
+    @classmethod
+    @AuditLogContext(dict())
+    def mockup(cls):
+        session = cls.create_session()
+
+        cls.member = Member(
+            title='First Member',
+            email='member1@example.com',
+            access_token='access token 1',
+            phone=123456789,
+            reference_id=1,
+        )
+        session.add(cls.member)
+
+        workflow = Workflow(title='Default')
+        group = Group(title='default')
+
+        release = Release(
+            title='My first release',
+            description='A decription for my first release',
+            cutoff='2030-2-20',
+            launch_date='2030-2-20',
+            manager=cls.member,
+            room_id=0,
+            group=group,
+        )
+
+        cls.project1 = Project(
+            release=release,
+            workflow=workflow,
+            group=group,
+            manager=cls.member,
+            title='My first project',
+            room_id=1,
+        )
+        session.add(cls.project1)
+
+        cls.project2 = Project(
+            release=release,
+            workflow=workflow,
+            group=group,
+            manager=cls.member,
+            title='My second project',
+            room_id=2,
+        )
+        session.add(cls.project2)
+
+        # The room of this project is not provisioned yet
+        cls.project3 = Project(
+            release=release,
+            workflow=workflow,
+            group=group,
+            manager=cls.member,
+            title='My third project',
+        )
+        session.add(cls.project3)
+        session.flush()
+
+        session.add(Subscription(
+            subscribable_id=cls.project1.id,
+            member_id=cls.member.id,
+        ))
+        session.add(Subscription(
+            subscribable_id=cls.project3.id,
+            member_id=cls.member.id,
+        ))
+        ChatRoomMember.add(session, [(cls.project2.id, cls.member.id)])
+        session.commit()
+
+    def reconcile(self):
+        session = self.create_session()
+        session.query(MuleTask) \
+            .filter(MuleTask.type == 'chat_reconciliation_job') \
+            .filter(MuleTask.status == 'new') \
+            .update(dict(at=datetime.now()), synchronize_session=False)
+        ChatReconciliationJob.schedule(session)
+        session.commit()
+
+        tasks = worker(
+            tries=0,
+            filters=MuleTask.type == 'chat_reconciliation_job',
+        )
+        assert [status for _, status in tasks] == ['success']
+
+        session = self.create_session()
+        return session.query(ChatReconciliationJob).get(tasks[0][0])
+
+    def get_room_members(self):
+        session = self.create_session()
+        return session.query(
+            ChatRoomMember.subscribable_id,
+            ChatRoomMember.member_id
+        ).all()
+
+    def test_do(self):
+        with chat_mockup_server():
+            with chat_server_status('503 Service Not Available'):
+                job = self.reconcile()
+                assert (job.missing, job.extra) == (1, 1)
+                assert (job.added, job.kicked, job.failed) == (0, 0, 2)
+                assert self.get_room_members() == \
+                    [(self.project2.id, self.member.id)]
+
+            # The next one is scheduled by the job
+            session = self.create_session()
+            next_job = session.query(ChatReconciliationJob) \
+                .filter(ChatReconciliationJob.status == 'new') \
+                .one()
+            assert next_job.at > datetime.now()
+
+            job = self.reconcile()
+            assert (job.added, job.kicked, job.failed) == (1, 1, 0)
+            assert self.get_room_members() == \
+                [(self.project1.id, self.member.id)]
+
+            job = self.reconcile()
+            assert (job.missing, job.extra) == (0, 0)
@@ -5,7 +5,8 @@ from bddrest.authoring import status, when, Remove, Update
 from .helpers import LocalApplicationTestCase, \
     oauth_mockup_server, oauth_server_status, chat_mockup_server, \
     chat_server_status
-from dolphin.models import Member, Organization, OrganizationMember, Invitation
+from dolphin.models import Member, Organization, OrganizationMember, \
+    Invitation, ChatMembershipJob
 
 
 class TestToken(LocalApplicationTestCase):
@@ -127,3 +128,12 @@ class TestToken(LocalApplicationTestCase):
                     when('Server is not found')
                     assert status == '617 Chat Server Not Found'
 
+                with chat_server_status('503 Service Unavailable'):
+                    when('Chat server is not available')
+                    assert status == 200
+
+                    session = self.create_session()
+                    assert session.query(ChatMembershipJob) \
+                        .filter(ChatMembershipJob.subscribable_id.is_(None)) \
+                        .count() == 1
+
@@ -0,0 +1,90 @@
+import time
+
+import pytest
+from nanohttp import settings
+
+from .helpers import LocalApplicationTestCase, chat_mockup_server, \
+    chat_server_status
+from dolphin.backends import ChatClient, CircuitBreaker, metrics
+from dolphin.exceptions import StatusChatServerNotAvailable, \
+    StatusRoomMemberAlreadyExist
+
+
+class TestCircuitBreaker(LocalApplicationTestCase):
+
+    def test_states(self):
+        circuit_breaker = CircuitBreaker('Test', 2, 0.1)
+        assert circuit_breaker.state == 'closed'
+
+        circuit_breaker.record_failure()
+        circuit_breaker.record_success()
+        circuit_breaker.record_failure()
+        assert circuit_breaker.allow()
+
+        circuit_breaker.record_failure()
+        assert circuit_breaker.state == 'open'
+        assert not circuit_breaker.allow()
+
+        # Only one probe at a time when half open
+        time.sleep(0.1)
+        assert circuit_breaker.state == 'half-open'
+        assert circuit_breaker.allow()
+        assert not circuit_breaker.allow()
+
+        circuit_breaker.record_failure()
+        assert circuit_breaker.state == 'open'
+
+        time.sleep(0.1)
+        assert circuit_breaker.allow()
+        circuit_breaker.record_success()
+        assert circuit_breaker.state == 'closed'
+        assert circuit_breaker.allow()
+
+    def test_chat_client(self):
+        settings.merge('''
+          chat:
+            http:
+              circuit_breaker:
+                failure_threshold: 2
+                reset_timeout: 60
+        ''')
+
+        with chat_mockup_server():
+            with chat_server_status('503 Service Not Available'):
+                for i in range(2):
+                    with pytest.raises(StatusChatServerNotAvailable):
+                        ChatClient().ensure_member('token', 'access token')
+
+            assert ChatClient().circuit_breaker.state == 'open'
+
+            # Rejected without calling the chat server
+            before = metrics.to_dict()['Chat']
+            with pytest.raises(StatusChatServerNotAvailable):
+                ChatClient().ensure_member('token', 'access token')
+
+            chat_metrics = metrics.to_dict()['Chat']
+            assert chat_metrics['requests'] == before['requests']
+            assert chat_metrics['rejected'] == before['rejected'] + 1
+            assert chat_metrics['circuit'] == 'open'
+
+    def test_expected_answers(self):
+        settings.merge('''
+          chat:
+            http:
+              circuit_breaker:
+                failure_threshold: 2
+                reset_timeout: 60
+        ''')
+
+        with chat_mockup_server():
+            with chat_server_status('604 Already Added To Target'):
+                for i in range(3):
+                    with pytest.raises(StatusRoomMemberAlreadyExist):
+                        ChatClient().add_member(
+                            1,
+                            1,
+                            'token',
+                            'access token'
+                        )
+
+            assert ChatClient().circuit_breaker.state == 'closed'
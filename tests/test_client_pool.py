@@ -0,0 +1,29 @@
+import pytest
+from nanohttp import settings
+
+from .helpers import LocalApplicationTestCase, oauth_mockup_server
+from dolphin.backends import CASClient, ChatClient, metrics
+from dolphin.exceptions import StatusCASServerNotAvailable
+
+
+class TestBackendClientPool(LocalApplicationTestCase):
+
+    def test_pooled_session(self):
+        assert CASClient().session is CASClient().session
+        assert CASClient().session is not ChatClient().session
+
+        with oauth_mockup_server():
+            before = metrics.to_dict().get('CAS', dict(requests=0))
+            CASClient().get_member('access token 1')
+            CASClient().get_member('access token 1')
+
+            cas_metrics = metrics.to_dict()['CAS']
+            assert cas_metrics['requests'] == before['requests'] + 2
+            assert cas_metrics['in_flight'] == 0
+            assert cas_metrics['max_latency'] > 0
+
+        settings.oauth.url = 'http://localhost:1'
+        with pytest.raises(StatusCASServerNotAvailable):
+            CASClient().get_member('access token 1')
+
+        assert metrics.to_dict()['CAS']['failures'] >= 1
@@ -11,7 +11,7 @@ from dolphin import Dolphin
 from dolphin.middleware_callback import callback as auditor_callback
 from dolphin.models import Issue, Project, Workflow, Phase, Tag, DraftIssue, \
     Organization, OrganizationMember, Group, Release, Specialty, Resource, \
-    Skill
+    Skill, RoomProvisioningJob
 
 
 def callback(audit_logs):
@@ -165,6 +165,10 @@ class TestIssue(LocalApplicationTestCase):
             created_issue_id = response.json['issueId']
             created_issue = session.query(Issue).get(created_issue_id)
             assert created_issue.modified_by is None
+            assert created_issue.room_id is None
+
+            job = session.query(RoomProvisioningJob).one()
+            assert job.subscribable_ids == [created_issue_id]
 
             assert len(logs) == 2
             assert isinstance(logs[0], InstantiationLogEntry)
@@ -336,38 +340,10 @@ class TestIssue(LocalApplicationTestCase):
             )
             assert status == '649 The Issue Bug Must Have A Related Issue'
 
-            with chat_server_status('404 Not Found'):
-                when(
-                    'Chat server is not found',
-                    json=given | dict(title='Another title')
-                )
-                assert status == '617 Chat Server Not Found'
-
             with chat_server_status('503 Service Not Available'):
                 when(
                     'Chat server is not available',
                     json=given | dict(title='Another title')
                 )
-                assert status == '800 Chat Server Not Available'
-
-            with chat_server_status('500 Internal Service Error'):
-                when(
-                    'Chat server faces with internal error',
-                    json=given | dict(title='Another title')
-                )
-                assert status == '801 Chat Server Internal Error'
-
-            with chat_server_status('615 Room Already Exists'):
-                when(
-                    'Chat server faces with internal error',
-                    json=given | dict(title='Another title')
-                )
-                assert status == 200
-
-            with chat_server_status('604 Already Added To Target'):
-                when(
-                    'Chat server faces with internal error',
-                    json=given | dict(title='Awesome project')
-                )
                 assert status == 200
 
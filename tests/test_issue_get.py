@@ -5,7 +5,7 @@ from nanohttp.contexts import Context
 
 from .helpers import LocalApplicationTestCase, oauth_mockup_server
 from dolphin.models import Issue, Member, Workflow, Group, Project, Release, \
-    Specialty, Phase, Item, IssuePhase, Skill
+    Specialty, Phase, Item, IssuePhase, Skill, Subscription, Tag, IssueTag
 
 
 class TestIssue(LocalApplicationTestCase):
@@ -129,3 +129,114 @@ class TestIssue(LocalApplicationTestCase):
             when('Request is not authorized', authorization=None)
             assert status == 401
 
+
+    def test_conditional_get(self):
+        self.login(self.member.email)
+
+        with oauth_mockup_server(), self.given(
+            'Getting a issue',
+            f'/apiv1/issues/id:{self.issue.id}',
+            'GET'
+        ):
+            assert status == 200
+            etag = response.headers['ETag']
+            last_modified = response.headers['Last-Modified']
+            assert etag.startswith('W/"')
+
+            when(
+                'The client\'s copy is still valid',
+                headers={'If-None-Match': etag}
+            )
+            assert status == 304
+            assert response.headers['ETag'] == etag
+
+            when(
+                'The strong form of the tag matches too',
+                headers={'If-None-Match': etag[2:]}
+            )
+            assert status == 304
+
+            when(
+                'The tag does not match',
+                headers={'If-None-Match': 'W/"stale"'}
+            )
+            assert status == 200
+
+            when(
+                'Not modified since',
+                headers={'If-Modified-Since': last_modified}
+            )
+            assert status == 304
+
+            when(
+                'Modified since',
+                headers={'If-Modified-Since': 'Mon, 01 Jan 2018 00:00:00 GMT'}
+            )
+            assert status == 200
+
+        session = self.create_session()
+        session.add(Subscription(
+            subscribable_id=self.issue.id,
+            member_id=self.member.id,
+        ))
+        session.commit()
+
+        with oauth_mockup_server(), self.given(
+            'The subscription changes the tag',
+            f'/apiv1/issues/id:{self.issue.id}',
+            'GET',
+            headers={'If-None-Match': etag}
+        ):
+            assert status == 200
+            assert response.headers['ETag'] != etag
+            etag = response.headers['ETag']
+
+        tag = Tag(title='First tag')
+        session.add(tag)
+        session.flush()
+        session.add(IssueTag(issue_id=self.issue.id, tag_id=tag.id))
+        session.commit()
+
+        with oauth_mockup_server(), self.given(
+            'The tags change the tag',
+            f'/apiv1/issues/id:{self.issue.id}',
+            'GET',
+            headers={'If-None-Match': etag}
+        ):
+            assert status == 200
+            assert response.headers['ETag'] != etag
+            etag = response.headers['ETag']
+
+        with AuditLogContext(dict()), Context(dict()):
+            context.identity = self.member
+            project = session.query(Project).get(self.project.id)
+            project.title = 'Renamed project'
+            session.commit()
+
+        with oauth_mockup_server(), self.given(
+            'The project changes the tag',
+            f'/apiv1/issues/id:{self.issue.id}',
+            'GET',
+            headers={'If-None-Match': etag}
+        ):
+            assert status == 200
+            assert response.headers['ETag'] != etag
+
+        with oauth_mockup_server(), self.given(
+            'Listing the issues',
+            '/apiv1/issues',
+            'LIST'
+        ):
+            assert status == 200
+            etag = response.headers['ETag']
+            assert 'Last-Modified' not in response.headers
+
+            when('Not modified', headers={'If-None-Match': etag})
+            assert status == 304
+
+            when(
+                'Another page has another tag',
+                query=dict(take=1),
+                headers={'If-None-Match': etag}
+            )
+            assert status == 200
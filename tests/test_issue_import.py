@@ -0,0 +1,158 @@
+import io
+import json
+
+from auditor.context import Context as AuditLogContext
+from restfulpy.mule import MuleTask, worker
+
+from .helpers import LocalApplicationTestCase, chat_mockup_server
+from dolphin.importer import IssueImporter
+from dolphin.models import Issue, Project, Member, Workflow, Group, \
+    Release, Tag, IssueTag, RelatedIssue, Organization, RoomProvisioningJob
+
+
+class TestIssueImport(LocalApplicationTestCase):
+
+    @classmethod
+    @AuditLogContext(dict())
+    def mockup(cls):
+        session = cls.create_session()
+
+        cls.member = Member(
+            title='First Member',
+            email='member1@example.com',
+            access_token='access token 1',
+            phone=123456789,
+            reference_id=1,
+        )
+        session.add(cls.member)
+
+        organization = Organization(title='organization-title')
+        session.add(organization)
+        session.flush()
+
+        workflow = Workflow(title='Default')
+        group = Group(title='default')
+
+        release = Release(
+            title='My first release',
+            description='A decription for my first release',
+            cutoff='2030-2-20',
+            launch_date='2030-2-20',
+            manager=cls.member,
+            room_id=0,
+            group=group,
+        )
+
+        cls.project = Project(
+            release=release,
+            workflow=workflow,
+            group=group,
+            manager=cls.member,
+            title='My first project',
+            description='A decription for my project',
+            room_id=1,
+        )
+        session.add(cls.project)
+
+        cls.tag = Tag(title='tag 1', organization_id=organization.id)
+        session.add(cls.tag)
+        session.commit()
+
+    def test_import(self):
+        session = self.create_session()
+        member = session.query(Member).get(self.member.id)
+
+        lines = [
+            f'{{"title": "First", "projectId": {self.project.id}, '
+            f'"days": 1, "tagIds": [{self.tag.id}]}}',
+            '',
+            'not json',
+            f'{{"title": "Second", "projectId": 0, "days": 1}}',
+            f'{{"title": "Third", "projectId": {self.project.id}, '
+            f'"days": 2, "kind": "bug"}}',
+        ]
+        importer = IssueImporter(member, batch_size=1)
+        issue_ids = importer.import_(
+            importer.read_ndjson(io.StringIO('\n'.join(lines)))
+        )
+        assert len(issue_ids) == 1
+        assert importer.errors == [
+            (3, 'Malformed row'),
+            (4, 'Project not found'),
+            (5, 'Bug must have related issues'),
+        ]
+
+        csv = io.StringIO(
+            'title,projectId,days,kind,relatedIssueIds\n'
+            f'Fourth,{self.project.id},3,bug,{issue_ids[0]}\n'
+        )
+        importer = IssueImporter(member)
+        issue_ids.extend(importer.import_(importer.read_csv(csv)))
+        assert importer.errors == []
+
+        session = self.create_session()
+        issues = session.query(Issue) \
+            .filter(Issue.id.in_(issue_ids)) \
+            .order_by(Issue.id) \
+            .all()
+        assert [i.title for i in issues] == ['First', 'Fourth']
+        assert all(i.room_id is None for i in issues)
+        assert issues[0].created_by_member_id == self.member.id
+        assert session.query(IssueTag) \
+            .filter(IssueTag.issue_id == issues[0].id) \
+            .count() == 1
+        assert session.query(RelatedIssue) \
+            .filter(RelatedIssue.issue_id.in_(issue_ids)) \
+            .count() == 2
+        assert session.query(RoomProvisioningJob).count() == 2
+
+        with chat_mockup_server():
+            tasks = worker(
+                tries=0,
+                filters=MuleTask.type == 'room_provisioning_job',
+            )
+            assert len(tasks) == 2
+            assert all(status == 'success' for _, status in tasks)
+
+        session = self.create_session()
+        assert session.query(Issue) \
+            .filter(Issue.id.in_(issue_ids)) \
+            .filter(Issue.room_id.is_(None)) \
+            .count() == 0
+
+    def test_invalid_rows(self):
+        session = self.create_session()
+        member = session.query(Member).get(self.member.id)
+
+        def row(title, days=1, **kw):
+            return json.dumps(
+                dict(title=title, projectId=self.project.id, days=days, **kw)
+            )
+
+        lines = [
+            row('a' * 129),
+            row(' Padded'),
+            row('Described', description='a' * 8193),
+            row('Negative', days=-1),
+            row('Repeated'),
+            row('Repeated'),
+        ]
+        importer = IssueImporter(member)
+        issue_ids = importer.import_(
+            importer.read_ndjson(io.StringIO('\n'.join(lines)))
+        )
+        assert len(issue_ids) == 1
+        assert importer.errors == [
+            (1, 'At most 128 characters are valid for title'),
+            (2, 'Invalid title format'),
+            (3, 'At most 8192 characters are valid for description'),
+            (4, 'Invalid days: -1'),
+            (6, 'Repetitive title'),
+        ]
+
+        # Against the existing issues of the project
+        importer = IssueImporter(member)
+        assert importer.import_(
+            importer.read_ndjson(io.StringIO(row('Repeated')))
+        ) == []
+        assert importer.errors == [(1, 'Repetitive title')]
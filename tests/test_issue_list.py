@@ -548,6 +548,55 @@ class TestIssue(LocalApplicationTestCase):
             )
             assert len(response.json) == 3
 
+            when(
+                'Cursor pagination sorted by title',
+                query=dict(sort='title', take=3, cursor='')
+            )
+            assert status == 200
+            assert len(response.json) == 3
+            assert response.json[0]['title'] == self.issue1.title
+            assert response.json[2]['title'] == self.issue2.title
+            assert 'X-Pagination-Count' not in response.headers
+            next_cursor = response.headers['X-Pagination-Next']
+
+            when(
+                'The next page of cursor pagination',
+                query=dict(sort='title', take=3, cursor=next_cursor)
+            )
+            assert status == 200
+            assert len(response.json) == 1
+            assert response.json[0]['title'] == self.issue3.title
+            assert 'X-Pagination-Next' not in response.headers
+
+            when(
+                'Cursor pagination by a key which is not whitelisted',
+                query=dict(sort='responseTime', cursor='')
+            )
+            assert status == '938 Invalid Sort Key For Cursor Pagination'
+
+            when(
+                'Cursor pagination by a malformed cursor',
+                query=dict(cursor='malformed')
+            )
+            assert status == '937 Malformed Cursor'
+
+            when(
+                'Sparse fieldset',
+                query=dict(sort='title', fields='id,title,status,items')
+            )
+            assert status == 200
+            assert len(response.json) == 4
+            assert set(response.json[0].keys()) == \
+                {'id', 'title', 'status', 'items'}
+            assert response.json[0]['title'] == self.issue1.title
+            assert response.json[0]['status'] is not None
+
+            when(
+                'Sparse fieldset with an invalid field',
+                query=dict(fields='id,relations')
+            )
+            assert status == '939 Invalid Field In Fieldset'
+
             when('Request is not authorized', authorization=None)
             assert status == 401
 
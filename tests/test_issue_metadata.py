@@ -1,4 +1,4 @@
-from bddrest.authoring import status, response
+from bddrest.authoring import status, response, when
 
 from .helpers import LocalApplicationTestCase
 
@@ -176,3 +176,24 @@ class TestIssue(LocalApplicationTestCase):
             assert fields['batch']['example'] is not None
             assert fields['batch']['watermark'] is not None
 
+    def test_cached_metadata(self):
+        with self.given(
+            'Test metadata verb',
+            '/apiv1/issues',
+            'METADATA'
+        ):
+            assert status == 200
+            etag = response.headers['ETag']
+            assert not etag.startswith('W/')
+
+            when('The client\'s copy is still valid', headers={
+                'If-None-Match': etag
+            })
+            assert status == 304
+            assert response.headers['ETag'] == etag
+
+            when('The tag does not match', headers={
+                'If-None-Match': '"stale"'
+            })
+            assert status == 200
+            assert response.headers['ETag'] == etag
@@ -4,6 +4,7 @@ from auditor.context import Context as AuditLogContext
 from nanohttp import context
 from nanohttp.contexts import Context
 from restfulpy.testing import db
+from sqlalchemy import event
 from sqlalchemy.orm import aliased
 
 from dolphin.models import Item, Project, Member, Workflow, Group, Release,  \
@@ -959,3 +960,110 @@ def test_issue_boarding(db):
 
             assert issue1.boarding == 'delayed'
 
+
+def test_issue_dump_query(db):
+    session = db()
+    session.expire_on_commit = True
+
+    with AuditLogContext(dict()):
+        member = Member(
+            title='First Member',
+            email='member1@example.com',
+            access_token='access token 1',
+            phone=123456789,
+            reference_id=2,
+        )
+        session.add(member)
+        session.commit()
+
+        workflow = Workflow(title='Default')
+        skill = Skill(title='First Skill')
+        specialty = Specialty(
+            title='First Specialty',
+            skill=skill,
+        )
+        group = Group(title='default')
+
+        release = Release(
+            title='My first release',
+            description='A decription for my first release',
+            cutoff='2030-2-20',
+            launch_date='2030-2-20',
+            manager=member,
+            room_id=0,
+            group=group,
+        )
+
+        project = Project(
+            release=release,
+            workflow=workflow,
+            group=group,
+            manager=member,
+            title='My first project',
+            description='A decription for my project',
+            room_id=1,
+        )
+
+        phase = Phase(
+            title='Development',
+            order=1,
+            workflow=workflow,
+            specialty=specialty,
+        )
+        session.add(phase)
+
+        with Context(dict()):
+            context.identity = member
+
+            issues = []
+            for i in range(6):
+                issue = Issue(
+                    project=project,
+                    title=f'Issue {i}',
+                    description='This is description of an issue',
+                    kind='feature',
+                    days=1,
+                    room_id=i + 2,
+                )
+                session.add(issue)
+                issues.append(issue)
+            session.flush()
+
+            for issue in issues:
+                issue_phase = IssuePhase(issue=issue, phase=phase)
+                session.add(Item(issue_phase=issue_phase, member=member))
+
+            issues[0].relations.append(issues[1])
+            issues[2].relations.append(issues[3])
+            session.commit()
+
+            statements = []
+            def count_statement(*args):
+                statements.append(args)
+
+            engine = session.get_bind()
+            event.listen(engine, 'before_cursor_execute', count_statement)
+            try:
+                issues_list = Issue.dump_query(
+                    session.query(Issue) \
+                        .filter(Issue.id.in_([issues[0].id, issues[1].id])) \
+                        .order_by(Issue.id)
+                )
+                two_issues_statements = len(statements)
+
+                statements.clear()
+                session.expire_all()
+                issues_list = Issue.dump_query(
+                    session.query(Issue).order_by(Issue.id)
+                )
+                all_issues_statements = len(statements)
+
+            finally:
+                event.remove(engine, 'before_cursor_execute', count_statement)
+
+            assert two_issues_statements == all_issues_statements
+            assert len(issues_list) == 6
+            assert len(issues_list[0]['items']) == 1
+            assert issues_list[0]['items'][0]['phaseId'] == phase.id
+            assert issues_list[0]['relations'][0]['id'] == issues[1].id
+            assert issues_list[0]['project']['id'] == project.id
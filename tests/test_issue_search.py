@@ -115,6 +115,21 @@ class TestIssue(LocalApplicationTestCase):
             assert len(response.json) == 1
             assert response.json[0]['title'] == self.issue1.title
 
+            when(
+                'Search for a issue by its id',
+                form=given | dict(query=str(self.issue2.id))
+            )
+            assert status == 200
+            assert len(response.json) == 1
+            assert response.json[0]['id'] == self.issue2.id
+
+            when(
+                'Search for a issue by a word of its description',
+                form=given | dict(query='descr thi')
+            )
+            assert status == 200
+            assert len(response.json) == 4
+
             when('Search without query parameter', form=given - 'query')
             assert status == '912 Query Parameter Not In Form Or Query String'
 
@@ -189,3 +204,11 @@ class TestIssue(LocalApplicationTestCase):
             when('An unauthorized search', authorization=None)
             assert status == 401
 
+
+class TestIssueInProcessSearch(TestIssue):
+    """The same searches by the fallback engine."""
+
+    __configuration__ = LocalApplicationTestCase.__configuration__ + '''
+            search:
+              engine: inprocess
+        '''
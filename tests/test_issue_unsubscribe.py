@@ -6,7 +6,7 @@ from nanohttp.contexts import Context
 from .helpers import LocalApplicationTestCase, \
     oauth_mockup_server, chat_mockup_server, chat_server_status
 from dolphin.models import Issue, Project, Member, Subscription, Workflow, \
-    Group, Release
+    Group, Release, ChatMembershipJob
 
 
 class TestIssue(LocalApplicationTestCase):
@@ -106,6 +106,11 @@ class TestIssue(LocalApplicationTestCase):
             assert status == 200
             assert response.json['id'] == self.issue1.id
 
+            session = self.create_session()
+            assert session.query(ChatMembershipJob) \
+                .filter(ChatMembershipJob.subscribable_id == self.issue1.id) \
+                .count() == 1
+
             when(
                 'Intended issue with string type not found',
                 url_parameters=dict(id='Alphabetical'),
@@ -133,31 +138,9 @@ class TestIssue(LocalApplicationTestCase):
             when('Request is not authorized',authorization=None)
             assert status == 401
 
-            with chat_server_status('404 Not Found'):
-                when(
-                    'Chat server is not found',
-                    url_parameters=dict(id=4)
-                )
-                assert status == '617 Chat Server Not Found'
-
             with chat_server_status('503 Service Not Available'):
                 when(
                     'Chat server is not available',
                     url_parameters=dict(id=4)
                 )
-                assert status == '800 Chat Server Not Available'
-
-            with chat_server_status('500 Internal Service Error'):
-                when(
-                    'Chat server faces with internal error',
-                    url_parameters=dict(id=4)
-                )
-                assert status == '801 Chat Server Internal Error'
-
-            with chat_server_status('611 Room Member Not Found'):
-                when(
-                    'Room member not found',
-                    url_parameters=dict(id=4)
-                )
                 assert status == 200
-
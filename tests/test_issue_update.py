@@ -4,12 +4,14 @@ from auditor.logentry import ChangeAttributeLogEntry
 from bddrest import status, when, given, response, Update
 from nanohttp import context
 from nanohttp.contexts import Context
+from restfulpy.mule import MuleTask, worker
 
 from .helpers import LocalApplicationTestCase, \
     oauth_mockup_server, chat_mockup_server
 from dolphin import Dolphin
 from dolphin.middleware_callback import callback as auditor_callback
-from dolphin.models import Issue, Project, Member, Workflow, Group, Release
+from dolphin.models import Issue, Project, Member, Workflow, Group, \
+    Release, ChatMessageJob
 
 
 def callback(audit_logs):
@@ -125,6 +127,18 @@ class TestIssue(LocalApplicationTestCase):
                     assert log.old_value == old_values[log.attribute_key]
                     assert log.new_value == form[log.attribute_key]
 
+            job = self.create_session().query(ChatMessageJob) \
+                .filter(ChatMessageJob.room_id == self.issue2.room_id) \
+                .one()
+            assert job.status == 'new'
+            assert len(job.messages) == len(logs) - 1
+
+            tasks = worker(
+                tries=0,
+                filters=MuleTask.type == 'chat_message_job',
+            )
+            assert tasks == [(job.id, 'success')]
+
             when(
                 'Intended issue with string type not found',
                 url_parameters=dict(id='Alphabetical'),
@@ -0,0 +1,184 @@
+from datetime import datetime
+
+from auditor.context import Context as AuditLogContext
+from nanohttp import context
+from nanohttp.contexts import Context
+from restfulpy.testing import db
+
+from dolphin.models import Item, Project, Member, Workflow, Group, Release, \
+    Specialty, Phase, Issue, Dailyreport, IssuePhase, IssueRollup, Skill
+
+
+def test_issue_rollup(db):
+    with AuditLogContext(dict()):
+        session = db()
+        session.expire_on_commit = True
+
+        member = Member(
+            title='First Member',
+            email='member1@example.com',
+            access_token='access token 1',
+            reference_id=2,
+        )
+        session.add(member)
+        session.commit()
+
+        workflow = Workflow(title='Default')
+        skill = Skill(title='First Skill')
+        specialty = Specialty(
+            title='First Specialty',
+            skill=skill,
+        )
+        group = Group(title='default')
+
+        release = Release(
+            title='My first release',
+            description='A decription for my first release',
+            cutoff='2030-2-20',
+            launch_date='2030-2-20',
+            manager=member,
+            room_id=0,
+            group=group,
+        )
+
+        project = Project(
+            release=release,
+            workflow=workflow,
+            group=group,
+            manager=member,
+            title='My first project',
+            description='A decription for my project',
+            room_id=1,
+        )
+
+        with Context(dict()):
+            context.identity = member
+
+            issue = Issue(
+                project=project,
+                title='First issue',
+                description='This is description of first issue',
+                kind='feature',
+                days=1,
+                room_id=2,
+            )
+            session.add(issue)
+
+            phase1 = Phase(
+                title='Design',
+                order=1,
+                workflow=workflow,
+                specialty=specialty,
+            )
+            session.add(phase1)
+
+            phase2 = Phase(
+                title='Development',
+                order=2,
+                workflow=workflow,
+                specialty=specialty,
+            )
+            session.add(phase2)
+            session.commit()
+
+            assert session.query(IssueRollup).get(issue.id) is None
+            assert issue.status == 'to-do'
+            assert issue.due_date is None
+
+            issue_phase1 = IssuePhase(
+                issue_id=issue.id,
+                phase_id=phase1.id,
+            )
+            session.add(issue_phase1)
+            session.flush()
+
+            item1 = Item(
+                issue_phase_id=issue_phase1.id,
+                member_id=member.id,
+            )
+            session.add(item1)
+            session.commit()
+
+            rollup = session.query(IssueRollup).get(issue.id)
+            assert rollup.due_date is None
+            assert rollup.phase_id is None
+            assert rollup.need_estimated_phase_id == phase1.id
+            assert rollup.status == 'to-do'
+            assert issue._need_estimated_phase_id == phase1.id
+
+            item1.start_date = datetime.strptime('2020-1-1', '%Y-%m-%d')
+            item1.end_date = datetime.strptime('2020-1-3', '%Y-%m-%d')
+            item1.estimated_hours = 3
+            session.commit()
+
+            assert issue.due_date == item1.end_date
+            assert issue.phase_id == phase1.id
+            assert issue._need_estimated_phase_id is None
+            assert issue.status == 'to-do'
+
+            dailyreport = Dailyreport(
+                date=datetime.strptime('2020-1-1', '%Y-%m-%d').date(),
+                hours=1,
+                note='The note for a daily report',
+                item=item1,
+            )
+            session.add(dailyreport)
+            session.commit()
+
+            assert issue.status == 'in-progress'
+
+            dailyreport.hours = 3
+            session.commit()
+
+            assert issue.status == 'complete'
+
+            item1.is_done = True
+            session.commit()
+
+            assert issue.is_done is True
+            assert issue.status == 'done'
+
+            session.delete(item1)
+            session.commit()
+
+            rollup = session.query(IssueRollup).get(issue.id)
+            assert rollup.due_date is None
+            assert rollup.is_done is None
+            assert issue.due_date is None
+
+            issue2 = Issue(
+                project=project,
+                title='Second issue',
+                description='This is description of second issue',
+                kind='feature',
+                days=1,
+                room_id=3,
+            )
+            session.add(issue2)
+            session.flush()
+
+            issue_phase2 = IssuePhase(
+                issue_id=issue2.id,
+                phase_id=phase1.id,
+            )
+            session.add(issue_phase2)
+
+            item2 = Item(
+                issue_phase_id=issue_phase1.id,
+                member_id=member.id,
+                start_date=datetime.strptime('2020-2-1', '%Y-%m-%d'),
+                end_date=datetime.strptime('2020-2-3', '%Y-%m-%d'),
+                estimated_hours=3,
+            )
+            session.add(item2)
+            session.commit()
+
+            assert issue.due_date == item2.end_date
+            assert issue2.due_date is None
+
+            # Both of the issues are refreshed when the item is moved
+            item2.issue_phase_id = issue_phase2.id
+            session.commit()
+
+            assert issue.due_date is None
+            assert issue2.due_date == item2.end_date
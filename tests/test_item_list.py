@@ -589,6 +589,39 @@ class TestListGroup(LocalApplicationTestCase):
             )
             assert len(response.json) == 8
 
+            when(
+                'Embedding a compact issue',
+                query=dict(sort='id', issueFields='id, title,status,items')
+            )
+            assert status == 200
+            assert len(response.json) == 8
+            issue = response.json[0]['issue']
+            assert set(issue.keys()) == {'id', 'title', 'status', 'items'}
+            assert issue['status'] is not None
+            assert response.json[0]['id'] == self.item1.id
+            assert response.json[0]['perspective'] is not None
+
+            when(
+                'Embedding a compact issue with an invalid field',
+                query=dict(issueFields='id,project')
+            )
+            assert status == '939 Invalid Field In Fieldset'
+
+            when(
+                'Sparse fieldset with a compact issue',
+                query=dict(
+                    sort='id',
+                    fields='id,perspective,mojo,issue',
+                    issueFields='id,title',
+                )
+            )
+            assert status == 200
+            assert len(response.json) == 8
+            assert set(response.json[0].keys()) == \
+                {'id', 'perspective', 'mojo', 'issue'}
+            assert set(response.json[0]['issue'].keys()) == {'id', 'title'}
+            assert response.json[0]['perspective'] is not None
+
             when('Request is not authorized', authorization=None)
             assert status == 401
 
@@ -0,0 +1,183 @@
+from datetime import datetime, timedelta
+
+from auditor.context import Context as AuditLogContext
+from nanohttp import context
+from nanohttp.contexts import Context
+from restfulpy.testing import db
+
+from dolphin.models import Item, Project, Member, Workflow, Group, Release, \
+    Specialty, Phase, Issue, Dailyreport, IssuePhase, ItemRollup, Skill
+
+
+def assert_metrics(session, item):
+    expressions = session.query(
+        Item.hours_worked,
+        Item.status,
+        Item.perspective,
+        Item.mojo_remaining_hours,
+        Item.mojo_progress,
+        Item._days_left_to_estimate,
+        Item.mojo_boarding,
+    ) \
+        .filter(Item.id == item.id) \
+        .one()
+
+    assert (
+        item.hours_worked,
+        item.status,
+        item.perspective,
+        item.mojo_remaining_hours,
+        item.mojo_progress,
+        item._days_left_to_estimate,
+        item.mojo_boarding,
+    ) == tuple(expressions)
+
+
+def test_item_rollup(db):
+    with AuditLogContext(dict()):
+        session = db()
+        session.expire_on_commit = True
+
+        member = Member(
+            title='First Member',
+            email='member1@example.com',
+            access_token='access token 1',
+            reference_id=2,
+        )
+        session.add(member)
+        session.commit()
+
+        workflow = Workflow(title='Default')
+        skill = Skill(title='First Skill')
+        specialty = Specialty(
+            title='First Specialty',
+            skill=skill,
+        )
+        group = Group(title='default')
+
+        release = Release(
+            title='My first release',
+            description='A decription for my first release',
+            cutoff='2030-2-20',
+            launch_date='2030-2-20',
+            manager=member,
+            room_id=0,
+            group=group,
+        )
+
+        project = Project(
+            release=release,
+            workflow=workflow,
+            group=group,
+            manager=member,
+            title='My first project',
+            description='A decription for my project',
+            room_id=1,
+        )
+
+        with Context(dict()):
+            context.identity = member
+
+            issue = Issue(
+                project=project,
+                title='First issue',
+                description='This is description of first issue',
+                kind='feature',
+                days=1,
+                room_id=2,
+            )
+            session.add(issue)
+
+            phase = Phase(
+                title='Design',
+                order=1,
+                workflow=workflow,
+                specialty=specialty,
+            )
+            session.add(phase)
+            session.flush()
+
+            issue_phase = IssuePhase(
+                issue_id=issue.id,
+                phase_id=phase.id,
+            )
+            session.add(issue_phase)
+            session.flush()
+
+            today = datetime.now().replace(
+                hour=0,
+                minute=0,
+                second=0,
+                microsecond=0
+            )
+            item = Item(
+                issue_phase_id=issue_phase.id,
+                member_id=member.id,
+                start_date=today - timedelta(days=3),
+                end_date=today + timedelta(days=3),
+                estimated_hours=10,
+            )
+            session.add(item)
+            session.commit()
+
+            assert session.query(ItemRollup).get(item.id) is None
+            assert item.hours_worked is None
+            assert item.status == 'to-do'
+            assert item.perspective == 'overdue'
+            assert_metrics(session, item)
+
+            dailyreport1 = Dailyreport(
+                date=(today - timedelta(days=3)).date(),
+                hours=2,
+                note='The note for a daily report',
+                item=item,
+            )
+            session.add(dailyreport1)
+            session.commit()
+
+            rollup = session.query(ItemRollup).get(item.id)
+            assert rollup.hours == 2
+            assert rollup.reports == 1
+            assert rollup.last_report_date == dailyreport1.date
+            assert rollup.report_dates == [dailyreport1.date]
+            assert item.status == 'in-progress'
+            assert item.mojo_remaining_hours == 8
+            assert item.mojo_progress == 20
+            assert item._days_left_to_estimate == 6
+            assert item.perspective == 'overdue'
+            assert_metrics(session, item)
+
+            for days in (2, 1):
+                session.add(Dailyreport(
+                    date=(today - timedelta(days=days)).date(),
+                    hours=1,
+                    note='The note for a daily report',
+                    item=item,
+                ))
+            session.commit()
+
+            assert item.hours_worked == 4
+            assert item.perspective == 'due'
+            assert item.mojo_boarding == 'delayed'
+            assert_metrics(session, item)
+
+            dailyreport4 = Dailyreport(
+                date=today.date(),
+                hours=1,
+                note='The note for a daily report',
+                item=item,
+            )
+            session.add(dailyreport4)
+            session.commit()
+
+            assert item.perspective == 'submitted'
+            assert_metrics(session, item)
+
+            dailyreport4.hours = 6
+            session.commit()
+
+            assert session.query(ItemRollup).get(item.id).hours == 10
+            assert item.status == 'complete'
+            assert item.mojo_boarding == 'on-time'
+            assert_metrics(session, item)
+
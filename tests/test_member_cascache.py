@@ -0,0 +1,46 @@
+from restfulpy.orm import DBSession
+
+from .helpers import LocalApplicationTestCase, oauth_mockup_server
+from dolphin.authentication import Authenticator
+from dolphin.models import Member
+
+
+class TestCASMemberCache(LocalApplicationTestCase):
+
+    @classmethod
+    def mockup(cls):
+        session = cls.create_session()
+        cls.member = Member(
+            title='member1',
+            email='member1@example.com',
+            access_token='access token 1',
+            avatar='avatar1',
+            first_name='first name',
+            last_name='last name',
+            phone=123456789,
+            reference_id=1
+        )
+        session.add(cls.member)
+        session.commit()
+
+    def test_cas_member_cache(self):
+        authenticator = Authenticator()
+        authenticator.redis.delete(
+            authenticator.get_cas_member_key('access token 1')
+        )
+
+        with oauth_mockup_server():
+            cas_member = authenticator.get_cas_member('access token 1')
+            assert cas_member['title'] == 'member1'
+
+        # The CAS server is down, so the profile must come from the cache
+        assert authenticator.get_cas_member('access token 1') == cas_member
+
+        member = DBSession.query(Member).get(self.member.id)
+        authenticator.update_member_if_needed(member, cas_member)
+        assert member not in DBSession.dirty
+
+        cas_member['title'] = 'new title'
+        authenticator.update_member_if_needed(member, cas_member)
+        assert DBSession.query(Member).get(self.member.id).title == \
+            'new title'
@@ -0,0 +1,45 @@
+from nanohttp import context
+from nanohttp.contexts import Context
+from restfulpy.orm import DBSession
+from restfulpy.testing import db
+from sqlalchemy import event
+
+from dolphin.models import Member
+
+
+def test_member_current(db):
+    session = db()
+    member = Member(
+        title='First Member',
+        email='member1@example.com',
+        access_token='access token 1',
+        reference_id=1,
+    )
+    session.add(member)
+    session.commit()
+
+    statements = []
+
+    def count(connection, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = DBSession.get_bind()
+    event.listen(engine, 'before_cursor_execute', count)
+    try:
+        with Context(dict()):
+            context.identity = member
+            current_member = Member.current()
+            assert current_member.id == member.id
+            assert len(statements) == 1
+
+            # The member is resolved once per request
+            assert Member.current() is current_member
+            assert len(statements) == 1
+
+        with Context(dict()):
+            context.identity = member
+            assert Member.current().id == member.id
+            assert len(statements) == 2
+
+    finally:
+        event.remove(engine, 'before_cursor_execute', count)
@@ -229,6 +229,15 @@ class TestListPhaseSummary(LocalApplicationTestCase):
             assert response.json[0]['estimatedHours'] == \
                 self.item3.estimated_hours + self.item4.estimated_hours
 
+            when(
+                'The same phase of another issue',
+                url_parameters=dict(issue_id=self.issue2.id),
+                query=dict(id=self.phase2.id)
+            )
+            assert len(response.json) == 1
+            assert response.json[0]['id'] == self.phase2.id
+            assert response.json[0]['estimatedHours'] == None
+
             when(
                 'Filtering by the phase which member has not worked on it',
                 query=dict(id=self.phase3.id)
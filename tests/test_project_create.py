@@ -7,7 +7,8 @@ from .helpers import LocalApplicationTestCase, \
     oauth_mockup_server, chat_mockup_server, chat_server_status
 from dolphin import Dolphin
 from dolphin.middleware_callback import callback as auditor_callback
-from dolphin.models import Project, Member, Workflow, Release, Group
+from dolphin.models import Project, Member, Workflow, Release, Group, \
+    RoomProvisioningJob
 
 
 def callback(audit_logs):
@@ -90,6 +91,11 @@ class TestProject(LocalApplicationTestCase):
             created_project_id = response.json['id']
             created_project = session.query(Project).get(created_project_id)
             assert created_project.modified_by is None
+            assert response.json['roomId'] is None
+
+            job = session.query(RoomProvisioningJob).one()
+            assert job.subscribable_ids == [created_project_id]
+            assert job.member_id == self.member.id
 
             assert len(logs) == 2
             assert isinstance(logs[0], InstantiationLogEntry)
@@ -214,38 +220,10 @@ class TestProject(LocalApplicationTestCase):
             when('Request is not authorized', authorization=None)
             assert status == 401
 
-            with chat_server_status('404 Not Found'):
-                when(
-                    'Chat server is not found',
-                    json=given | dict(title='Another title')
-                )
-                assert status == '617 Chat Server Not Found'
-
             with chat_server_status('503 Service Not Available'):
                 when(
                     'Chat server is not available',
                     json=given | dict(title='Another title')
                 )
-                assert status == '800 Chat Server Not Available'
-
-            with chat_server_status('500 Internal Service Error'):
-                when(
-                    'Chat server faces with internal error',
-                    json=given | dict(title='Another title')
-                )
-                assert status == '801 Chat Server Internal Error'
-
-            with chat_server_status('615 Room Already Exists'):
-                when(
-                    'Chat server faces with internal error',
-                    json=given | dict(title='Another title')
-                )
-                assert status == 200
-
-            with chat_server_status('604 Already Added To Target'):
-                when(
-                    'Chat server faces with internal error',
-                    json=given | dict(title='Awesome project')
-                )
                 assert status == 200
 
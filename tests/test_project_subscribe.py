@@ -2,9 +2,9 @@ from auditor.context import Context as AuditLogContext
 from bddrest import status, response, when
 
 from .helpers import LocalApplicationTestCase, \
-    oauth_mockup_server, chat_mockup_server, chat_server_status, \
-    room_mockup_server
-from dolphin.models import Project, Member, Group, Workflow, Release
+    oauth_mockup_server, chat_mockup_server, chat_server_status
+from dolphin.models import Project, Member, Group, Workflow, Release, \
+    ChatMembershipJob
 
 
 class TestProject(LocalApplicationTestCase):
@@ -69,6 +69,11 @@ class TestProject(LocalApplicationTestCase):
         ):
             assert status == 200
             assert response.json['id'] == self.project1.id
+
+            session = self.create_session()
+            assert session.query(ChatMembershipJob) \
+                .filter(ChatMembershipJob.subscribable_id == self.project1.id) \
+                .count() == 1
             assert response.json['isSubscribed'] == True
 
             when(
@@ -98,31 +103,9 @@ class TestProject(LocalApplicationTestCase):
             when('Request is not authorized', authorization=None)
             assert status == 401
 
-            with chat_server_status('404 Not Found'):
-                when(
-                    'Chat server is not found',
-                    url_parameters=dict(id=3)
-                )
-                assert status == '617 Chat Server Not Found'
-
             with chat_server_status('503 Service Not Available'):
                 when(
                     'Chat server is not available',
                     url_parameters=dict(id=3)
                 )
-                assert status == '800 Chat Server Not Available'
-
-            with chat_server_status('500 Internal Service Error'):
-                when(
-                    'Chat server faces with internal error',
-                    url_parameters=dict(id=3)
-                )
-                assert status == '801 Chat Server Internal Error'
-
-            with room_mockup_server():
-                when(
-                    'Room member is already added to room',
-                    url_parameters=dict(id=3)
-                )
                 assert status == 200
-
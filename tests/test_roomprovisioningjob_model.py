@@ -0,0 +1,136 @@
+from datetime import datetime
+
+from auditor.context import Context as AuditLogContext
+from nanohttp import settings
+from restfulpy.mule import MuleTask, worker
+
+from .helpers import LocalApplicationTestCase, chat_mockup_server, \
+    chat_server_status
+from dolphin.models import Project, Member, Workflow, Group, Release, \
+    RoomProvisioningJob
+
+
+class TestRoomProvisioningJob(LocalApplicationTestCase):
+
+    @classmethod
+    @AuditLogContext(dict())
+    def mockup(cls):
+        session = cls.create_session()
+
+        cls.member = Member(
+            title='First Member',
+            email='member1@example.com',
+            access_token='access token 1',
+            phone=123456789,
+            reference_id=1,
+        )
+        session.add(cls.member)
+
+        workflow = Workflow(title='Default')
+        group = Group(title='default')
+
+        release = Release(
+            title='My first release',
+            description='A decription for my first release',
+            cutoff='2030-2-20',
+            launch_date='2030-2-20',
+            manager=cls.member,
+            room_id=0,
+            group=group,
+        )
+
+        cls.projects = [
+            Project(
+                release=release,
+                workflow=workflow,
+                group=group,
+                manager=cls.member,
+                title=f'Project {i}',
+            )
+            for i in range(3)
+        ]
+        session.add_all(cls.projects)
+        session.flush()
+
+        RoomProvisioningJob.enqueue(
+            session,
+            cls.member.id,
+            [p.id for p in cls.projects]
+        )
+        session.commit()
+
+    def run_jobs(self):
+        # Makes the delayed retries due
+        session = self.create_session()
+        session.query(MuleTask) \
+            .filter(MuleTask.type == 'room_provisioning_job') \
+            .filter(MuleTask.status == 'new') \
+            .update(dict(at=datetime.now()), synchronize_session=False)
+        session.commit()
+
+        return worker(
+            tries=0,
+            filters=MuleTask.type == 'room_provisioning_job',
+        )
+
+    def get_pending_jobs(self):
+        session = self.create_session()
+        return session.query(RoomProvisioningJob) \
+            .filter(RoomProvisioningJob.status == 'new') \
+            .order_by(RoomProvisioningJob.id) \
+            .all()
+
+    def test_backoff(self):
+        settings.merge('''
+          room_provisioning:
+            backoff_base: 10
+            backoff_max: 60
+        ''')
+        assert 5 <= RoomProvisioningJob.get_backoff(1) <= 10
+        assert 20 <= RoomProvisioningJob.get_backoff(3) <= 40
+        assert 30 <= RoomProvisioningJob.get_backoff(10) <= 60
+
+    def test_do(self):
+        settings.merge('''
+          room_provisioning:
+            concurrency: 1
+            max_attempts: 2
+            failure_threshold: 2
+          chat:
+            http:
+              circuit_breaker:
+                failure_threshold: 100
+        ''')
+        project_ids = [p.id for p in self.projects]
+
+        with chat_mockup_server():
+            with chat_server_status('503 Service Not Available'):
+                tasks = self.run_jobs()
+                assert [status for _, status in tasks] == ['success']
+
+                # The circuit is opened after the second failure, so the
+                # third room is left to the next attempt.
+                failed, skipped = self.get_pending_jobs()
+                assert failed.subscribable_ids == project_ids[:2]
+                assert failed.attempt == 1
+                assert failed.at > datetime.now()
+                assert skipped.subscribable_ids == project_ids[2:]
+                assert skipped.attempt == 0
+
+                # The retry budget of the failed rooms is spent
+                self.run_jobs()
+                skipped, = self.get_pending_jobs()
+                assert skipped.subscribable_ids == project_ids[2:]
+                assert skipped.attempt == 1
+
+            tasks = self.run_jobs()
+            assert [status for _, status in tasks] == ['success']
+            assert self.get_pending_jobs() == []
+
+        session = self.create_session()
+        room_ids = [
+            room_id for room_id, in session.query(Project.room_id)
+            .filter(Project.id.in_(project_ids))
+            .order_by(Project.id)
+        ]
+        assert room_ids == [None, None, 1]
@@ -0,0 +1,58 @@
+from auditor import MiddleWare
+from bddrest import status, response, when
+
+from .helpers import LocalApplicationTestCase, oauth_mockup_server, callback
+from dolphin import Dolphin
+from dolphin.instrumentation import SQLInstrumentationMiddleWare, \
+    normalize_statement
+from dolphin.models import Member
+
+
+class TestSQLInstrumentation(LocalApplicationTestCase):
+    __application__ = SQLInstrumentationMiddleWare(MiddleWare(
+        Dolphin(),
+        callback
+    ))
+    __configuration__ = LocalApplicationTestCase.__configuration__ + '''
+            sql_instrumentation:
+              slow_query_threshold: 0
+        '''
+
+    @classmethod
+    def mockup(cls):
+        session = cls.create_session()
+        member = Member(
+            title='First Member',
+            email='member1@example.com',
+            access_token='access token 1',
+            phone=123456789,
+            reference_id=1
+        )
+        session.add(member)
+        session.commit()
+
+    def test_sql_instrumentation(self):
+        self.login('member1@example.com')
+
+        with oauth_mockup_server(), self.given(
+            'List issues',
+            '/apiv1/issues',
+            'LIST',
+        ):
+            assert status == 200
+            assert int(response.headers['X-SQL-Query-Count']) > 0
+            assert float(response.headers['X-SQL-Query-Time']) > 0
+
+            slow_query = self.__application__.slow_queries[-1]
+            assert slow_query['path'] == '/apiv1/issues'
+            assert '%(' not in slow_query['statement']
+
+            when('Request is not authorized', authorization=None)
+            assert status == 401
+            assert 'X-SQL-Query-Count' in response.headers
+
+    def test_normalize_statement(self):
+        assert normalize_statement(
+            'SELECT id FROM issue\n'
+            'WHERE id IN (%(id_1)s, %(id_2)s) AND title = %(title_1)s'
+        ) == 'SELECT id FROM issue WHERE id IN (...) AND title = ?'
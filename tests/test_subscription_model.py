@@ -0,0 +1,55 @@
+from datetime import datetime
+
+from restfulpy.orm import DBSession
+from restfulpy.testing import db
+
+from dolphin.models import Member, Subscribable, Subscription
+
+
+def test_subscription_see_unsee(db):
+    session = db()
+    subscribable = Subscribable(title='First subscribable')
+    session.add(subscribable)
+
+    members = []
+    for i in range(1, 4):
+        member = Member(
+            title=f'Member {i}',
+            email=f'member{i}@example.com',
+            access_token=f'access token {i}',
+            reference_id=i,
+        )
+        session.add(member)
+        members.append(member)
+
+    session.flush()
+    for member in members:
+        session.add(Subscription(
+            subscribable_id=subscribable.id,
+            member_id=member.id,
+            seen_at=datetime.utcnow() if member is not members[2] else None,
+        ))
+
+    session.commit()
+
+    member_ids = Subscription.unsee(
+        Subscription.subscribable_id == subscribable.id,
+        Subscription.member_id != members[0].id,
+    )
+    DBSession.commit()
+
+    # The subscriptions which are already unseen are not updated
+    assert member_ids == [members[1].id]
+    assert DBSession.query(Subscription) \
+        .filter(Subscription.seen_at.is_(None)) \
+        .count() == 2
+
+    member_ids = Subscription.see(
+        Subscription.subscribable_id == subscribable.id,
+    )
+    DBSession.commit()
+
+    assert sorted(member_ids) == sorted(m.id for m in members)
+    assert DBSession.query(Subscription) \
+        .filter(Subscription.seen_at.is_(None)) \
+        .count() == 0
@@ -0,0 +1,152 @@
+from auditor.context import Context as AuditLogContext
+from bddrest import status, when, response
+from nanohttp import context
+from nanohttp.contexts import Context
+
+from .helpers import LocalApplicationTestCase, oauth_mockup_server
+from dolphin.models import Issue, Project, Member, Workflow, Group, \
+    Subscription, Release
+
+
+class TestUnreadCounter(LocalApplicationTestCase):
+
+    @classmethod
+    @AuditLogContext(dict())
+    def mockup(cls):
+        session = cls.create_session()
+
+        cls.member1 = Member(
+            title='First Member',
+            email='member1@example.com',
+            access_token='access token 1',
+            phone=123456789,
+            reference_id=1
+        )
+        session.add(cls.member1)
+
+        member2 = Member(
+            title='Second Member',
+            email='member2@example.com',
+            access_token='access token 2',
+            phone=987654321,
+            reference_id=2
+        )
+        session.add(member2)
+        session.commit()
+
+        workflow = Workflow(title='Default')
+        group = Group(title='default')
+
+        release = Release(
+            title='My first release',
+            description='A decription for my first release',
+            cutoff='2030-2-20',
+            launch_date='2030-2-20',
+            manager=cls.member1,
+            room_id=0,
+            group=group,
+        )
+
+        cls.project = Project(
+            release=release,
+            workflow=workflow,
+            group=group,
+            manager=cls.member1,
+            title='My first project',
+            description='A decription for my project',
+            room_id=1
+        )
+        session.add(cls.project)
+
+        with Context(dict()):
+            context.identity = cls.member1
+
+            cls.issues = []
+            for i, kind in enumerate(('feature', 'feature', 'bug')):
+                issue = Issue(
+                    project=cls.project,
+                    title=f'Issue {i}',
+                    description='This is description of the issue',
+                    kind=kind,
+                    days=1,
+                    room_id=i + 2
+                )
+                session.add(issue)
+                cls.issues.append(issue)
+
+            session.flush()
+
+            for issue in cls.issues:
+                session.add(Subscription(
+                    subscribable_id=issue.id,
+                    member_id=cls.member1.id,
+                ))
+                session.add(Subscription(
+                    subscribable_id=issue.id,
+                    member_id=member2.id,
+                ))
+
+            session.commit()
+
+    def test_list(self):
+        self.login('member1@example.com')
+
+        with oauth_mockup_server(), self.given(
+            'List unread counters',
+            '/apiv1/unreadcounters',
+            'LIST',
+            query=dict(sort='kind'),
+        ):
+            assert status == 200
+            assert len(response.json) == 2
+            assert response.json[0]['projectId'] == self.project.id
+            assert response.json[0]['kind'] == 'feature'
+            assert response.json[0]['count'] == 2
+            assert response.json[1]['kind'] == 'bug'
+            assert response.json[1]['count'] == 1
+
+            when('Filter by kind', query=dict(kind='bug'))
+            assert len(response.json) == 1
+            assert response.json[0]['count'] == 1
+
+            when(
+                'Sending form',
+                form=dict(whyDidYouDoThat='IDK'),
+            )
+            assert status == '709 Form Not Allowed'
+
+            when('Request is not authorized', authorization=None)
+            assert status == 401
+
+        with oauth_mockup_server(), self.given(
+            'See an issue',
+            f'/apiv1/issues/id: {self.issues[0].id}',
+            'SEE',
+        ):
+            assert status == 200
+
+        with oauth_mockup_server(), self.given(
+            'The counters after seeing an issue',
+            '/apiv1/unreadcounters',
+            'LIST',
+            query=dict(sort='kind'),
+        ):
+            assert status == 200
+            assert response.json[0]['kind'] == 'feature'
+            assert response.json[0]['count'] == 1
+
+        with oauth_mockup_server(), self.given(
+            'Unsee an issue',
+            f'/apiv1/issues/id: {self.issues[0].id}',
+            'UNSEE',
+        ):
+            assert status == 200
+
+        with oauth_mockup_server(), self.given(
+            'The counters after unseeing an issue',
+            '/apiv1/unreadcounters',
+            'LIST',
+            query=dict(sort='kind'),
+        ):
+            assert status == 200
+            assert response.json[0]['count'] == 2
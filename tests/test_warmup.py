@@ -0,0 +1,9 @@
+from .helpers import LocalApplicationTestCase
+from dolphin.warmup import warm_up
+
+
+class TestWarmUp(LocalApplicationTestCase):
+
+    def test_warm_up(self):
+        # Outside of a request, the parameters of the identity are faked
+        assert warm_up(self._engine) == []
@@ -1,15 +1,33 @@
 import os
 
 from auditor import MiddleWare
+from nanohttp import settings
 
-from dolphin import dolphin as app
+from dolphin import dolphin as app, cooperative
+from dolphin.instrumentation import SQLInstrumentationMiddleWare
 from dolphin.middleware_callback import callback
+from dolphin.warmup import warm_up
 
 home_directory = os.environ['HOME']
-configuration_file_name=f'{home_directory}/.config/dolphin.yml'
+configuration_file_name = os.environ.get(
+    'DOLPHIN_CONFIGURATION',
+    f'{home_directory}/.config/dolphin.yml'
+)
 
 
 app.configure(filename=configuration_file_name)
-app.initialize_orm()
-app = MiddleWare(app, callback)
+
+# The gevent workers of `./gunicorn-gevent` are monkey patched before
+# loading this module
+if cooperative.is_cooperative():
+    cooperative.patch_psycopg()
+    app.initialize_orm(cooperative.create_engine())
+
+else:
+    app.initialize_orm()
+
+if settings.warm_up.enabled:
+    warm_up(app.engine)
+
+app = SQLInstrumentationMiddleWare(MiddleWare(app, callback))
 